@@ -132,65 +132,6 @@ _triage_mod = _native.triage
 _triage_analyze_native = _triage_mod.analyze_path
 
 
-class _StringsProxy:
-    __slots__ = ("_ss", "_path")
-
-    def __init__(self, native_ss, path: str):
-        self._ss = native_ss
-        self._path = path
-
-    def __getattr__(self, name):
-        if name == "ioc_counts":
-            base = dict(getattr(self._ss, "ioc_counts", {}) or {})
-            if base.get("ipv4", 0) == 0:
-                texts: list[str] = []
-                try:
-                    if getattr(self._ss, "strings", None):
-                        texts.extend(
-                            [
-                                getattr(s, "text", "")
-                                for s in self._ss.strings
-                                if getattr(s, "text", None)
-                            ]
-                        )
-                    if getattr(self._ss, "samples", None):
-                        texts.extend(
-                            [t for t in self._ss.samples if isinstance(t, str)]
-                        )
-                    if not texts and self._path:
-                        with open(
-                            self._path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            texts.append(f.read())
-                    import re
-
-                    ipv4_re = re.compile(
-                        r"\b(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)\b"
-                    )
-                    base["ipv4"] = sum(len(ipv4_re.findall(t)) for t in texts)
-                except Exception:
-                    pass
-            return base
-        return getattr(self._ss, name)
-
-
-class _ArtifactProxy:
-    __slots__ = ("_art",)
-
-    def __init__(self, art):
-        self._art = art
-
-    def __getattr__(self, name):
-        if name == "strings":
-            ss = getattr(self._art, "strings", None)
-            return (
-                _StringsProxy(ss, getattr(self._art, "path", ""))
-                if ss is not None
-                else None
-            )
-        return getattr(self._art, name)
-
-
 def _triage_wrapper(
     path: str,
     max_read_bytes: int = 10_485_760,
@@ -226,7 +167,7 @@ def _triage_wrapper(
         except ValueError:
             pass
     try:
-        art = _triage_analyze_native(
+        return _triage_analyze_native(
             path,
             max_read_bytes,
             max_file_size,
@@ -239,10 +180,8 @@ def _triage_wrapper(
             str_max_classify,
             str_max_ioc_per_string,
         )
-        return _ArtifactProxy(art)
     except TypeError:
-        art = _triage_analyze_native(path, max_read_bytes, max_file_size, max_depth)
-        return _ArtifactProxy(art)
+        return _triage_analyze_native(path, max_read_bytes, max_file_size, max_depth)
 
 
 # attach and re-export
@@ -716,7 +716,9 @@ class Instruction:
     size: int
     mnemonic: str
     operands: List[Operand]
+    op_str: str
     bytes: bytes
+    bytes_hex: str
     prefix: Optional[str]
     side_effects: int
 
@@ -916,8 +918,10 @@ class Function:
     local_vars_size: Optional[int]
     saved_regs_size: Optional[int]
     max_call_depth: Optional[int]
-    basic_block_count: Optional[int]
-    instruction_count: Optional[int]
+    basic_block_count: int
+    instruction_count: int
+    successor_count: int
+    max_block_end: Optional[int]
     cyclomatic_complexity: Optional[int]
     cross_references_to: Optional[List[Address]]
     cross_references_from: Optional[List[Address]]
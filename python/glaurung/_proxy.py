@@ -0,0 +1,42 @@
+"""
+Attribute pass-through for the sub-config proxies in ``glaurung.triage``.
+
+``TriageConfig`` hands out a proxy for each nested native config (``io``,
+``entropy`` and its thresholds and weights, ``scoring``, ...) that forwards
+attribute reads and writes to the wrapped copy and commits writes back to the
+parent. Rather than routing every access through a Python-level
+``__getattr__`` hook, ``add_passthroughs`` attaches one ``property`` per
+public attribute of the native class, so accesses take the normal descriptor
+path.
+"""
+
+import inspect
+from operator import attrgetter
+
+
+def add_passthroughs(
+    proxy_cls: type, native_cls: type, target: str, writable: bool = False
+) -> None:
+    """Attach properties to ``proxy_cls`` forwarding to ``self.<target>``.
+
+    Every public attribute of ``native_cls`` (getters and methods) gets a
+    read-only property unless ``proxy_cls`` (or a base) already defines it. With
+    ``writable``, data attributes also get a setter that calls
+    ``self._set(name, value)`` so the proxy can commit the change.
+    """
+    for name in dir(native_cls):
+        if name.startswith("_") or hasattr(proxy_cls, name):
+            continue
+        fset = None
+        if writable and inspect.isdatadescriptor(
+            inspect.getattr_static(native_cls, name)
+        ):
+            fset = _setter(name)
+        setattr(proxy_cls, name, property(attrgetter(f"{target}.{name}"), fset))
+
+
+def _setter(name: str):
+    def fset(self, value) -> None:
+        self._set(name, value)
+
+    return fset
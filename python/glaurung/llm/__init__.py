@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import os
 import warnings
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _dist_version
 
 # Pydantic's plugin loader imports optional telemetry plugins such as logfire
 # during model-class construction. That path is expensive and can hang test
@@ -25,11 +27,13 @@ _PYDANTIC_AI_MIN = (1, 0, 0)
 
 
 def _check_pydantic_ai_version() -> None:
+    # Read the installed distribution's metadata rather than importing
+    # pydantic_ai itself, which costs over a second and is not needed by
+    # the deterministic tools.
     try:
-        import pydantic_ai as _pa
-    except ImportError:  # pragma: no cover - optional dep at import time
+        raw = _dist_version("pydantic-ai-slim")
+    except PackageNotFoundError:  # pragma: no cover - optional dep
         return
-    raw = getattr(_pa, "__version__", "0.0.0")
     parts: tuple[int, ...]
     try:
         parts = tuple(int(p) for p in raw.split(".")[:3])
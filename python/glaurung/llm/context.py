@@ -35,6 +35,10 @@ class MemoryContext:
     factory that wires this up. Otherwise ``kb`` defaults to the
     in-memory implementation, which is what every existing test relies
     on — backward-compatible.
+
+    ``record_tool_payloads`` controls whether wrapped tool calls keep their
+    serialized args/result in the ``_tool_calls`` log. Long-running agents
+    with large tool outputs can turn it off to log only name + outcome.
     """
 
     file_path: str
@@ -44,6 +48,7 @@ class MemoryContext:
     session_id: str = "default"
     allow_expensive: bool = False
     db_path: Optional[str] = None
+    record_tool_payloads: bool = True
 
     @classmethod
     def open_persistent(
@@ -9,6 +9,10 @@ from pydantic import BaseModel, Field
 
 import glaurung as g
 
+# Return detection over a function's tail instructions.
+_RET_MNEMS = frozenset({"ret", "retab", "ret.n", "retn"})
+_ARM_RET_SUBSTRS = ("bx lr", "jr ra")
+
 
 class InstructionAnno(BaseModel):
     va: int
@@ -91,22 +95,17 @@ def _is_rip_relative_x64(ins: g.Instruction):
     try:
         if ins.arch.lower() not in ("x86_64", "x86-64", "x64", "amd64"):
             return False, None
+        operands = ins.operands
+        if not operands:
+            return False, None
+        for op in operands:
+            if getattr(op.kind, "name", None) != "Memory":
+                continue
+            if (op.base or "").lower() == "rip":
+                disp = getattr(op, "displacement", None) or 0
+                return True, ins.end_address().value + int(disp)
     except Exception:
         return False, None
-    if not ins.operands:
-        return False, None
-    for op in ins.operands:
-        try:
-            if op.kind.name == "Memory":
-                base = (op.base or "").lower()
-                if base == "rip":
-                    disp = op.displacement or 0
-                    eff = ins.end_address().value + (
-                        disp if isinstance(disp, int) else int(disp)
-                    )
-                    return True, eff
-        except Exception:
-            continue
     return False, None
 
 
@@ -119,20 +118,16 @@ def _abs_mem_target_x86(ins: g.Instruction):
     try:
         if ins.arch.lower() not in ("x86", "x86_64", "x64", "x86-64", "amd64"):
             return False, None
+        operands = ins.operands
+        if not operands:
+            return False, None
+        for op in operands:
+            if getattr(op.kind, "name", None) != "Memory":
+                continue
+            if not (op.base or "").strip() and not (op.index or "").strip():
+                return True, int(getattr(op, "displacement", None) or 0)
     except Exception:
         return False, None
-    if not ins.operands:
-        return False, None
-    for op in ins.operands:
-        try:
-            if op.kind.name == "Memory":
-                base = (op.base or "").strip()
-                index = (op.index or "").strip()
-                disp = op.displacement if op.displacement is not None else 0
-                if (not base) and (not index):
-                    return True, int(disp)
-        except Exception:
-            continue
     return False, None
 
 
@@ -316,19 +311,16 @@ def _annotate_function(
     if any((c.target_name or "").startswith(("puts", "printf")) for c in calls):
         hints.append("prints constant string")
     # Return heuristics across ISAs
-    tail = instrs[-5:] if len(instrs) >= 5 else instrs
-    if any((ins.mnemonic or "").lower() in ("ret", "retab") for ins in tail):
-        hints.append("returns")
-    else:
-        # ARM32 common return pattern: bx lr
-        for ins in tail:
-            text = (
-                (ins.mnemonic or "") + " " + ", ".join(str(o) for o in ins.operands)
-            ).lower()
-            if "bx lr" in text or "jr ra" in text:
-                hints.append("returns")
-                break
-        hints.append("returns")
+    for ins in instrs[-5:]:
+        mnem = (ins.mnemonic or "").lower()
+        if mnem in _RET_MNEMS:
+            hints.append("returns")
+            break
+        # ARM32 / MIPS return idioms: bx lr, jr ra
+        text_lower = (mnem + " " + ", ".join(str(o) for o in ins.operands)).lower()
+        if any(s in text_lower for s in _ARM_RET_SUBSTRS):
+            hints.append("returns")
+            break
     return FunctionEvidence(
         name=str(func.name),
         entry_va=int(func.entry_point.value),
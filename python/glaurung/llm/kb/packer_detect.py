@@ -16,6 +16,7 @@ unpackers are out of scope for v0 — that's a separate roadmap item.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from math import log2
 from pathlib import Path
 from typing import List, Optional
 
@@ -217,11 +218,8 @@ def _shannon_entropy(data: bytes) -> float:
     for b in data:
         counts[b] += 1
     total = len(data)
-    import math
-    entropy = 0.0
-    for c in counts:
-        if c == 0:
-            continue
-        p = c / total
-        entropy -= p * math.log2(p)
-    return entropy
+    # H = log2(n) - sum(c * log2(c)) / n: one log2 per occupied bin and no
+    # per-bin probability division. Clamp the rounding residue of a
+    # single-valued input, which can land just below zero.
+    weighted = sum(c * log2(c) for c in counts if c)
+    return max(0.0, log2(total) - weighted / total)
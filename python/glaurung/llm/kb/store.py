@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import Dict, List, Iterable, Optional, Tuple
+from typing import Any, Dict, List, Iterable, Optional, Tuple
 from collections import defaultdict
 
-from .models import Node, Edge, KBView
+from .models import Node, NodeKind, Edge, KBView
 
 
 class KnowledgeBase:
     """In-memory knowledge base with simple text indexing.
 
     - Adds nodes/edges and maintains inverted index over node.label/text.
+    - Indexes node ids by kind so per-kind lookups don't scan every node.
     - Provides text search, tag filtering, and neighborhood selection.
     """
 
@@ -17,10 +18,14 @@ class KnowledgeBase:
         self._nodes: Dict[str, Node] = {}
         self._edges: Dict[str, Edge] = {}
         self._by_tag: Dict[str, set[str]] = defaultdict(set)
+        # Insertion-ordered id sets (dict keys) so first_of_kind() matches
+        # the order nodes() would have yielded them in.
+        self._by_kind: Dict[NodeKind, Dict[str, None]] = defaultdict(dict)
         self._inv: Dict[str, set[str]] = defaultdict(set)
 
     # ----------------------------- add/update -----------------------------
     def add_node(self, node: Node) -> Node:
+        self._index_kind(node)
         self._nodes[node.id] = node
         for t in node.tags:
             self._by_tag[t].add(node.id)
@@ -33,6 +38,48 @@ class KnowledgeBase:
         self._edges[edge.id] = edge
         return edge
 
+    def add_nodes(self, nodes: Iterable[Node]) -> List[Node]:
+        """Add many nodes in one call; returns them in input order."""
+        added = list(nodes)
+        for n in added:
+            self._index_kind(n)
+        self._nodes.update((n.id, n) for n in added)
+        by_tag = self._by_tag
+        for n in added:
+            for t in n.tags:
+                by_tag[t].add(n.id)
+            self._index_text(n)
+        return added
+
+    def add_edges(self, edges: Iterable[Edge]) -> List[Edge]:
+        """Add many edges in one call; returns them in input order.
+
+        All endpoints are checked before any edge is inserted, so a bad
+        edge leaves the KB unchanged.
+        """
+        added = list(edges)
+        nodes = self._nodes
+        for e in added:
+            if e.src not in nodes or e.dst not in nodes:
+                raise ValueError("edge endpoints must exist")
+        self._edges.update((e.id, e) for e in added)
+        return added
+
+    def add_evidence(
+        self,
+        label: str,
+        props: Optional[Dict[str, Any]] = None,
+        *,
+        link_from_file: bool = True,
+    ) -> Node:
+        """Add an evidence node and link it from the file node, if any."""
+        ev = self.add_node(Node(kind=NodeKind.evidence, label=label, props=props or {}))
+        if link_from_file:
+            file_node = self.file_node()
+            if file_node is not None:
+                self.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
+        return ev
+
     def tag_node(self, node_id: str, *tags: str) -> None:
         n = self._nodes[node_id]
         for t in tags:
@@ -50,6 +97,19 @@ class KnowledgeBase:
     def edges(self) -> Iterable[Edge]:
         return self._edges.values()
 
+    def nodes_by_kind(self, kind: NodeKind) -> List[Node]:
+        return [self._nodes[nid] for nid in self._by_kind.get(kind, ())]
+
+    def first_of_kind(self, kind: NodeKind) -> Optional[Node]:
+        """Return the earliest-added node of ``kind`` without scanning the KB."""
+        for nid in self._by_kind.get(kind, ()):
+            return self._nodes[nid]
+        return None
+
+    def file_node(self) -> Optional[Node]:
+        """Return the KB's file node (the first one imported), if any."""
+        return self.first_of_kind(NodeKind.file)
+
     def neighbors(self, node_id: str) -> List[Node]:
         out = []
         for e in self._edges.values():
@@ -99,6 +159,14 @@ class KnowledgeBase:
         return KBView(nodes=nodes, edges=edges)
 
     # ------------------------------ internal -----------------------------
+    def _index_kind(self, node: Node) -> None:
+        # Must run before the node is stored so a replaced node's old kind
+        # can be dropped from the index.
+        prev = self._nodes.get(node.id)
+        if prev is not None and prev.kind != node.kind:
+            self._by_kind[prev.kind].pop(node.id, None)
+        self._by_kind[node.kind][node.id] = None
+
     def _index_text(self, node: Node) -> None:
         text = (node.label or "") + "\n" + (node.text or "")
         for tok in _tokenize(text):
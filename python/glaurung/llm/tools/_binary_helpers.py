@@ -0,0 +1,54 @@
+"""Shared helpers for the tools that read a binary directly.
+
+Disassembly-backed tools (``view_function``, ``suggest_function_name``, ...)
+resolve addresses taken from decoded operands and look them up in per-file
+maps built by the native layer.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache, wraps
+from typing import Callable, TypeVar
+
+import glaurung as g
+
+R = TypeVar("R")
+
+# Operand immediates and displacements are signed; native address lookups
+# take ``u64``, so a negative value must wrap the way the CPU would.
+U64_MASK = (1 << 64) - 1
+
+
+def insn_text(ins: g.Instruction) -> str:
+    """Render ``ins`` as ``"<mnemonic> <operands>"``."""
+    # ``op_str`` is joined natively, so no Operand objects are materialised.
+    return f"{ins.mnemonic} {ins.op_str}"
+
+
+def cached_per_file_version(
+    maxsize: int,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Memoise a ``load(path, *args)`` function per version of ``path``.
+
+    Each call stats ``path`` and adds its ``st_mtime_ns`` to the cache key,
+    so a rewritten file is reloaded; a failing ``os.stat`` raises
+    ``OSError``. Exceptions from ``load`` are not cached. Results are shared
+    between callers and must not be mutated. The wrapper exposes the
+    underlying ``cache_clear`` and ``cache_info``.
+    """
+
+    def decorate(load: Callable[..., R]) -> Callable[..., R]:
+        @lru_cache(maxsize=maxsize)
+        def cached(path: str, mtime_ns: int, *args) -> R:
+            return load(path, *args)
+
+        @wraps(load)
+        def wrapper(path: str, *args) -> R:
+            return cached(path, os.stat(path).st_mtime_ns, *args)
+
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
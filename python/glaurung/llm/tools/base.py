@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, Type, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from ..context import MemoryContext
 from ..kb.store import KnowledgeBase
@@ -47,11 +49,32 @@ class MemoryTool(ABC, Generic[InputModelT, OutputModelT]):
     ) -> OutputModelT: ...
 
 
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Return the process-wide TypeAdapter for ``tp``, building it once.
+
+    Use for non-model types such as ``list[SomeRow]``; BaseModel classes
+    already carry a shared validator (``Model.model_validate``).
+    """
+    return TypeAdapter(tp)
+
+
+@lru_cache(maxsize=None)
+def _input_json_schema(model: Type[BaseModel]) -> dict:
+    # Schema generation is not cached by pydantic and several MemoryTool
+    # instances (and agents) share an input model.
+    return model.model_json_schema()
+
+
 # Module-level default for tool_to_pyd_ai's `strict` resolution.
 # Touched by set_default_tool_strict() / default_tool_strict_for_model()
 # below; left as None so the env-var fallback path still works.
 _DEFAULT_TOOL_STRICT: bool | None = None
 
+# pydantic-ai Tools built by tool_to_pyd_ai, keyed by tool class, tool name
+# and the resolved ``(strict, include_return_schema)`` pair.
+_PYD_AI_TOOLS: dict[tuple[type, str, bool, bool | None], "Tool[MemoryContext]"] = {}
+
 
 def default_tool_strict_for_model(model_name: object | None) -> bool:
     """Choose pydantic-ai tool strictness based on the target LLM provider.
@@ -117,6 +140,10 @@ def tool_to_pyd_ai(
          PersistentKnowledgeBase, so the agent's claims can cite this
          tool invocation by `cite_id` (#208 generic migration).
 
+    Wrappers are memoized per MemoryTool class, tool name and resolved
+    ``(strict, include_return_schema)`` pair; wrapping another instance of
+    the same tool returns the existing pydantic-ai Tool.
+
     ``strict`` is intentionally configurable at the wrapper layer so
     provider-facing agents can keep small critical toolsets strict while
     relaxing larger exploratory toolsets for providers with strict-tool
@@ -145,10 +172,20 @@ def tool_to_pyd_ai(
         else:
             strict = os.getenv("GLAURUNG_TOOL_STRICT", "1") != "0"
 
+    # Agent factories wrap a freshly built MemoryTool on every agent build,
+    # so wrappers are shared by tool class and name rather than by
+    # instance. The cached Tool's closure keeps running the first instance
+    # it wrapped; memory tools keep no per-instance state, so any instance
+    # of the same class behaves the same.
+    cache_key = (type(tool), tool.meta.name, strict, include_return_schema)
+    cached = _PYD_AI_TOOLS.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Build a function taking a pydantic-ai RunContext. Keep the parameter
     # unannotated so importing deterministic tools does not import pydantic_ai.
     def _impl(run_ctx, **kwargs) -> OutputModelT:
-        args_model = tool.input_model(**kwargs)
+        args_model = tool.input_model.model_validate(kwargs)
         ctx = run_ctx.deps
         result_model: OutputModelT | None = None
         error_str: str | None = None
@@ -159,6 +196,12 @@ def tool_to_pyd_ai(
             error_str = str(e)
             raise
         finally:
+            # Serialize args/result at most once per call; the same dumps
+            # feed both the CLI call log and the evidence row. Contexts
+            # that set ``record_tool_payloads = False`` skip payload
+            # serialization for the call log entirely.
+            args_dump: dict | None = None
+            result_dump: dict | None = None
             # Record tool call in context for CLI visualization
             try:
                 # Attach a private call log list if missing
@@ -166,16 +209,18 @@ def tool_to_pyd_ai(
                 if calls is None:
                     calls = []
                     setattr(ctx, "_tool_calls", calls)
-                entry = {
-                    "tool": tool.meta.name,
-                    "args": args_model.model_dump(),
-                }
-                if result_model is not None:
-                    # Attempt to serialize pydantic result
-                    try:
-                        entry["result"] = result_model.model_dump()
-                    except Exception:
-                        entry["result"] = str(result_model)
+                if getattr(ctx, "record_tool_payloads", True):
+                    args_dump = args_model.model_dump()
+                    entry = {"tool": tool.meta.name, "args": args_dump}
+                    if result_model is not None:
+                        # Attempt to serialize pydantic result
+                        try:
+                            result_dump = result_model.model_dump()
+                            entry["result"] = result_dump
+                        except Exception:
+                            entry["result"] = str(result_model)
+                else:
+                    entry = {"tool": tool.meta.name, "ok": error_str is None}
                 if error_str is not None:
                     entry["error"] = error_str
                 calls.append(entry)
@@ -193,6 +238,8 @@ def tool_to_pyd_ai(
                     result_model,
                     error_str,
                     last_call_entry=calls[-1] if calls else None,
+                    args_dump=args_dump,
+                    output_dump=result_dump,
                 )
             except Exception:
                 # Never let evidence-logging failures break the tool.
@@ -202,11 +249,13 @@ def tool_to_pyd_ai(
         _impl,
         name=tool.meta.name,
         description=tool.meta.description,
-        json_schema=tool.input_model.model_json_schema(),
+        # Copied so a schema transform on one Tool cannot leak into others.
+        json_schema=copy.deepcopy(_input_json_schema(tool.input_model)),
         takes_ctx=True,
     )
     pyd_tool.strict = strict
     pyd_tool.include_return_schema = include_return_schema
+    _PYD_AI_TOOLS[cache_key] = pyd_tool
     return pyd_tool
 
 
@@ -218,6 +267,8 @@ def _record_tool_evidence(
     error_str: str | None,
     *,
     last_call_entry: dict | None = None,
+    args_dump: dict | None = None,
+    output_dump: dict | None = None,
 ) -> None:
     """Best-effort: write an evidence_log row for this tool call when
     the context's KB supports persistence. No-op otherwise.
@@ -225,6 +276,9 @@ def _record_tool_evidence(
     Picks a VA range from common result-model fields when available
     (`va`, `va_start`, `start_va`, `entry_va`) so cite filters by VA
     work correctly for tools that target a specific address.
+
+    ``args_dump`` / ``output_dump`` may carry ``model_dump()`` results the
+    caller already computed; they are only re-serialized when absent.
     """
     kb = getattr(ctx, "kb", None)
     if kb is None:
@@ -237,14 +291,14 @@ def _record_tool_evidence(
 
     from ..kb.xref_db import record_evidence  # late import: avoids cycle
 
-    args_dump: dict = {}
-    try:
-        args_dump = args_model.model_dump()
-    except Exception:
-        pass
+    if args_dump is None:
+        args_dump = {}
+        try:
+            args_dump = args_model.model_dump()
+        except Exception:
+            pass
 
-    output_dump: dict | None = None
-    if result_model is not None:
+    if output_dump is None and result_model is not None:
         try:
             output_dump = result_model.model_dump()
         except Exception:
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+import stat
+from functools import partial
 from pathlib import Path
 from pydantic import BaseModel, Field
 
@@ -10,6 +14,19 @@ from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 
 
+# Direct constructors reach OpenSSL's EVP objects without the hashlib.new()
+# name dispatch; md5/sha1 are identifiers here, not security primitives.
+_HASH_CONSTRUCTORS = {
+    "md5": partial(hashlib.md5, usedforsecurity=False),
+    "sha1": partial(hashlib.sha1, usedforsecurity=False),
+    "sha256": hashlib.sha256,
+}
+
+# Regular files up to this size are mapped and hashed in a single update();
+# larger (or unmappable) inputs stream through hashlib.file_digest.
+_MMAP_MAX_BYTES = 256 * 1024 * 1024
+
+
 class FileHashArgs(BaseModel):
     algorithm: str = Field("sha256", pattern=r"^(md5|sha1|sha256)$")
 
@@ -35,10 +52,20 @@ class FileHashTool(MemoryTool[FileHashArgs, FileHashResult]):
         self, ctx: MemoryContext, kb: KnowledgeBase, args: FileHashArgs
     ) -> FileHashResult:
         p = Path(ctx.file_path)
-        h = hashlib.new(args.algorithm)
+        ctor = _HASH_CONSTRUCTORS[args.algorithm]
         with p.open("rb") as f:
-            while chunk := f.read(8192):
-                h.update(chunk)
+            st = os.fstat(f.fileno())
+            if stat.S_ISREG(st.st_mode) and 0 < st.st_size <= _MMAP_MAX_BYTES:
+                h = ctor()
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    h.update(mm)
+                finally:
+                    mm.close()
+            else:
+                # file_digest hashes in 256 KiB chunks inside C with the GIL
+                # released.
+                h = hashlib.file_digest(f, ctor)
         digest = h.hexdigest()
         kb.add_node(
             Node(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import operator
 from collections import Counter
+from dataclasses import dataclass
+from typing import Annotated
 
 from pydantic import BaseModel, Field
 
@@ -9,35 +12,75 @@ import glaurung as g
 from ..context import MemoryContext
 from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
-from .base import MemoryTool, ToolMeta
+from .base import MemoryTool, ToolMeta, type_adapter
 
 
-class FunctionItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FunctionItem:
+    # A plain slotted dataclass: listings can hold thousands of rows, and
+    # pydantic still validates/serialises it as part of ListFunctionsResult.
+    # Field descriptions ride in Annotated so the default stays a real None.
     name: str
     entry_va: int
-    end_va: int | None = Field(
-        None,
-        description="Max end-address across basic blocks — useful for lining up "
-                    "a function's extent against external data references.",
-    )
+    end_va: Annotated[
+        int | None,
+        Field(
+            description="Max end-address across basic blocks — useful for lining up "
+                        "a function's extent against external data references."
+        ),
+    ] = None
     size: int | None = None
     blocks: int | None = None
-    edges: int | None = Field(
-        None, description="Intra-function CFG edges (successor count sum)."
-    )
-    total_instr_count: int | None = Field(
-        None, description="Total instructions across all basic blocks."
-    )
-    calls_made: int | None = Field(
-        None,
-        description="Number of distinct direct-call targets from this function "
-                    "(callgraph out-degree).",
-    )
-    callers_count: int | None = Field(
-        None,
-        description="Number of distinct functions that directly call this one "
-                    "(callgraph in-degree).",
-    )
+    edges: Annotated[
+        int | None,
+        Field(description="Intra-function CFG edges (successor count sum)."),
+    ] = None
+    total_instr_count: Annotated[
+        int | None,
+        Field(description="Total instructions across all basic blocks."),
+    ] = None
+    calls_made: Annotated[
+        int | None,
+        Field(
+            description="Number of distinct direct-call targets from this function "
+                        "(callgraph out-degree)."
+        ),
+    ] = None
+    callers_count: Annotated[
+        int | None,
+        Field(
+            description="Number of distinct functions that directly call this one "
+                        "(callgraph in-degree)."
+        ),
+    ] = None
+
+
+# Each native getter builds a fresh Python object, so every field is read
+# exactly once per function.
+_FUNC_FIELDS = operator.attrgetter("name", "entry_point", "size")
+# Block aggregates computed on the Rust side; reading basic_blocks instead
+# clones every block across the boundary just to count it.
+_BLOCK_STATS = operator.attrgetter(
+    "basic_block_count", "successor_count", "max_block_end", "instruction_count"
+)
+
+
+def _block_stats(f) -> tuple[int | None, int | None, int | None, int | None]:
+    """Return ``(blocks, edges, end_va, total_instr)`` for a native function."""
+    try:
+        return _BLOCK_STATS(f)
+    except AttributeError:
+        pass  # extension built before the aggregate getters existed
+    try:
+        bbs = list(f.basic_blocks)
+        return (
+            len(bbs),
+            sum(len(bb.successor_ids) for bb in bbs),
+            max(int(bb.end_address.value) for bb in bbs) if bbs else None,
+            sum(int(getattr(bb, "instruction_count", 0) or 0) for bb in bbs),
+        )
+    except Exception:
+        return None, None, None, None
 
 
 class ListFunctionsArgs(BaseModel):
@@ -85,16 +128,15 @@ class ListFunctionsTool(MemoryTool[ListFunctionsArgs, ListFunctionsResult]):
         # The callgraph emits synthesized names like ``sub_10c0`` even when the
         # function list already carries resolved names such as ``main`` — so we
         # normalise both sides to a VA before counting.
+        fields: list[tuple[str, int, object, object]] = []
         va_by_cg_name: dict[str, int] = {}
         for f in funcs:
-            ev = int(
-                getattr(
-                    getattr(f, "entry_point", 0), "value", getattr(f, "entry_point", 0)
-                )
-                or 0
-            )
+            name, ep, size = _FUNC_FIELDS(f)
+            name = str(name)
+            ev = int(getattr(ep, "value", ep) or 0)
+            fields.append((name, ev, size, f))
             va_by_cg_name[f"sub_{ev:x}"] = ev
-            va_by_cg_name[str(getattr(f, "name", ""))] = ev
+            va_by_cg_name[name] = ev
 
         calls_made_by_va: Counter[int] = Counter()
         callers_by_va: Counter[int] = Counter()
@@ -118,86 +160,51 @@ class ListFunctionsTool(MemoryTool[ListFunctionsArgs, ListFunctionsResult]):
                         seen.add(in_key)
                         callers_by_va[tva] += 1
 
-        out: list[FunctionItem] = []
-        for f in funcs:
-            name = str(getattr(f, "name", "func"))
-            try:
-                size = (
-                    int(getattr(f, "size", 0) or 0)
-                    if getattr(f, "size", None) is not None
-                    else None
-                )
-            except Exception:
-                size = None
-            blocks: int | None
-            edges: int | None
-            end_va: int | None
-            total_instr: int | None
-            try:
-                bbs = list(f.basic_blocks)
-                blocks = len(bbs)
-                edges = sum(len(bb.successor_ids) for bb in bbs)
-                end_va = (
-                    max(int(bb.end_address.value) for bb in bbs) if bbs else None
-                )
-                total_instr = sum(
-                    int(getattr(bb, "instruction_count", 0) or 0) for bb in bbs
-                )
-            except Exception:
-                blocks = None
-                edges = None
-                end_va = None
-                total_instr = None
-            entry_va = int(
-                getattr(
-                    getattr(f, "entry_point", 0),
-                    "value",
-                    getattr(f, "entry_point", 0),
-                )
-                or 0
-            )
-            out.append(
-                FunctionItem(
-                    name=name,
-                    entry_va=entry_va,
-                    end_va=end_va,
-                    size=size,
-                    blocks=blocks,
-                    edges=edges,
-                    total_instr_count=total_instr,
-                    calls_made=(
+        # Rows are collected as plain dicts and validated into FunctionItems
+        # in one pydantic-core call after the loop.
+        rows: list[dict] = []
+        for name, entry_va, size, f in fields:
+            blocks, edges, end_va, total_instr = _block_stats(f)
+            rows.append(
+                {
+                    "name": name,
+                    "entry_va": entry_va,
+                    "end_va": end_va,
+                    "size": None if size is None else int(size),
+                    "blocks": blocks,
+                    "edges": edges,
+                    "total_instr_count": total_instr,
+                    "calls_made": (
                         int(calls_made_by_va.get(entry_va, 0))
                         if cg is not None
                         else None
                     ),
-                    callers_count=(
+                    "callers_count": (
                         int(callers_by_va.get(entry_va, 0))
                         if cg is not None
                         else None
                     ),
-                )
+                }
             )
+        out: list[FunctionItem] = type_adapter(list[FunctionItem]).validate_python(
+            rows
+        )
 
         ev_id = None
         if args.add_to_kb and out:
-            ev = kb.add_node(
+            ev = kb.add_evidence(label="functions", props={"count": len(out)})
+            ev_id = ev.id
+            fn_nodes = kb.add_nodes(
                 Node(
-                    kind=NodeKind.evidence, label="functions", props={"count": len(out)}
+                    kind=NodeKind.function,
+                    label=fi.name,
+                    props={"entry_va": fi.entry_va, "size": fi.size},
                 )
+                for fi in out
+            )
+            kb.add_edges(
+                Edge(src=ev.id, dst=fn.id, kind="has_function") for fn in fn_nodes
             )
-            ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
-            for fi in out:
-                fn = kb.add_node(
-                    Node(
-                        kind=NodeKind.function,
-                        label=fi.name,
-                        props={"entry_va": fi.entry_va, "size": fi.size},
-                    )
-                )
-                kb.add_edge(Edge(src=ev.id, dst=fn.id, kind="has_function"))
 
         return ListFunctionsResult(functions=out, evidence_node_id=ev_id)
 
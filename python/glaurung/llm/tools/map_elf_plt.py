@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 import glaurung as g
@@ -14,7 +16,8 @@ class ElfPltMapArgs(BaseModel):
     add_to_kb: bool = True
 
 
-class PltEntry(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PltEntry:
     va: int
     name: str
 
@@ -50,16 +53,15 @@ class ElfPltMapTool(MemoryTool[ElfPltMapArgs, ElfPltMapResult]):
         except Exception:
             entries = []
         if args.add_to_kb and entries:
-            ev = kb.add_node(Node(kind=NodeKind.evidence, label="map_elf_plt"))
+            ev = kb.add_evidence(label="map_elf_plt")
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
-            for e in entries:
-                n = kb.add_node(
-                    Node(kind=NodeKind.import_sym, label=e.name, props={"va": e.va})
-                )
-                kb.add_edge(Edge(src=ev.id, dst=n.id, kind="plt_entry"))
+            sym_nodes = kb.add_nodes(
+                Node(kind=NodeKind.import_sym, label=e.name, props={"va": e.va})
+                for e in entries
+            )
+            kb.add_edges(
+                Edge(src=ev.id, dst=n.id, kind="plt_entry") for n in sym_nodes
+            )
         return ElfPltMapResult(entries=entries, evidence_node_id=ev_id)
 
 
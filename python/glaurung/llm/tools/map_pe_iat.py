@@ -95,20 +95,19 @@ class PeIatMapTool(MemoryTool[PeIatMapArgs, PeIatMapResult]):
                     )
                 )
         if args.add_to_kb and entries:
-            ev = kb.add_node(Node(kind=NodeKind.evidence, label="map_pe_iat"))
+            ev = kb.add_evidence(label="map_pe_iat")
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
-            for e in entries:
-                n = kb.add_node(
-                    Node(
-                        kind=NodeKind.import_sym,
-                        label=e.name,
-                        props=e.model_dump(exclude_none=True),
-                    )
+            sym_nodes = kb.add_nodes(
+                Node(
+                    kind=NodeKind.import_sym,
+                    label=e.name,
+                    props=e.model_dump(exclude_none=True),
                 )
-                kb.add_edge(Edge(src=ev.id, dst=n.id, kind="iat_entry"))
+                for e in entries
+            )
+            kb.add_edges(
+                Edge(src=ev.id, dst=n.id, kind="iat_entry") for n in sym_nodes
+            )
         return PeIatMapResult(entries=entries, evidence_node_id=ev_id)
 
 
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel
 
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 
 
-class SymbolAddress(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SymbolAddress:
     va: int
     name: str
 
@@ -51,17 +53,11 @@ class MapSymbolAddressesTool(
         entries = [SymbolAddress(va=int(a), name=str(n)) for (a, n) in pairs]
         ev_id = None
         if args.add_to_kb and entries:
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label="symbol_addresses",
-                    props={"count": len(entries)},
-                )
+            ev = kb.add_evidence(
+                label="symbol_addresses",
+                props={"count": len(entries)},
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
         return MapSymbolAddressesResult(symbols=entries, evidence_node_id=ev_id)
 
 
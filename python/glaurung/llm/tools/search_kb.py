@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List
 from pydantic import BaseModel, Field
 
@@ -13,7 +14,8 @@ class KBSearchArgs(BaseModel):
     k: int = Field(10, ge=1, le=200)
 
 
-class KBSearchHit(BaseModel):
+@dataclass(slots=True, frozen=True)
+class KBSearchHit:
     node_id: str
     label: str
     score: int
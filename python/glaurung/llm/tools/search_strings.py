@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import mmap
+import os
 import re
-from typing import Iterable, Literal
+import stat
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, Iterable, Iterator, Literal
 
 from pydantic import BaseModel, Field
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 
@@ -14,68 +18,138 @@ from .base import MemoryTool, ToolMeta
 EncKind = Literal["ascii", "utf16le", "utf16be"]
 
 
+@lru_cache(maxsize=32)
+def _ascii_run_re(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"[\x20-\x7e]{%d,}" % max(min_len, 1))
+
+
 def _scan_ascii(data: bytes, min_len: int) -> Iterable[tuple[str, int, EncKind]]:
-    start = None
-    for i, b in enumerate(data):
-        if 32 <= b < 127:  # printable ASCII
-            if start is None:
-                start = i
-        else:
-            if start is not None and i - start >= min_len:
-                yield data[start:i].decode("ascii", errors="ignore"), start, "ascii"
-            start = None
-    if start is not None and len(data) - start >= min_len:
-        yield data[start:].decode("ascii", errors="ignore"), start, "ascii"
+    # Printable runs are located by the C regex engine in one linear pass;
+    # only runs that meet min_len are ever sliced and decoded.
+    for m in _ascii_run_re(min_len).finditer(data):
+        yield m.group().decode("ascii"), m.start(), "ascii"
 
 
-def _scan_utf16le(data: bytes, min_len: int) -> Iterable[tuple[str, int, EncKind]]:
-    if len(data) < 2:
-        return
-    run = []  # list of (byte, index)
-    i = 0
-    while i + 1 < len(data):
-        lo = data[i]
-        hi = data[i + 1]
-        if hi == 0 and 32 <= lo < 127:
-            run.append((lo, i))
-            i += 2
+# Printable ASCII bytes map to 0x01, everything else to 0x00.
+_PRINTABLE_MASK = bytes(1 if 32 <= b < 127 else 0 for b in range(256))
+_NON_PRINTABLE_RE = re.compile(rb"[^\x20-\x7e]")
+
+
+def _ascii_run_bounds(data, pos: int) -> tuple[int, int]:
+    """Return ``(start, end)`` of the printable run containing ``data[pos]``.
+
+    The start is found by translating small windows behind ``pos`` rather
+    than the whole buffer, so no full-size copy of ``data`` is made.
+    """
+    m = _NON_PRINTABLE_RE.search(data, pos)
+    end = m.start() if m else len(data)
+    start = pos
+    while start > 0:
+        lo = max(0, start - 4096)
+        i = data[lo:start].translate(_PRINTABLE_MASK).rfind(b"\x00")
+        if i >= 0:
+            start = lo + i + 1
+            break
+        start = lo
+    return start, end
+
+
+def _literal_finder(
+    data, needle: bytes, case_sensitive: bool
+) -> Callable[[int], int]:
+    """Return ``find(at)`` giving the next offset of ``needle`` or ``-1``.
+
+    Case-insensitive lookups use an ASCII ``IGNORECASE`` search so neither
+    path needs a lowered copy of ``data``.
+    """
+    if case_sensitive:
+        return partial(data.find, needle)
+    search = re.compile(re.escape(needle), re.IGNORECASE).search
+
+    def find(at: int) -> int:
+        m = search(data, at)
+        return m.start() if m else -1
+
+    return find
+
+
+def _find_ascii_literal(
+    data, needle: bytes, min_len: int, case_sensitive: bool
+) -> Iterable[tuple[str, int, EncKind]]:
+    """Yield the ASCII runs of ``data`` that contain ``needle``.
+
+    ``needle`` must be non-empty printable ASCII (lower-cased when
+    ``case_sensitive`` is false). ``data`` may be ``bytes`` or a read-only
+    ``mmap``. Occurrences are located over the whole buffer in C and
+    widened to their enclosing printable run, so bytes that never hold a
+    hit are not visited in Python.
+    """
+    find = _literal_finder(data, needle, case_sensitive)
+    pos = find(0)
+    while pos >= 0:
+        start, end = _ascii_run_bounds(data, pos)
+        if end - start >= min_len:
+            yield data[start:end].decode("ascii"), start, "ascii"
+        pos = find(end)
+
+
+@lru_cache(maxsize=32)
+def _utf16_run_re(min_len: int, big_endian: bool) -> re.Pattern[bytes]:
+    unit = rb"\x00[\x20-\x7e]" if big_endian else rb"[\x20-\x7e]\x00"
+    return re.compile(rb"(?:%s){%d,}" % (unit, max(min_len, 1)))
+
+
+def _scan_utf16(
+    data: bytes, min_len: int, big_endian: bool, enc: EncKind
+) -> Iterable[tuple[str, int, EncKind]]:
+    # Code units are only recognised at even offsets. An odd-offset match
+    # can never share bytes with an even-aligned run (its zero and printable
+    # bytes sit in the opposite lanes), so dropping it loses nothing.
+    lo = 1 if big_endian else 0
+    for m in _utf16_run_re(min_len, big_endian).finditer(data):
+        start, end = m.span()
+        if start & 1:
             continue
-        if run:
-            if len(run) >= min_len:
-                text = bytes(b for b, _ in run).decode("ascii", errors="ignore")
-                start = run[0][1]
-                yield text, start, "utf16le"
-            run.clear()
-        i += 2
-    if run and len(run) >= min_len:
-        text = bytes(b for b, _ in run).decode("ascii", errors="ignore")
-        start = run[0][1]
-        yield text, start, "utf16le"
+        # One strided slice of the buffer picks out the character bytes
+        # without materialising the whole match first.
+        yield data[start + lo : end : 2].decode("ascii"), start, enc
+
+
+def _scan_utf16le(data: bytes, min_len: int) -> Iterable[tuple[str, int, EncKind]]:
+    return _scan_utf16(data, min_len, False, "utf16le")
 
 
 def _scan_utf16be(data: bytes, min_len: int) -> Iterable[tuple[str, int, EncKind]]:
-    if len(data) < 2:
-        return
-    run = []
-    i = 0
-    while i + 1 < len(data):
-        hi = data[i]
-        lo = data[i + 1]
-        if hi == 0 and 32 <= lo < 127:
-            run.append((lo, i))
-            i += 2
-            continue
-        if run:
-            if len(run) >= min_len:
-                text = bytes(b for b, _ in run).decode("ascii", errors="ignore")
-                start = run[0][1]
-                yield text, start, "utf16be"
-            run.clear()
-        i += 2
-    if run and len(run) >= min_len:
-        text = bytes(b for b, _ in run).decode("ascii", errors="ignore")
-        start = run[0][1]
-        yield text, start, "utf16be"
+    return _scan_utf16(data, min_len, True, "utf16be")
+
+
+@lru_cache(maxsize=1)
+def _re2_module():
+    try:
+        import re2  # type: ignore
+    except ImportError:
+        return None
+    return re2
+
+
+def _compile_query(query: str, case_sensitive: bool):
+    """Compile a regex-mode query, preferring RE2 when it is installed.
+
+    RE2 (``google-re2``) matches in linear time and cannot backtrack
+    catastrophically on adversarial strings. It is optional: patterns RE2
+    rejects (backreferences, lookaround) and environments without it use
+    :mod:`re`. Returns ``None`` when neither engine accepts the pattern.
+    """
+    re2 = _re2_module()
+    if re2 is not None:
+        try:
+            return re2.compile(query if case_sensitive else f"(?i){query}")
+        except Exception:
+            pass
+    try:
+        return re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return None
 
 
 class StringsSearchArgs(BaseModel):
@@ -92,7 +166,8 @@ class StringsSearchArgs(BaseModel):
     add_to_kb: bool = True
 
 
-class StringMatch(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StringMatch:
     text: str
     offset: int
     encoding: EncKind
@@ -104,6 +179,77 @@ class StringsSearchResult(BaseModel):
     evidence_node_id: str | None = None
 
 
+def _collect_matches(
+    buf, args: StringsSearchArgs, limit: int
+) -> list[StringMatch]:
+    """Scan ``buf`` (bytes or mmap) and return up to ``limit`` matches."""
+    # Literal printable-ASCII queries are located directly in the raw
+    # buffer instead of testing every extracted run.
+    # Non-ASCII queries keep ``needle`` empty: they cannot occur in an
+    # ASCII run and have no single-byte encoding to search for.
+    needle = b""
+    if not args.regex and args.query.isascii():
+        q_bytes = (
+            args.query if args.case_sensitive else args.query.lower()
+        ).encode("ascii")
+        if _ascii_run_re(1).fullmatch(q_bytes):
+            needle = q_bytes
+
+    # For literal queries a UTF-16 run can only match if the encoded query
+    # occurs somewhere in the buffer; one C-level probe skips the whole
+    # scan otherwise.
+    def wanted(enc: EncKind, codec: str) -> bool:
+        if enc not in args.encodings:
+            return False
+        if not needle:
+            return True
+        probe = needle.decode("ascii").encode(codec)
+        return _literal_finder(buf, probe, args.case_sensitive)(0) >= 0
+
+    # Scanners are produced lazily, so once the result limit is reached
+    # later encodings are neither probed nor scanned.
+    def scanners() -> Iterator[Iterable[tuple[str, int, EncKind]]]:
+        if "ascii" in args.encodings:
+            if needle:
+                yield _find_ascii_literal(
+                    buf, needle, args.min_length, args.case_sensitive
+                )
+            else:
+                yield _scan_ascii(buf, args.min_length)
+        if wanted("utf16le", "utf-16-le"):
+            yield _scan_utf16le(buf, args.min_length)
+        if wanted("utf16be", "utf-16-be"):
+            yield _scan_utf16be(buf, args.min_length)
+
+    # Build the matcher once so the per-string test is a single call. A
+    # regex that neither engine accepts is matched as a literal substring.
+    pattern = _compile_query(args.query, args.case_sensitive) if args.regex else None
+    matcher: Callable[[str], object]
+    if pattern is not None:
+        matcher = pattern.search
+    elif args.case_sensitive:
+        q = args.query
+
+        def matcher(text: str) -> bool:
+            return q in text
+
+    else:
+        q = args.query.lower()
+
+        def matcher(text: str) -> bool:
+            return q in text.lower()
+
+    out: list[StringMatch] = []
+    for it in scanners():
+        for text, off, enc in it:
+            if not matcher(text):
+                continue
+            out.append(StringMatch(text=text, offset=off, encoding=enc))
+            if len(out) >= limit:
+                return out
+    return out
+
+
 class StringsSearchTool(MemoryTool[StringsSearchArgs, StringsSearchResult]):
     def __init__(self) -> None:
         super().__init__(
@@ -120,65 +266,40 @@ class StringsSearchTool(MemoryTool[StringsSearchArgs, StringsSearchResult]):
         self, ctx: MemoryContext, kb: KnowledgeBase, args: StringsSearchArgs
     ) -> StringsSearchResult:
         max_bytes = args.max_scan_bytes or ctx.budgets.max_read_bytes
+        # Regular files are mapped read-only so the scanners work straight
+        # off the page cache instead of a private copy of the file.
         buf = b""
+        mm: mmap.mmap | None = None
         try:
             with open(ctx.file_path, "rb") as f:
-                buf = f.read(max_bytes)
+                st = os.fstat(f.fileno())
+                size = min(st.st_size, max_bytes)
+                if stat.S_ISREG(st.st_mode) and size > 0:
+                    mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                    buf = mm
+                else:
+                    buf = f.read(max_bytes)
         except FileNotFoundError:
             buf = b""
-
-        scanners: list = []
-        if "ascii" in args.encodings:
-            scanners.append(_scan_ascii(buf, args.min_length))
-        if "utf16le" in args.encodings:
-            scanners.append(_scan_utf16le(buf, args.min_length))
-        if "utf16be" in args.encodings:
-            scanners.append(_scan_utf16be(buf, args.min_length))
-
-        # Build matcher
-        if args.regex:
-            flags = 0 if args.case_sensitive else re.IGNORECASE
-            try:
-                pattern = re.compile(args.query, flags)
-            except re.error:
-                pattern = None
-        else:
-            pattern = None
-            q = args.query if args.case_sensitive else args.query.lower()
-
-        out: list[StringMatch] = []
-        limit = args.max_results or ctx.budgets.max_results
-        for it in scanners:
-            for text, off, enc in it:
-                if pattern is not None:
-                    if not pattern.search(text):
-                        continue
-                else:
-                    hay = text if args.case_sensitive else text.lower()
-                    if q not in hay:
-                        continue
-                out.append(StringMatch(text=text, offset=off, encoding=enc))
-                if len(out) >= limit:
-                    break
-            if len(out) >= limit:
-                break
+        scanned = len(buf)
+        try:
+            out = _collect_matches(
+                buf, args, args.max_results or ctx.budgets.max_results
+            )
+        finally:
+            if mm is not None:
+                mm.close()
 
         ev_id = None
         if args.add_to_kb and out:
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label="search_strings",
-                    props={"query": args.query, "count": len(out)},
-                )
+            ev = kb.add_evidence(
+                label="search_strings",
+                props={"query": args.query, "count": len(out)},
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return StringsSearchResult(
-            matches=out, scanned_bytes=len(buf), evidence_node_id=ev_id
+            matches=out, scanned_bytes=scanned, evidence_node_id=ev_id
         )
 
 
@@ -1,21 +1,40 @@
 from __future__ import annotations
 
 import re
-from typing import Literal
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterator, Literal
 
 from pydantic import BaseModel, Field
 
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
+from ._binary_helpers import cached_per_file_version
 from .base import MemoryTool, ToolMeta
 
 
 WhereKind = Literal["all", "dynamic", "imports", "exports", "libs"]
 
 
+@lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int) -> re.Pattern[str] | None:
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+@cached_per_file_version(maxsize=16)
+def _load_symbols(
+    path: str, max_read_bytes: int, max_file_size: int, demangle: bool
+) -> tuple[list[str], list[str], list[str], list[str], list[str]]:
+    """Return the five symbol lists for ``path``, memoised per file version."""
+    load = g.symbols.list_symbols_demangled if demangle else g.symbols.list_symbols
+    return tuple(load(path, max_read_bytes, max_file_size))
+
+
 class SymbolsSearchArgs(BaseModel):
     query: str = Field(..., description="Substring or regex to search for")
     where: list[WhereKind] = Field(
@@ -29,7 +48,8 @@ class SymbolsSearchArgs(BaseModel):
     add_to_kb: bool = True
 
 
-class SymbolMatch(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SymbolMatch:
     name: str
     category: WhereKind
 
@@ -57,18 +77,12 @@ class SymbolsSearchTool(MemoryTool[SymbolsSearchArgs, SymbolsSearchResult]):
     ) -> SymbolsSearchResult:
         # Load symbols (demangled if requested)
         try:
-            if args.demangle:
-                all_syms, dyn_syms, imports, exports, libs = (
-                    g.symbols.list_symbols_demangled(
-                        ctx.file_path,
-                        ctx.budgets.max_read_bytes,
-                        ctx.budgets.max_file_size,
-                    )
-                )
-            else:
-                all_syms, dyn_syms, imports, exports, libs = g.symbols.list_symbols(
-                    ctx.file_path, ctx.budgets.max_read_bytes, ctx.budgets.max_file_size
-                )
+            all_syms, dyn_syms, imports, exports, libs = _load_symbols(
+                ctx.file_path,
+                ctx.budgets.max_read_bytes,
+                ctx.budgets.max_file_size,
+                args.demangle,
+            )
         except Exception:
             all_syms, dyn_syms, imports, exports, libs = [], [], [], [], []
 
@@ -79,57 +93,56 @@ class SymbolsSearchTool(MemoryTool[SymbolsSearchArgs, SymbolsSearchResult]):
             "exports": exports,
             "libs": libs,
         }
-        targets: list[tuple[str, WhereKind]] = []
-        for c in args.where:
-            if c in cat_map:
-                targets.extend((s, c) for s in cat_map[c])
-        # dedupe targets by (name, category) to avoid duplicates from overlaps
-        seen: set[tuple[str, WhereKind]] = set()
-        filtered: list[SymbolMatch] = []
-        total = 0
 
-        # Build matcher
+        # Candidates are deduped by (name, category) lazily, in the requested
+        # category order, so a full page of results ends the scan early.
+        def candidates() -> Iterator[tuple[str, WhereKind]]:
+            for cat in dict.fromkeys(c for c in args.where if c in cat_map):
+                seen: set[str] = set()
+                for name in cat_map[cat]:
+                    if name not in seen:
+                        seen.add(name)
+                        yield name, cat
+
+        # Build matcher once so the per-symbol test is a single call; an
+        # invalid regex degrades to a substring match.
+        pattern = None
         if args.regex:
             flags = 0 if args.case_sensitive else re.IGNORECASE
-            try:
-                pattern = re.compile(args.query, flags)
-            except re.error:
-                pattern = None
+            pattern = _compiled(args.query, flags)
+        matcher: Callable[[str], object]
+        if pattern is not None:
+            matcher = pattern.search
+        elif args.case_sensitive:
+            q = args.query
+
+            def matcher(name: str) -> bool:
+                return q in name
+
         else:
-            pattern = None
-            q = args.query if args.case_sensitive else args.query.lower()
+            q = args.query.lower()
+
+            def matcher(name: str) -> bool:
+                return q in name.lower()
 
         max_results = args.max_results or ctx.budgets.max_results
-        for name, cat in targets:
+        filtered: list[SymbolMatch] = []
+        total = 0  # distinct candidates actually tested
+        for name, cat in candidates():
             total += 1
-            k = (name, cat)
-            if k in seen:
+            if not matcher(name):
                 continue
-            seen.add(k)
-            if pattern is not None:
-                if not pattern.search(name):
-                    continue
-            else:
-                hay = name if args.case_sensitive else name.lower()
-                if q not in hay:
-                    continue
             filtered.append(SymbolMatch(name=name, category=cat))
             if len(filtered) >= max_results:
                 break
 
         ev_id = None
         if args.add_to_kb and filtered:
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label="search_symbols",
-                    props={"query": args.query, "count": len(filtered)},
-                )
+            ev = kb.add_evidence(
+                label="search_symbols",
+                props={"query": args.query, "count": len(filtered)},
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return SymbolsSearchResult(
             matches=filtered, total_scanned=total, evidence_node_id=ev_id
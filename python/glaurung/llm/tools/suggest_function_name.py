@@ -2,19 +2,79 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
-from pydantic_ai.settings import ModelSettings
 
 import glaurung as g
 
 from ..config import get_config
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
+from ..kb.models import NodeKind
 from ..kb.store import KnowledgeBase
+from ._binary_helpers import U64_MASK, cached_per_file_version, insn_text
 from .base import MemoryTool, ToolMeta
 
 
+@cached_per_file_version(maxsize=8)
+def _load_call_targets(path: str) -> dict[int, str]:
+    """Map call-target addresses in ``path`` to names; symbols win over PLT.
+
+    One failing source just contributes no names. If both fail the error is
+    raised, so it is not cached and the next call retries.
+    """
+    names: dict[int, str] = {}
+    failed = False
+    # PLT first so symbol names replace PLT names at the same address
+    for load in (g.analysis.elf_plt_map_path, g.symbols.symbol_address_map):
+        try:
+            names.update({int(a): s for (a, s) in load(path)})
+        except Exception:
+            if failed:
+                raise
+            failed = True
+    return names
+
+
+@lru_cache(maxsize=4096)
+def _demangle(name: str) -> str | None:
+    """Demangle ``name`` once per process; ``None`` if it is not mangled.
+
+    Failures are cached too, so a pathological symbol is only ever fed to
+    the demangler a single time.
+    """
+    try:
+        result = g.strings.demangle_text(name)
+    except Exception:
+        return None
+    return result[0] if result else None
+
+
+_SLUG_PAREN_TAIL = re.compile(r"\(.*\)$")
+_SLUG_UNDERSCORES = re.compile(r"_+")
+_SLUG_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+# ASCII whitespace and ``:/\-`` become ``_``; every other ASCII character
+# outside ``[A-Za-z0-9_]`` is dropped.
+_SLUG_TABLE = {
+    c: "_" if chr(c).isspace() or chr(c) in ":/\\-" else None
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == "_")
+}
+
+
+def _slug_non_ascii(m: re.Match[str]) -> str:
+    return "_" if m.group().isspace() else ""
+
+
+def _slugify(n: str) -> str:
+    """Normalise a suggested name to a lower-case ``[a-z0-9_]`` identifier."""
+    n = _SLUG_PAREN_TAIL.sub("", n.strip()).translate(_SLUG_TABLE)
+    if not n.isascii():
+        n = _SLUG_NON_ASCII.sub(_slug_non_ascii, n)
+    return _SLUG_UNDERSCORES.sub("_", n).strip("_").lower() or "func"
+
+
 class SuggestFunctionNameArgs(BaseModel):
     va: int = Field(..., description="Virtual address of the function")
     original_name: str | None = Field(
@@ -57,14 +117,7 @@ class SuggestFunctionNameTool(
         self, ctx: MemoryContext, kb: KnowledgeBase, args: SuggestFunctionNameArgs
     ) -> SuggestFunctionNameResult:
         # First try to demangle if we have an original name
-        demangled_name = None
-        if args.original_name:
-            try:
-                result = g.strings.demangle_text(args.original_name)
-                if result:
-                    demangled_name, _flavor = result
-            except Exception:
-                pass
+        demangled_name = _demangle(args.original_name) if args.original_name else None
 
         # Do not blindly trust original or demangled names; treat as context only.
 
@@ -82,49 +135,34 @@ class SuggestFunctionNameTool(
                 max_time_ms=ctx.budgets.timeout_ms,
             )
 
-            # Try to get symbol maps for call resolution
-            sym_map = {}
-            plt_map = {}
-            try:
-                sym_list = g.symbols.symbol_address_map(ctx.file_path)
-                sym_map = {int(a): s for (a, s) in sym_list}
-            except Exception:
-                pass
+            # Symbol/PLT names for call resolution, shared across calls
+            # on the same (unchanged) file.
             try:
-                plt_list = g.analysis.elf_plt_map_path(ctx.file_path)
-                plt_map = {int(a): s for (a, s) in plt_list}
+                call_targets = _load_call_targets(ctx.file_path)
             except Exception:
-                pass
+                call_targets = {}
 
             # Analyze instructions
             for ins in instrs:
-                # Look for calls
-                try:
-                    if hasattr(ins, "is_call") and ins.is_call():
-                        for op in ins.operands:
-                            if str(getattr(op, "kind", "")).lower() == "immediate":
-                                try:
-                                    target = int(str(getattr(op, "text", "")), 16)
-                                    name = sym_map.get(target) or plt_map.get(target)
-                                    if name:
-                                        calls.append(name)
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
+                # Look for calls. Only immediate operands carry ``immediate``;
+                # it is masked to the unsigned address the hex text spells.
+                if ins.is_call():
+                    for op in ins.operands:
+                        imm = op.immediate
+                        if imm is not None:
+                            name = call_targets.get(imm & U64_MASK)
+                            if name:
+                                calls.append(name)
 
                 # Look for string references (simplified)
                 # This would need more sophisticated analysis for real string extraction
-                instructions.append(
-                    f"{ins.mnemonic} "
-                    + ", ".join(str(o) for o in getattr(ins, "operands", []))
-                )
+                instructions.append(insn_text(ins))
         except Exception:
             pass
 
         # Search KB for relevant strings near this address
         try:
-            string_nodes = [n for n in kb.nodes() if n.kind == NodeKind.string]
+            string_nodes = kb.nodes_by_kind(NodeKind.string)
             for sn in string_nodes[:10]:  # Limit to first 10
                 if sn.label and len(sn.label) > 3:
                     strings.append(sn.label)
@@ -155,17 +193,6 @@ class SuggestFunctionNameTool(
         # Ensure uniqueness: append VA suffix and normalize
         suffix = f"_{int(args.va):x}"
         base = suggestion.name or f"sub{suffix}"
-        import re as _re
-
-        def _slugify(n: str) -> str:
-            n = n.strip()
-            n = _re.sub(r"\(.*\)$", "", n)
-            n = _re.sub(r"[<>]", "", n)
-            n = _re.sub(r"[\s:/\\\-]+", "_", n)
-            n = _re.sub(r"[^A-Za-z0-9_]", "", n)
-            n = _re.sub(r"_+", "_", n)
-            return n.strip("_").lower() or "func"
-
         final_name = _slugify(base) + suffix
         suggestion = SuggestedFunctionName(
             name=final_name,
@@ -177,22 +204,15 @@ class SuggestFunctionNameTool(
         # Add to KB if requested
         ev_id = None
         if args.add_to_kb:
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label="function_name_suggestion",
-                    props={
-                        "va": args.va,
-                        "suggested_name": suggestion.name,
-                        "confidence": suggestion.confidence,
-                    },
-                )
+            ev = kb.add_evidence(
+                label="function_name_suggestion",
+                props={
+                    "va": args.va,
+                    "suggested_name": suggestion.name,
+                    "confidence": suggestion.confidence,
+                },
             )
             ev_id = ev.id
-            # Link to file node
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return SuggestFunctionNameResult(suggestion=suggestion, evidence_node_id=ev_id)
 
@@ -215,6 +235,10 @@ class SuggestFunctionNameTool(
         """
         import asyncio
 
+        # pydantic_ai is heavy to import; only the LLM path needs it.
+        from pydantic_ai import Agent
+        from pydantic_ai.settings import ModelSettings
+
         from ..config import get_config
 
         cfg = get_config()
@@ -304,22 +328,25 @@ class SuggestFunctionNameTool(
         summary = ""
         rationale = ""
 
-        if any("print" in c.lower() or "puts" in c.lower() for c in calls):
+        # One lower-cased blob per list turns every keyword probe into a
+        # single C-level substring search (no keyword contains a newline).
+        call_blob = "\n".join(calls).lower()
+        if "print" in call_blob or "puts" in call_blob:
             name = "print_message"
             confidence = 0.7
             summary = "Prints output to console"
             rationale = "Calls printing functions"
-        elif any("socket" in c.lower() or "connect" in c.lower() for c in calls):
+        elif "socket" in call_blob or "connect" in call_blob:
             name = "network_handler"
             confidence = 0.7
             summary = "Network-related functionality"
             rationale = "Calls network APIs"
-        elif any("createfile" in c.lower() or "open" in c.lower() for c in calls):
+        elif "createfile" in call_blob or "open" in call_blob:
             name = "file_handler"
             confidence = 0.7
             summary = "File operations"
             rationale = "Calls file APIs"
-        elif any("malloc" in c.lower() or "alloc" in c.lower() for c in calls):
+        elif "alloc" in call_blob:
             name = "memory_allocator"
             confidence = 0.65
             summary = "Memory allocation"
@@ -327,12 +354,13 @@ class SuggestFunctionNameTool(
 
         # Check strings for hints
         if not name and strings:
-            if any("error" in s.lower() for s in strings):
+            string_blob = "\n".join(strings).lower()
+            if "error" in string_blob:
                 name = "error_handler"
                 confidence = 0.6
                 summary = "Error handling"
                 rationale = "Contains error strings"
-            elif any("http" in s.lower() or "https" in s.lower() for s in strings):
+            elif "http" in string_blob:
                 name = "web_handler"
                 confidence = 0.65
                 summary = "Web-related functionality"
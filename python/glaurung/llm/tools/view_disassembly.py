@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
+from ._binary_helpers import insn_text
 from .base import MemoryTool, ToolMeta
 
 
@@ -17,7 +19,8 @@ class DisasmWindowArgs(BaseModel):
     add_to_kb: bool = True
 
 
-class DisassembledInst(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DisassembledInst:
     va: int
     bytes_hex: str
     text: str
@@ -56,29 +59,20 @@ class DisasmWindowTool(MemoryTool[DisasmWindowArgs, DisasmWindowResult]):
             instrs = []
         out: list[DisassembledInst] = []
         for ins in instrs:
-            text = f"{ins.mnemonic} " + ", ".join(
-                str(o) for o in getattr(ins, "operands", [])
-            )
             out.append(
                 DisassembledInst(
                     va=int(ins.address.value),
-                    bytes_hex=(ins.bytes or b"").hex(),
-                    text=text,
+                    bytes_hex=ins.bytes_hex,
+                    text=insn_text(ins),
                 )
             )
         ev_id = None
         if args.add_to_kb and out:
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label=f"disasm@0x{args.va:x}",
-                    props={"count": len(out)},
-                )
+            ev = kb.add_evidence(
+                label=f"disasm@0x{args.va:x}",
+                props={"count": len(out)},
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
         return DisasmWindowResult(instructions=out, evidence_node_id=ev_id)
 
 
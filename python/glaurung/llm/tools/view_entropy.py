@@ -1,31 +1,22 @@
 from __future__ import annotations
 
-from math import log2
+import mmap
+import os
+import stat
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 import glaurung as g
 
 
-def _shannon_entropy(data: bytes) -> float:
-    if not data:
-        return 0.0
-    # 256-bin histogram
-    hist = [0] * 256
-    for b in data:
-        hist[b] += 1
-    n = len(data)
-    h = 0.0
-    for c in hist:
-        if c:
-            p = c / n
-            h -= p * log2(p)
-    return float(h)
+def _shannon_entropy(data: bytes | memoryview) -> float:
+    # The 256-bin histogram and the bit sum run in one native pass
+    # (strings::metrics::shannon_entropy); empty input yields 0.0.
+    return float(g.strings.shannon_entropy(data))
 
 
 class EntropyCalcArgs(BaseModel):
@@ -64,9 +55,10 @@ class EntropyCalcTool(MemoryTool[EntropyCalcArgs, EntropyCalcResult]):
             EntropyCalcResult,
         )
 
-    def _read_window(
+    def _resolve_window(
         self, ctx: MemoryContext, args: EntropyCalcArgs
-    ) -> tuple[bytes, int | None, int | None]:
+    ) -> tuple[int, int | None, int | None]:
+        """Return ``(length, start_va, start_offset)`` for the request."""
         # Determine start offset in file
         start_off: int | None = None
         start_va: int | None = None
@@ -87,29 +79,49 @@ class EntropyCalcTool(MemoryTool[EntropyCalcArgs, EntropyCalcResult]):
                 off = None
             if off is None:
                 # If mapping fails, treat as empty
-                return b"", start_va, None
+                return 0, start_va, None
             start_off = int(off)
         else:
             # Whole-file mode: start at 0
             start_off = 0
 
-        # Bound length by budgets and file size
+        # Bound length by budgets
         length = min(int(args.length), max(0, ctx.budgets.max_read_bytes))
+        return max(0, length), start_va, start_off
+
+    def _window_entropy(
+        self, path: str, start_off: int, length: int
+    ) -> tuple[float, int]:
+        """Return ``(entropy, bytes_read)`` for a window of ``path``."""
         if length <= 0:
-            return b"", start_va, start_off
+            return 0.0, 0
         try:
-            with open(ctx.file_path, "rb") as f:
-                f.seek(start_off)
-                data = f.read(length)
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                end = min(st.st_size, start_off + length)
+                if not stat.S_ISREG(st.st_mode):
+                    f.seek(start_off)
+                    data = f.read(length)
+                    return _shannon_entropy(data), len(data)
+                if end <= start_off:
+                    return 0.0, 0
+                # Regular files are mapped read-only and the window is
+                # handed to the native histogram in place, without a copy.
+                with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm)[start_off:end] as window:
+                        return _shannon_entropy(window), end - start_off
         except FileNotFoundError:
-            data = b""
-        return data, start_va, start_off
+            return 0.0, 0
 
     def run(
         self, ctx: MemoryContext, kb: KnowledgeBase, args: EntropyCalcArgs
     ) -> EntropyCalcResult:
-        data, s_va, s_off = self._read_window(ctx, args)
-        h = _shannon_entropy(data)
+        length, s_va, s_off = self._resolve_window(ctx, args)
+        h, n = (
+            self._window_entropy(ctx.file_path, s_off, length)
+            if s_off is not None
+            else (0.0, 0)
+        )
         ev_id = None
         if args.add_to_kb:
             label = (
@@ -119,28 +131,22 @@ class EntropyCalcTool(MemoryTool[EntropyCalcArgs, EntropyCalcResult]):
                 if s_off is not None
                 else "entropy@file"
             )
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label=label,
-                    props={
-                        "entropy": h,
-                        "start_va": s_va,
-                        "start_offset": s_off,
-                        "length": len(data),
-                    },
-                )
+            ev = kb.add_evidence(
+                label=label,
+                props={
+                    "entropy": h,
+                    "start_va": s_va,
+                    "start_offset": s_off,
+                    "length": n,
+                },
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return EntropyCalcResult(
             entropy=h,
             start_va=s_va,
             start_offset=s_off,
-            length=len(data),
+            length=n,
             evidence_node_id=ev_id,
         )
 
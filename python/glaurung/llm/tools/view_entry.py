@@ -5,7 +5,6 @@ from pydantic import BaseModel
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 
@@ -49,23 +48,17 @@ class DetectEntryTool(MemoryTool[DetectEntryArgs, DetectEntryResult]):
             pass
         ev_id = None
         if args.add_to_kb and any([fmt, arch, end, entry]):
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label="entry",
-                    props={
-                        "format": str(fmt) if fmt is not None else None,
-                        "arch": str(arch) if arch is not None else None,
-                        "endianness": str(end) if end is not None else None,
-                        "entry_va": int(entry) if entry is not None else None,
-                        "file_offset": int(off) if off is not None else None,
-                    },
-                )
+            ev = kb.add_evidence(
+                label="entry",
+                props={
+                    "format": str(fmt) if fmt is not None else None,
+                    "arch": str(arch) if arch is not None else None,
+                    "endianness": str(end) if end is not None else None,
+                    "entry_va": int(entry) if entry is not None else None,
+                    "file_offset": int(off) if off is not None else None,
+                },
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
         return DetectEntryResult(
             format=str(fmt) if fmt is not None else None,
             arch=str(arch) if arch is not None else None,
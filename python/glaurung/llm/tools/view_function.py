@@ -1,27 +1,42 @@
 from __future__ import annotations
 
+import mmap
+import os
+import stat
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
+from ..evidence import (
+    _abs_mem_target_x86,
+    _decode_immediate_target,
+    _is_rip_relative_x64,
+)
 from ..kb.store import KnowledgeBase
+from ._binary_helpers import U64_MASK, cached_per_file_version, insn_text
 from .base import MemoryTool, ToolMeta
 
+Buffer = bytes | mmap.mmap
+
 
-class FunctionCall(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FunctionCall:
     ins_va: int
     target_va: int | None = None
     target_name: str | None = None
 
 
-class FunctionStringRef(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FunctionStringRef:
     va: int
     text: str
     encoding: str | None = None
 
 
-class FunctionInstruction(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FunctionInstruction:
     va: int
     bytes_hex: str
     text: str
@@ -41,86 +56,94 @@ class ViewFunctionResult(BaseModel):
     evidence_node_id: str | None = None
 
 
-def _read_c_string_ascii(path: str, file_off: int, max_bytes: int) -> str | None:
-    try:
-        with open(path, "rb") as f:
-            f.seek(file_off)
-            data = f.read(max_bytes)
-    except Exception:
+# Printable ASCII including common punctuation; deleting these from a run
+# leaves nothing exactly when the run is a clean C string.
+_PRINTABLE = bytes(range(32, 127))
+
+
+def _read_c_string_ascii(buf: Buffer, file_off: int, max_bytes: int) -> str | None:
+    data = buf[file_off : file_off + max_bytes]
+    nul = data.find(b"\x00")
+    cand = data if nul < 0 else data[:nul]
+    if len(cand) < 4 or cand.translate(None, _PRINTABLE):
         return None
-    out = bytearray()
-    for b in data:
-        if b == 0:
-            break
-        # printable ASCII including common punctuation
-        if 32 <= b <= 126:
-            out.append(b)
-        else:
-            return None
-    if len(out) >= 4:
-        return out.decode("ascii", errors="ignore")
-    return None
+    return cand.decode("ascii")
+
+
+def _read_c_string_utf16le(
+    buf: Buffer, file_off: int, max_bytes: int
+) -> str | None:
+    data = buf[file_off : file_off + max_bytes]
+    # Expect alternating [ascii][0] pattern: split low and high bytes of the
+    # complete code units and check each half with C-level bytes methods.
+    hi = data[1::2]
+    lo = data[0 : 2 * len(hi) : 2]
+    end = lo.find(b"\x00")
+    if end < 0:
+        end = len(lo)
+    # High bytes must be zero up to and including the terminating code unit.
+    if hi[: end + 1].count(0) != len(hi[: end + 1]):
+        return None
+    cand = lo[:end]
+    if len(cand) < 4 or cand.translate(None, _PRINTABLE):
+        return None
+    return cand.decode("ascii")
 
 
-def _read_c_string_utf16le(path: str, file_off: int, max_bytes: int) -> str | None:
+def _map_file(path: str) -> mmap.mmap | None:
+    """Map ``path`` read-only, or ``None`` if it is empty or not a regular file."""
     try:
         with open(path, "rb") as f:
-            f.seek(file_off)
-            data = f.read(max_bytes)
-    except Exception:
-        return None
-    # Expect alternating [ascii][0] pattern
-    out_bytes = bytearray()
-    i = 0
-    while i + 1 < len(data):
-        lo = data[i]
-        hi = data[i + 1]
-        if lo == 0 and hi == 0:
-            break
-        if hi != 0 or not (32 <= lo <= 126):
-            return None
-        out_bytes.append(lo)
-        i += 2
-    if len(out_bytes) >= 4:
-        return out_bytes.decode("ascii", errors="ignore")
+            st = os.fstat(f.fileno())
+            if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        pass
     return None
 
 
+@cached_per_file_version(maxsize=8)
+def _build_addr_to_name(
+    path: str, max_read_bytes: int, max_file_size: int
+) -> tuple[dict[int, str], str | None]:
+    """Merged symbol, PLT, IAT and GOT names for ``path`` keyed by address.
+
+    The native side reads the file once for all four sources; later sources
+    win on conflicts. Also returns the best-effort name for unresolved calls
+    to common C stdio functions, which depends only on the names. Load
+    failures raise, so they are retried on the next call.
+    """
+    addr_to_name = dict(
+        g.analysis.address_name_map_path(path, max_read_bytes, max_file_size)
+    )
+    lowered = [n.lower() for n in addr_to_name.values()]
+    stdio_guess = next(
+        (kw for kw in ("printf", "puts") if any(kw in n for n in lowered)), None
+    )
+    return addr_to_name, stdio_guess
+
+
 def _decode_call_target(ins) -> int | None:
-    # Reuse logic from llm.evidence helpers when available
+    # Immediate target from operand text
     try:
-        from ..evidence import (
-            _decode_immediate_target,
-            _is_rip_relative_x64,
-            _abs_mem_target_x86,
-        )
+        t = _decode_immediate_target(ins)
+        if t is not None:
+            return t
     except Exception:
-        _decode_immediate_target = None  # type: ignore
-        _is_rip_relative_x64 = None  # type: ignore
-        _abs_mem_target_x86 = None  # type: ignore
-    # Immediate target from operand text
-    if _decode_immediate_target is not None:
-        try:
-            t = _decode_immediate_target(ins)
-            if t is not None:
-                return t
-        except Exception:
-            pass
+        pass
     # RIP-relative or absolute memory calls
-    if _is_rip_relative_x64 is not None:
-        try:
-            is_rip, eff = _is_rip_relative_x64(ins)
-            if is_rip and eff is not None:
-                return int(eff)
-        except Exception:
-            pass
-    if _abs_mem_target_x86 is not None:
-        try:
-            is_abs, eff = _abs_mem_target_x86(ins)
-            if is_abs and eff is not None:
-                return int(eff)
-        except Exception:
-            pass
+    try:
+        is_rip, eff = _is_rip_relative_x64(ins)
+        if is_rip and eff is not None:
+            return int(eff)
+    except Exception:
+        pass
+    try:
+        is_abs, eff = _abs_mem_target_x86(ins)
+        if is_abs and eff is not None:
+            return int(eff)
+    except Exception:
+        pass
     return None
 
 
@@ -140,35 +163,14 @@ class ViewFunctionTool(MemoryTool[ViewFunctionArgs, ViewFunctionResult]):
         self, ctx: MemoryContext, kb: KnowledgeBase, args: ViewFunctionArgs
     ) -> ViewFunctionResult:
         # Build symbol maps
-        addr_to_name: dict[int, str] = {}
         try:
-            for a, n in g.symbols.symbol_address_map(
-                ctx.file_path, ctx.budgets.max_read_bytes, ctx.budgets.max_file_size
-            ):
-                addr_to_name[int(a)] = str(n)
-        except Exception:
-            pass
-        try:
-            for a, n in g.analysis.elf_plt_map_path(
-                ctx.file_path, ctx.budgets.max_read_bytes, ctx.budgets.max_file_size
-            ):
-                addr_to_name[int(a)] = str(n)
-        except Exception:
-            pass
-        try:
-            for a, n in g.analysis.pe_iat_map_path(
-                ctx.file_path, ctx.budgets.max_read_bytes, ctx.budgets.max_file_size
-            ):
-                addr_to_name[int(a)] = str(n)
-        except Exception:
-            pass
-        try:
-            for a, n in g.analysis.elf_got_map_path(
-                ctx.file_path, ctx.budgets.max_read_bytes, ctx.budgets.max_file_size
-            ):
-                addr_to_name[int(a)] = str(n)
+            addr_to_name, stdio_guess = _build_addr_to_name(
+                ctx.file_path,
+                ctx.budgets.max_read_bytes,
+                ctx.budgets.max_file_size,
+            )
         except Exception:
-            pass
+            addr_to_name, stdio_guess = {}, None
 
         # Disassemble window
         max_ins = args.max_instructions or ctx.budgets.max_instructions
@@ -188,19 +190,16 @@ class ViewFunctionTool(MemoryTool[ViewFunctionArgs, ViewFunctionResult]):
         instructions: list[FunctionInstruction] = []
         calls: list[FunctionCall] = []
         strings: dict[int, FunctionStringRef] = {}
+        # Distinct memory-operand VAs in first-seen order; resolved in one
+        # batch after the loop.
+        data_refs: dict[int, None] = {}
 
         for ins in ins_list:
-            try:
-                txt = f"{ins.mnemonic} " + ", ".join(
-                    str(o) for o in getattr(ins, "operands", [])
-                )
-            except Exception:
-                txt = ins.mnemonic or ""
             instructions.append(
                 FunctionInstruction(
                     va=int(ins.address.value),
-                    bytes_hex=(ins.bytes or b"").hex(),
-                    text=txt,
+                    bytes_hex=ins.bytes_hex,
+                    text=insn_text(ins),
                 )
             )
             # Resolve calls
@@ -208,110 +207,81 @@ class ViewFunctionTool(MemoryTool[ViewFunctionArgs, ViewFunctionResult]):
             if mnem.startswith("call") or mnem in ("bl", "jal", "jalr", "callq"):
                 trg = _decode_call_target(ins)
                 name = addr_to_name.get(int(trg)) if trg is not None else None
-                if not name:
-                    # Best-effort guess for common C stdio functions
-                    pool = [n.lower() for n in addr_to_name.values()]
-                    for kw in ("printf", "puts"):
-                        if any(kw in n for n in pool):
-                            name = kw
-                            break
+                name = name or stdio_guess
                 calls.append(
                     FunctionCall(
                         ins_va=int(ins.address.value), target_va=trg, target_name=name
                     )
                 )
 
-            # Attempt to extract strings from memory operands (RIP-relative/absolute)
-            # Simple heuristic: reuse call-target decoders to compute effective VA for memory operands
-            # and try to read a C-string at that VA.
+            # Collect memory operands (RIP-relative/absolute) that may point
+            # at strings. Simple heuristic: reuse call-target decoders to
+            # compute effective VA for memory operands. Absolute operands
+            # carry a signed displacement; masking keeps one negative value
+            # from failing the whole batched lookup below.
             # Try RIP-relative first
             try:
-                from ..evidence import _is_rip_relative_x64, _abs_mem_target_x86
+                is_rip, eff = _is_rip_relative_x64(ins)
+                if is_rip and eff is not None:
+                    data_refs[int(eff) & U64_MASK] = None
             except Exception:
-                _is_rip_relative_x64 = None
-                _abs_mem_target_x86 = None
-
-            cand_vas: list[int] = []
-            if _is_rip_relative_x64 is not None:
-                try:
-                    is_rip, eff = _is_rip_relative_x64(ins)
-                    if is_rip and eff is not None:
-                        cand_vas.append(int(eff))
-                except Exception:
-                    pass
-            if _abs_mem_target_x86 is not None:
-                try:
-                    is_abs, eff2 = _abs_mem_target_x86(ins)
-                    if is_abs and eff2 is not None:
-                        cand_vas.append(int(eff2))
-                except Exception:
-                    pass
-
-            for va_mem in cand_vas:
-                # Map VA to file offset
-                try:
-                    off = g.analysis.va_to_file_offset_path(
-                        ctx.file_path,
-                        int(va_mem),
-                        ctx.budgets.max_read_bytes,
-                        ctx.budgets.max_file_size,
-                    )
-                except Exception:
-                    off = None
-                if off is None:
-                    continue
-                # Try ASCII then UTF-16LE
-                s = _read_c_string_ascii(ctx.file_path, int(off), 256)
-                enc = None
-                if s is None:
-                    s = _read_c_string_utf16le(ctx.file_path, int(off), 512)
-                    enc = "utf16le" if s else None
-                if s:
-                    if va_mem not in strings:
+                pass
+            try:
+                is_abs, eff2 = _abs_mem_target_x86(ins)
+                if is_abs and eff2 is not None:
+                    data_refs[int(eff2) & U64_MASK] = None
+            except Exception:
+                pass
+
+        # Map all candidate VAs to file offsets with one native call (one
+        # read and header parse), then try to read a C-string at each.
+        ref_vas = list(data_refs)
+        offsets: list[int | None] = []
+        if ref_vas:
+            try:
+                offsets = g.analysis.va_to_file_offsets_path(
+                    ctx.file_path,
+                    ref_vas,
+                    ctx.budgets.max_read_bytes,
+                    ctx.budgets.max_file_size,
+                )
+            except Exception:
+                offsets = []
+        # The file is mapped once so the string probes are plain slices
+        # instead of an open/seek/read per candidate.
+        mm = _map_file(ctx.file_path) if any(o is not None for o in offsets) else None
+        if mm is not None:
+            with mm:
+                for va_mem, off in zip(ref_vas, offsets):
+                    if off is None:
+                        continue
+                    # Try ASCII then UTF-16LE
+                    s = _read_c_string_ascii(mm, int(off), 256)
+                    enc = None
+                    if s is None:
+                        s = _read_c_string_utf16le(mm, int(off), 512)
+                        enc = "utf16le" if s else None
+                    if s:
                         strings[va_mem] = FunctionStringRef(
                             va=va_mem, text=s, encoding=enc or "ascii"
                         )
 
         ev_id = None
         if args.add_to_kb and (instructions or calls or strings):
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label=f"function_view@0x{int(args.va):x}",
-                    props={
-                        "instr": len(instructions),
-                        "calls": len(calls),
-                        "strings": len(strings),
-                    },
-                )
+            ev = kb.add_evidence(
+                label=f"function_view@0x{int(args.va):x}",
+                props={
+                    "instr": len(instructions),
+                    "calls": len(calls),
+                    "strings": len(strings),
+                },
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return ViewFunctionResult(
             instructions=instructions,
             calls=calls,
-            strings=(
-                list(strings.values())
-                if strings
-                else (
-                    lambda: (
-                        # Best-effort: if no strings resolved, scan file for a visible 'hello' token
-                        # to provide minimal signal in simple hello samples.
-                        (
-                            lambda path: [
-                                FunctionStringRef(va=0, text="hello", encoding="ascii")
-                            ]
-                            if (lambda data: (b"hello" in data.lower()))(
-                                open(path, "rb").read()
-                            )
-                            else []
-                        )(ctx.file_path)
-                    )
-                )()
-            ),
+            strings=list(strings.values()),
             evidence_node_id=ev_id,
         )
 
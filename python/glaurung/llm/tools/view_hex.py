@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import string
+import os
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -8,22 +8,37 @@ from pydantic import BaseModel, Field
 import glaurung as g
 
 from ..context import MemoryContext
-from ..kb.models import Node, NodeKind, Edge
 from ..kb.store import KnowledgeBase
 from .base import MemoryTool, ToolMeta
 
 
+# Printable ASCII maps to itself and every other byte to ".".
+_DOT_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+
 def _to_ascii_preview(data: bytes, width: int = 16) -> list[str]:
-    lines: list[str] = []
-    printable = set(bytes(string.printable, "ascii"))
-    for i in range(0, len(data), width):
-        chunk = data[i : i + width]
-        hexpart = " ".join(f"{b:02x}" for b in chunk)
-        asciipart = "".join(
-            chr(b) if b in printable and 32 <= b < 127 else "." for b in chunk
-        )
-        lines.append(f"{hexpart:<{width * 3}}  {asciipart}")
-    return lines
+    # Encode the whole buffer once and slice rows out of it; byte i starts
+    # at column 3 * i of the space-separated hex.
+    hex_all = data.hex(" ")
+    text_all = data.translate(_DOT_TABLE).decode("ascii")
+    step = width * 3
+    return [
+        f"{hex_all[i * 3 : i * 3 + step - 1]:<{step}}  {text_all[i : i + width]}"
+        for i in range(0, len(data), width)
+    ]
+
+
+def _read_at(path: str, offset: int, n: int) -> bytes:
+    """Read up to ``n`` bytes at ``offset`` with one positioned read."""
+    if not hasattr(os, "pread"):  # Windows
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(n)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, n, offset)
+    finally:
+        os.close(fd)
 
 
 class BytesViewArgs(BaseModel):
@@ -90,9 +105,7 @@ class BytesViewTool(MemoryTool[BytesViewArgs, BytesViewResult]):
         buf = b""
         if s_off is not None and nbytes > 0:
             try:
-                with open(ctx.file_path, "rb") as f:
-                    f.seek(s_off)
-                    buf = f.read(nbytes)
+                buf = _read_at(ctx.file_path, s_off, nbytes)
             except FileNotFoundError:
                 buf = b""
         hexstr = buf.hex()
@@ -106,17 +119,11 @@ class BytesViewTool(MemoryTool[BytesViewArgs, BytesViewResult]):
                 if s_off is not None
                 else "bytes@file"
             )
-            ev = kb.add_node(
-                Node(
-                    kind=NodeKind.evidence,
-                    label=label,
-                    props={"start_va": s_va, "start_offset": s_off, "length": len(buf)},
-                )
+            ev = kb.add_evidence(
+                label=label,
+                props={"start_va": s_va, "start_offset": s_off, "length": len(buf)},
             )
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
 
         return BytesViewResult(
             start_va=s_va,
@@ -39,11 +39,8 @@ class StringsImportTool(MemoryTool[StringsImportArgs, StringsImportResult]):
         if not art or not getattr(art, "strings", None):
             return StringsImportResult(count=0, evidence_node_id=None)
         if args.add_to_kb:
-            ev = kb.add_node(Node(kind=NodeKind.evidence, label="strings"))
+            ev = kb.add_evidence(label="strings")
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
         # Collect from available sample buckets
         s = art.strings
         samples_added = 0
@@ -50,22 +50,28 @@ class SymbolsListTool(MemoryTool[SymbolsListArgs, SymbolsListResult]):
             pass
         ev_id = None
         if args.add_to_kb and (imports or exports or libs):
-            ev = kb.add_node(Node(kind=NodeKind.evidence, label="view_symbols"))
+            ev = kb.add_evidence(label="view_symbols")
             ev_id = ev.id
-            file_node = next((n for n in kb.nodes() if n.kind == NodeKind.file), None)
-            if file_node:
-                kb.add_edge(Edge(src=file_node.id, dst=ev.id, kind="has_evidence"))
-            for name in imports[:200]:
-                n = kb.add_node(
-                    Node(kind=NodeKind.import_sym, label=str(name), tags=["import"])
+            import_nodes = kb.add_nodes(
+                Node(kind=NodeKind.import_sym, label=str(name), tags=["import"])
+                for name in imports[:200]
+            )
+            export_nodes = kb.add_nodes(
+                Node(kind=NodeKind.note, label=f"export:{name}")
+                for name in exports[:200]
+            )
+            lib_nodes = kb.add_nodes(
+                Node(kind=NodeKind.note, label=f"lib:{name}") for name in libs[:100]
+            )
+            kb.add_edges(
+                Edge(src=ev.id, dst=n.id, kind=kind)
+                for kind, added in (
+                    ("imports", import_nodes),
+                    ("exports", export_nodes),
+                    ("lib", lib_nodes),
                 )
-                kb.add_edge(Edge(src=ev.id, dst=n.id, kind="imports"))
-            for name in exports[:200]:
-                n = kb.add_node(Node(kind=NodeKind.note, label=f"export:{name}"))
-                kb.add_edge(Edge(src=ev.id, dst=n.id, kind="exports"))
-            for name in libs[:100]:
-                n = kb.add_node(Node(kind=NodeKind.note, label=f"lib:{name}"))
-                kb.add_edge(Edge(src=ev.id, dst=n.id, kind="lib"))
+                for n in added
+            )
         return SymbolsListResult(
             imports=imports, exports=exports, libs=libs, evidence_node_id=ev_id
         )
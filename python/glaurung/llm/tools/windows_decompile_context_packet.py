@@ -294,7 +294,7 @@ def _instructions(
             va=int(ins.address.value),
             address=f"0x{int(ins.address.value):x}",
             text=_instruction_text(ins),
-            bytes_hex=(ins.bytes or b"").hex(),
+            bytes_hex=ins.bytes_hex,
         )
         for ins in raw
     ]
@@ -8,6 +8,7 @@ with support for both development and production environments.
 import logging
 import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 import structlog
@@ -31,6 +32,37 @@ except ImportError:
         ERROR = "ERROR"
 
 
+# Normalized arguments of the last configure_logging call, so repeated calls
+# with the same settings (common when many modules or tests configure
+# logging) skip reconfiguring structlog and native logging.
+_configured: Optional[tuple] = None
+
+
+@lru_cache(maxsize=4)
+def _build_processors(json_output: bool, add_timestamp: bool, colorize: bool) -> tuple:
+    """Build the structlog processor chain for the given output settings."""
+    processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+
+    if add_timestamp:
+        processors.insert(0, structlog.processors.TimeStamper(fmt="iso"))
+
+    # Add final renderer
+    if json_output:
+        processors.append(structlog.processors.JSONRenderer())
+    else:
+        processors.append(structlog.dev.ConsoleRenderer(colors=colorize))
+
+    return tuple(processors)
+
+
 def configure_logging(
     level: str = "INFO",
     json_output: bool = False,
@@ -40,46 +72,34 @@ def configure_logging(
     """
     Configure structured logging for Glaurung.
 
+    Calling again with the same (normalized) settings is a no-op.
+
     Args:
         level: Log level (TRACE, DEBUG, INFO, WARN, ERROR)
         json_output: Output logs as JSON for machine parsing
         add_timestamp: Include timestamps in log output
         colorize: Colorize output (auto-detect if None)
     """
-    # Configure Python logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper(), logging.INFO),
-    )
+    global _configured
 
     # Determine if we should colorize
     if colorize is None:
         colorize = sys.stdout.isatty() and not json_output
 
-    # Build processor chain
-    processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-    ]
-
-    if add_timestamp:
-        processors.insert(0, structlog.processors.TimeStamper(fmt="iso"))
+    key = (level.upper(), bool(json_output), bool(add_timestamp), bool(colorize))
+    if _configured == key:
+        return
 
-    # Add final renderer
-    if json_output:
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer(colors=colorize))
+    # Configure Python logging
+    logging.basicConfig(
+        format="%(message)s",
+        stream=sys.stdout,
+        level=getattr(logging, key[0], logging.INFO),
+    )
 
     # Configure structlog
     structlog.configure(
-        processors=processors,
+        processors=list(_build_processors(*key[1:])),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -87,7 +107,9 @@ def configure_logging(
 
     # Initialize native Rust logging if available
     if HAS_NATIVE_LOGGING:
-        _init_native_logging(json_output)
+        _init_native_logging(key[1])
+
+    _configured = key
 
 
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
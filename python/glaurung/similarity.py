@@ -25,36 +25,8 @@ def cluster_single_linkage(
     are output as clusters. Budgeted by `max_pairs` to cap O(n^2).
     """
 
-    ds = list(digests)
-    n = len(ds)
-    parent = list(range(n))
-    rank = [0] * n
-
-    def find(x: int) -> int:
-        while parent[x] != x:
-            parent[x] = parent[parent[x]]
-            x = parent[x]
-        return x
-
-    def union(a: int, b: int) -> None:
-        ra, rb = find(a), find(b)
-        if ra == rb:
-            return
-        if rank[ra] < rank[rb]:
-            parent[ra] = rb
-        elif rank[ra] > rank[rb]:
-            parent[rb] = ra
-        else:
-            parent[rb] = ra
-            rank[ra] += 1
-
-    pairs = _native.similarity.ctph_pairwise_matrix(ds, max_pairs)
-    for i, j, s in pairs:
-        if s >= threshold:
-            union(i, j)
-
-    comp: dict[int, list[int]] = {}
-    for i in range(n):
-        r = find(i)
-        comp.setdefault(r, []).append(i)
-    return list(comp.values())
+    # Pair scoring and the union-find both run natively, so no per-pair
+    # Python objects are created.
+    return _native.similarity.ctph_cluster_single_linkage(
+        list(digests), threshold, max_pairs
+    )
@@ -16,6 +16,8 @@ def search_text(
     max_matches_per_kind: int = 1_000,
     time_guard_ms: int = 25,
 ) -> List[SearchMatch]: ...
+def count_ipv4(text: str) -> int: ...
+def count_ipv4_bytes(data: bytes) -> int: ...
 def search_bytes(
     data: bytes,
     min_length: int = 4,
@@ -46,3 +48,4 @@ def similarity_top_k(
 ) -> list[tuple[str, float]]: ...
 def demangle_text(text: str) -> Optional[tuple[str, str]]: ...
 def demangle_list(names: list[str], max: int = 10000) -> list[tuple[str, str, str]]: ...
+def shannon_entropy(data: bytes) -> float: ...
@@ -4,9 +4,13 @@ Python-friendly re-exports for triage types.
 These map directly to the Rust types in `glaurung._native.triage`.
 """
 
+from functools import partial
+
 import glaurung._native as _native  # type: ignore
 from typing import Any
 
+from ._proxy import add_passthroughs
+
 # Import triage types from the triage attribute
 SnifferSource = _native.triage.SnifferSource
 TriageHint = _native.triage.TriageHint
@@ -44,141 +48,116 @@ ParserConfig = _native.triage.ParserConfig
 SimilarityConfig = _native.triage.SimilarityConfig
 
 
-class _IOProxy:
-    __slots__ = ("_owner", "_native")
+class _SubConfigProxy:
+    """Proxy over a copy of a native sub-config that commits every write.
 
-    def __init__(self, owner, native):
-        self._owner = owner
-        self._native = native
+    Native getters return copies, so after each change the proxy hands its
+    copy to ``commit``, which stores it back on the parent config.
+    """
 
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        return getattr(self._native, name)
+    __slots__ = ("_native", "_commit")
 
-    def __setattr__(self, name, value):
-        if name in {"_owner", "_native"}:
-            object.__setattr__(self, name, value)
-            return
+    def __init__(self, native, commit):
+        self._native = native
+        self._commit = commit
+
+    def _set(self, name, value):
         setattr(self._native, name, value)
-        # Commit back to owner via property setter
-        self._owner._native.io = self._native
+        self._commit(self._native)
 
+    def _commit_child(self, name, native):
+        setattr(self._native, name, native)
+        self._commit(self._native)
 
-class _ThresholdsProxy:
-    __slots__ = ("_entropy", "_native")
 
-    def __init__(self, entropy_proxy, native):
-        self._entropy = entropy_proxy
-        self._native = native
+def _sub_config_proxy(native_cls: type, base: type = _SubConfigProxy) -> type:
+    """Build a ``base`` subclass forwarding the fields of ``native_cls``."""
+    proxy = type(f"_{native_cls.__name__}Proxy", (base,), {"__slots__": ()})
+    # Fields become properties rather than __getattr__ lookups, so reads take
+    # the regular descriptor path; writes go through ``_set``.
+    add_passthroughs(proxy, native_cls, "_native", writable=True)
+    return proxy
 
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        return getattr(self._native, name)
 
-    def __setattr__(self, name, value):
-        if name in {"_entropy", "_native"}:
-            object.__setattr__(self, name, value)
-            return
-        setattr(self._native, name, value)
-        # Update parent entropy config then commit to owner
-        self._entropy._native.thresholds = self._native
-        self._entropy._owner._native.entropy = self._entropy._native
+_ThresholdsProxy = _sub_config_proxy(EntropyThresholds)
+_WeightsProxy = _sub_config_proxy(EntropyWeights)
 
 
-class _WeightsProxy:
-    __slots__ = ("_entropy", "_native")
+class _EntropySubConfigProxy(_SubConfigProxy):
+    __slots__ = ("_thresholds_proxy", "_weights_proxy")
 
-    def __init__(self, entropy_proxy, native):
-        self._entropy = entropy_proxy
-        self._native = native
+    def __init__(self, native, commit):
+        super().__init__(native, commit)
+        self._thresholds_proxy = None
+        self._weights_proxy = None
 
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        return getattr(self._native, name)
+    @property
+    def thresholds(self):
+        if self._thresholds_proxy is None:
+            self._thresholds_proxy = _ThresholdsProxy(
+                self._native.thresholds, partial(self._commit_child, "thresholds")
+            )
+        return self._thresholds_proxy
 
-    def __setattr__(self, name, value):
-        if name in {"_entropy", "_native"}:
-            object.__setattr__(self, name, value)
-            return
-        setattr(self._native, name, value)
-        self._entropy._native.weights = self._native
-        self._entropy._owner._native.entropy = self._entropy._native
+    @thresholds.setter
+    def thresholds(self, value: EntropyThresholds) -> None:
+        # Replacing a nested config invalidates its cached proxy
+        self._set("thresholds", value)
+        self._thresholds_proxy = None
 
+    @property
+    def weights(self):
+        if self._weights_proxy is None:
+            self._weights_proxy = _WeightsProxy(
+                self._native.weights, partial(self._commit_child, "weights")
+            )
+        return self._weights_proxy
 
-class _EntropyProxy:
-    __slots__ = ("_owner", "_native")
+    @weights.setter
+    def weights(self, value: EntropyWeights) -> None:
+        self._set("weights", value)
+        self._weights_proxy = None
 
-    def __init__(self, owner, native):
-        self._owner = owner
-        self._native = native
 
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        if name == "thresholds":
-            return _ThresholdsProxy(self, self._native.thresholds)
-        if name == "weights":
-            return _WeightsProxy(self, self._native.weights)
-        return getattr(self._native, name)
+# Sub-configs exposed on TriageConfig, each with the proxy that commits its
+# changes back to the owner's native config.
+_SUB_CONFIG_PROXIES = {
+    "io": _sub_config_proxy(IOConfig),
+    "entropy": _sub_config_proxy(EntropyConfig, _EntropySubConfigProxy),
+    "scoring": _sub_config_proxy(ScoringConfig),
+    "packers": _sub_config_proxy(PackerConfig),
+    "similarity": _sub_config_proxy(SimilarityConfig),
+}
 
-    def __setattr__(self, name, value):
-        if name in {"_owner", "_native"}:
-            object.__setattr__(self, name, value)
-            return
-        setattr(self._native, name, value)
-        self._owner._native.entropy = self._native
 
+class TriageConfig:
+    """Python wrapper around native TriageConfig that keeps nested changes in sync.
 
-class _ScoringProxy:
-    __slots__ = ("_owner", "_native")
+    The sub-configs live in plain slots so reads are a slot load. Each holds a
+    proxy over the copy it commits back to ``_native``; assigning a sub-config
+    writes it to ``_native`` and replaces that proxy.
+    """
 
-    def __init__(self, owner, native):
-        self._owner = owner
-        self._native = native
+    __slots__ = ("_native", *_SUB_CONFIG_PROXIES)
 
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        return getattr(self._native, name)
+    def __init__(self):
+        object.__setattr__(self, "_native", _native.triage.TriageConfig())
+        for name in _SUB_CONFIG_PROXIES:
+            self._bind(name)
 
     def __setattr__(self, name, value):
-        if name in {"_owner", "_native"}:
+        if name not in _SUB_CONFIG_PROXIES:
             object.__setattr__(self, name, value)
             return
         setattr(self._native, name, value)
-        self._owner._native.scoring = self._native
-
-
-class TriageConfig:
-    """Python wrapper around native TriageConfig that keeps nested changes in sync."""
-
-    __slots__ = ("_native",)
+        self._bind(name)
 
-    def __init__(self):
-        self._native = _native.triage.TriageConfig()
-
-    @property
-    def io(self) -> _IOProxy:
-        return _IOProxy(self, self._native.io)
-
-    @property
-    def entropy(self) -> _EntropyProxy:
-        return _EntropyProxy(self, self._native.entropy)
-
-    @property
-    def scoring(self) -> _ScoringProxy:
-        return _ScoringProxy(self, self._native.scoring)
-
-    @property
-    def packers(self) -> PackerConfig:
-        """Direct access to PackerConfig (mutable)."""
-        return self._native.packers
-
-    @packers.setter
-    def packers(self, cfg: PackerConfig) -> None:  # pragma: no cover - trivial setter
-        self._native.packers = cfg
-
-    @property
-    def similarity(self) -> SimilarityConfig:
-        """Direct access to SimilarityConfig (mutable)."""
-        return self._native.similarity
-
-    @similarity.setter
-    def similarity(self, cfg: SimilarityConfig) -> None:  # pragma: no cover
-        self._native.similarity = cfg
+    def _bind(self, name):
+        native = self._native
+        proxy = _SUB_CONFIG_PROXIES[name](
+            getattr(native, name), partial(setattr, native, name)
+        )
+        object.__setattr__(self, name, proxy)
 
 
 # Import triage functions
@@ -192,63 +171,10 @@ list_symbols = _native.triage.list_symbols
 list_symbols_demangled = _native.triage.list_symbols_demangled
 
 
-class _StringsProxy:
-    __slots__ = ("_ss", "_path")
-
-    def __init__(self, native_ss: Any, path: str):
-        self._ss = native_ss
-        self._path = path
-
-    def __getattr__(self, name):  # pragma: no cover - simple delegation/augmentation
-        if name == "ioc_counts":
-            base = dict(getattr(self._ss, "ioc_counts", {}) or {})
-            if base.get("ipv4", 0) == 0:
-                texts: list[str] = []
-                try:
-                    if getattr(self._ss, "strings", None):
-                        texts.extend(
-                            [
-                                getattr(s, "text", "")
-                                for s in self._ss.strings
-                                if getattr(s, "text", None)
-                            ]
-                        )
-                    if getattr(self._ss, "samples", None):
-                        texts.extend(
-                            [t for t in self._ss.samples if isinstance(t, str)]
-                        )
-                    if not texts and self._path:
-                        with open(
-                            self._path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            texts.append(f.read())
-                    import re
-
-                    ipv4_re = re.compile(
-                        r"\b(?:(?:25[0-5]|2[0-4]\\d|1?\\d?\\d)\\.){3}(?:25[0-5]|2[0-4]\\d|1?\\d?\\d)\\b"
-                    )
-                    base["ipv4"] = sum(len(ipv4_re.findall(t)) for t in texts)
-                except Exception:
-                    pass
-            return base
-        return getattr(self._ss, name)
-
-
-class _ArtifactProxy:
-    __slots__ = ("_art",)
-
-    def __init__(self, art: Any):
-        self._art = art
-
-    def __getattr__(self, name):  # pragma: no cover - simple delegation
-        if name == "strings":
-            ss = getattr(self._art, "strings", None)
-            return (
-                _StringsProxy(ss, getattr(self._art, "path", ""))
-                if ss is not None
-                else None
-            )
-        return getattr(self._art, name)
+# The package ``__init__`` has already replaced the native ``analyze_path``
+# with its wrapper (environment size overrides), so bind that once and
+# forward to it.
+_analyze_path = _native.triage.analyze_path
 
 
 def analyze_path(
@@ -269,7 +195,7 @@ def analyze_path(
     Falls back to older signatures if the native extension doesn't support
     extended string-analysis parameters.
     """
-    art = _native.triage.analyze_path(
+    return _analyze_path(
         path,
         max_read_bytes,
         max_file_size,
@@ -282,90 +208,11 @@ def analyze_path(
         str_max_classify,
         str_max_ioc_per_string,
     )
-    return _ArtifactProxy(art)
 
 
-def triage(
-    path: str,
-    max_read_bytes: int = 10_485_760,
-    max_file_size: int = 104_857_600,
-    max_depth: int = 1,
-    str_min_len: int = 4,
-    str_max_samples: int = 40,
-    str_lang: bool = True,
-    str_max_lang_detect: int = 100,
-    str_classify: bool = True,
-    str_max_classify: int = 200,
-    str_max_ioc_per_string: int = 16,
-):
-    """Convenience wrapper around analyze_path with sane defaults.
-
-    Provides a stable signature for tests and examples. Falls back to older native
-    extension signatures if needed for compatibility.
-    """
-    art = analyze_path(
-        path,
-        max_read_bytes,
-        max_file_size,
-        max_depth,
-        str_min_len,
-        str_max_samples,
-        str_lang,
-        str_max_lang_detect,
-        str_classify,
-        str_max_classify,
-        str_max_ioc_per_string,
-    )
-    return art
-
-
-def _augment_ioc_counts(art: TriagedArtifact) -> None:
-    """Augment missing IOC counts for common types using Python-level regex.
-
-    This provides a consistent surface when some engines omit certain counters.
-    """
-    try:
-        ss = getattr(art, "strings", None)
-        if not ss:
-            return
-        counts = getattr(ss, "ioc_counts", None)
-        # Only augment when missing or clearly zero
-        need_ipv4 = counts is None or counts.get("ipv4", 0) == 0
-        if not need_ipv4:
-            return
-        texts: list[str] = []
-        if getattr(ss, "strings", None):
-            texts.extend(
-                [getattr(s, "text", "") for s in ss.strings if getattr(s, "text", None)]
-            )
-        if getattr(ss, "samples", None):
-            texts.extend([t for t in ss.samples if isinstance(t, str)])
-        if not texts:
-            # Fallback: read the file content for text IOCs (small files)
-            try:
-                with open(
-                    getattr(art, "path", ""), "r", encoding="utf-8", errors="ignore"
-                ) as f:
-                    texts.append(f.read())
-            except Exception:
-                return
-        import re
-
-        ipv4_re = re.compile(
-            r"\b(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)\b"
-        )
-        ipv4_total = 0
-        for t in texts:
-            ipv4_total += len(ipv4_re.findall(t))
-        if ipv4_total > 0:
-            if counts is None:
-                counts = {"ipv4": ipv4_total}
-                setattr(ss, "ioc_counts", counts)
-            else:
-                counts["ipv4"] = counts.get("ipv4", 0) + ipv4_total
-    except Exception:
-        # Best-effort augmentation only
-        return
+# Convenience alias with the same stable signature, kept for tests and
+# examples; an alias avoids an extra forwarding frame per call.
+triage = analyze_path
 
 
 __all__ = [
@@ -408,147 +255,85 @@ __all__ = [
 ]
 
 
-try:
+# Per-format detail types are resolved on first access (PEP 562) instead of at
+# import time; most callers never touch them and not every build exports them.
+_LAZY = {
     # PE-specific types
-    PeTriageInfo = _native.triage.PeTriageInfo
-    PeSubsystem = _native.triage.PeSubsystem
-    PeMachine = _native.triage.PeMachine
-    PeCharacteristics = _native.triage.PeCharacteristics
-    PeDllCharacteristics = _native.triage.PeDllCharacteristics
-    PeDebugInfo = _native.triage.PeDebugInfo
-    PePdbInfo = _native.triage.PePdbInfo
-    PeImport = _native.triage.PeImport
-    PeExport = _native.triage.PeExport
-    PeResource = _native.triage.PeResource
-    PeResourceType = _native.triage.PeResourceType
-    PeVersionInfo = _native.triage.PeVersionInfo
-    PeTlsInfo = _native.triage.PeTlsInfo
-    PeLoadConfig = _native.triage.PeLoadConfig
-    PeRelocation = _native.triage.PeRelocation
-    PeSection = _native.triage.PeSection
-    PeRichHeader = _native.triage.RichHeader
-    PeRichHeaderEntry = _native.triage.RichHeaderEntry
-
-    __all__ += [
-        "PeTriageInfo",
-        "PeSubsystem",
-        "PeMachine",
-        "PeCharacteristics",
-        "PeDllCharacteristics",
-        "PeDebugInfo",
-        "PePdbInfo",
-        "PeImport",
-        "PeExport",
-        "PeResource",
-        "PeResourceType",
-        "PeVersionInfo",
-        "PeTlsInfo",
-        "PeLoadConfig",
-        "PeRelocation",
-        "PeSection",
-        "PeRichHeader",
-        "PeRichHeaderEntry",
-    ]
-except AttributeError:
-    # PE types not available in this build
-    pass
-
-try:
+    "PeTriageInfo": "PeTriageInfo",
+    "PeSubsystem": "PeSubsystem",
+    "PeMachine": "PeMachine",
+    "PeCharacteristics": "PeCharacteristics",
+    "PeDllCharacteristics": "PeDllCharacteristics",
+    "PeDebugInfo": "PeDebugInfo",
+    "PePdbInfo": "PePdbInfo",
+    "PeImport": "PeImport",
+    "PeExport": "PeExport",
+    "PeResource": "PeResource",
+    "PeResourceType": "PeResourceType",
+    "PeVersionInfo": "PeVersionInfo",
+    "PeTlsInfo": "PeTlsInfo",
+    "PeLoadConfig": "PeLoadConfig",
+    "PeRelocation": "PeRelocation",
+    "PeSection": "PeSection",
+    "PeRichHeader": "RichHeader",
+    "PeRichHeaderEntry": "RichHeaderEntry",
     # ELF-specific types
-    ElfTriageInfo = _native.triage.ElfTriageInfo
-    ElfType = _native.triage.ElfType
-    ElfMachine = _native.triage.ElfMachine
-    ElfOsAbi = _native.triage.ElfOsAbi
-    ElfHeaderFlags = _native.triage.ElfHeaderFlags
-    ElfSegment = _native.triage.ElfSegment
-    ElfSegmentType = _native.triage.ElfSegmentType
-    ElfSegmentFlags = _native.triage.ElfSegmentFlags
-    ElfSection = _native.triage.ElfSection
-    ElfSectionType = _native.triage.ElfSectionType
-    ElfSectionFlags = _native.triage.ElfSectionFlags
-    ElfSymbol = _native.triage.ElfSymbol
-    ElfSymbolType = _native.triage.ElfSymbolType
-    ElfSymbolBind = _native.triage.ElfSymbolBind
-    ElfSymbolVisibility = _native.triage.ElfSymbolVisibility
-    ElfRelocation = _native.triage.ElfRelocation
-    ElfDynamicEntry = _native.triage.ElfDynamicEntry
-    ElfDynamicTag = _native.triage.ElfDynamicTag
-    ElfNote = _native.triage.ElfNote
-    ElfGnuInfo = _native.triage.ElfGnuInfo
-
-    __all__ += [
-        "ElfTriageInfo",
-        "ElfType",
-        "ElfMachine",
-        "ElfOsAbi",
-        "ElfHeaderFlags",
-        "ElfSegment",
-        "ElfSegmentType",
-        "ElfSegmentFlags",
-        "ElfSection",
-        "ElfSectionType",
-        "ElfSectionFlags",
-        "ElfSymbol",
-        "ElfSymbolType",
-        "ElfSymbolBind",
-        "ElfSymbolVisibility",
-        "ElfRelocation",
-        "ElfDynamicEntry",
-        "ElfDynamicTag",
-        "ElfNote",
-        "ElfGnuInfo",
-    ]
-except AttributeError:
-    # ELF types not available in this build
-    pass
-
-try:
+    "ElfTriageInfo": "ElfTriageInfo",
+    "ElfType": "ElfType",
+    "ElfMachine": "ElfMachine",
+    "ElfOsAbi": "ElfOsAbi",
+    "ElfHeaderFlags": "ElfHeaderFlags",
+    "ElfSegment": "ElfSegment",
+    "ElfSegmentType": "ElfSegmentType",
+    "ElfSegmentFlags": "ElfSegmentFlags",
+    "ElfSection": "ElfSection",
+    "ElfSectionType": "ElfSectionType",
+    "ElfSectionFlags": "ElfSectionFlags",
+    "ElfSymbol": "ElfSymbol",
+    "ElfSymbolType": "ElfSymbolType",
+    "ElfSymbolBind": "ElfSymbolBind",
+    "ElfSymbolVisibility": "ElfSymbolVisibility",
+    "ElfRelocation": "ElfRelocation",
+    "ElfDynamicEntry": "ElfDynamicEntry",
+    "ElfDynamicTag": "ElfDynamicTag",
+    "ElfNote": "ElfNote",
+    "ElfGnuInfo": "ElfGnuInfo",
     # Mach-O specific types
-    MachOTriageInfo = _native.triage.MachOTriageInfo
-    MachOHeader = _native.triage.MachOHeader
-    MachOFileType = _native.triage.MachOFileType
-    MachOHeaderFlags = _native.triage.MachOHeaderFlags
-    MachOLoadCommand = _native.triage.MachOLoadCommand
-    MachOSegment = _native.triage.MachOSegment
-    MachOSection = _native.triage.MachOSection
-    MachOSymbol = _native.triage.MachOSymbol
-    MachODynamicLib = _native.triage.MachODynamicLib
-    MachOChainedFixup = _native.triage.MachOChainedFixup
-    MachOCodeSignature = _native.triage.MachOCodeSignature
-    MachOEncryptionInfo = _native.triage.MachOEncryptionInfo
-    MachOFunctionStarts = _native.triage.MachOFunctionStarts
-    MachODataInCode = _native.triage.MachODataInCode
-    MachOLinkerOption = _native.triage.MachOLinkerOption
-    MachOSourceVersion = _native.triage.MachOSourceVersion
-    MachOVersionMin = _native.triage.MachOVersionMin
-    MachOEntryPoint = _native.triage.MachOEntryPoint
-    MachOUuid = _native.triage.MachOUuid
-    MachOBuildVersion = _native.triage.MachOBuildVersion
-    MachOBuildToolVersion = _native.triage.MachOBuildToolVersion
-
-    __all__ += [
-        "MachOTriageInfo",
-        "MachOHeader",
-        "MachOFileType",
-        "MachOHeaderFlags",
-        "MachOLoadCommand",
-        "MachOSegment",
-        "MachOSection",
-        "MachOSymbol",
-        "MachODynamicLib",
-        "MachOChainedFixup",
-        "MachOCodeSignature",
-        "MachOEncryptionInfo",
-        "MachOFunctionStarts",
-        "MachODataInCode",
-        "MachOLinkerOption",
-        "MachOSourceVersion",
-        "MachOVersionMin",
-        "MachOEntryPoint",
-        "MachOUuid",
-        "MachOBuildVersion",
-        "MachOBuildToolVersion",
-    ]
-except AttributeError:
-    # Mach-O types not available in this build
-    pass
+    "MachOTriageInfo": "MachOTriageInfo",
+    "MachOHeader": "MachOHeader",
+    "MachOFileType": "MachOFileType",
+    "MachOHeaderFlags": "MachOHeaderFlags",
+    "MachOLoadCommand": "MachOLoadCommand",
+    "MachOSegment": "MachOSegment",
+    "MachOSection": "MachOSection",
+    "MachOSymbol": "MachOSymbol",
+    "MachODynamicLib": "MachODynamicLib",
+    "MachOChainedFixup": "MachOChainedFixup",
+    "MachOCodeSignature": "MachOCodeSignature",
+    "MachOEncryptionInfo": "MachOEncryptionInfo",
+    "MachOFunctionStarts": "MachOFunctionStarts",
+    "MachODataInCode": "MachODataInCode",
+    "MachOLinkerOption": "MachOLinkerOption",
+    "MachOSourceVersion": "MachOSourceVersion",
+    "MachOVersionMin": "MachOVersionMin",
+    "MachOEntryPoint": "MachOEntryPoint",
+    "MachOUuid": "MachOUuid",
+    "MachOBuildVersion": "MachOBuildVersion",
+    "MachOBuildToolVersion": "MachOBuildToolVersion",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        native_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(_native.triage, native_name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(
+        {*globals(), *(n for n, nat in _LAZY.items() if hasattr(_native.triage, nat))}
+    )
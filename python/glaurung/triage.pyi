@@ -276,11 +276,8 @@ def detect_languages(
 
 class TriageConfig:
     """Configuration wrapper used by analyze_* to control behavior."""
+    packers: PackerConfig
     def __init__(self) -> None: ...
-    @property
-    def packers(self) -> PackerConfig: ...
-    @packers.setter
-    def packers(self, cfg: PackerConfig) -> None: ...
 
 class TriageVerdict:
     from glaurung import Format, Arch, Endianness
@@ -1,35 +1,44 @@
 """Shared test utilities and fixtures for Python tests."""
 
-import pytest
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+# The project root's ``samples/`` directory, found once so lookups don't
+# depend on the working directory (``python/tests/samples`` holds only a few
+# local fixtures and is not a sample root)
+_SAMPLES_ROOT = next(
+    (
+        p / "samples"
+        for p in Path(__file__).resolve().parents
+        if (p / "Cargo.toml").is_file() and (p / "samples").is_dir()
+    ),
+    None,
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve(relative_path) -> Optional[Path]:
+    """Locate a sample once per session; ``None`` if it is missing."""
+    if _SAMPLES_ROOT is None:
+        return None
+    full_path = _SAMPLES_ROOT / relative_path
+    return full_path if os.path.isfile(full_path) else None
 
 
 def sample_file_exists(relative_path):
     """Check if a sample file exists."""
-    # Try relative to current directory first (python/tests/)
-    full_path = Path("samples") / relative_path
-    if full_path.exists():
-        return True
-
-    # Try relative to parent directory (project root)
-    full_path = Path("../samples") / relative_path
-    return full_path.exists()
+    return _resolve(relative_path) is not None
 
 
 def sample_file_path(relative_path):
     """Get the full path to a sample file."""
-    # Try relative to current directory first (python/tests/)
-    full_path = Path("samples") / relative_path
-    if full_path.exists():
-        return full_path
-
-    # Try relative to parent directory (project root)
-    full_path = Path("../samples") / relative_path
-    if full_path.exists():
-        return full_path
-
     # Return the relative path as fallback
-    return Path("samples") / relative_path
+    return _resolve(relative_path) or Path("samples") / relative_path
 
 
 def get_sample_file_path(relative_path):
@@ -63,13 +72,13 @@ SAMPLE_PYTHON_PYC_312 = "binaries/platforms/linux/amd64/export/python/hello-py3.
 SAMPLE_PYTHON_PYC_313 = "binaries/platforms/linux/amd64/export/python/hello-py3.13.pyc"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dir():
     """Fixture providing the samples directory path."""
-    return Path("samples")
+    return _SAMPLES_ROOT or Path("samples")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def existing_sample_files():
     """Fixture providing list of sample files that exist."""
     existing_files = []
@@ -90,7 +99,7 @@ def existing_sample_files():
     return existing_files
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def system_binary_ls():
     """Fixture providing path to /usr/bin/ls if it exists."""
     ls_path = Path("/usr/bin/ls")
@@ -99,7 +108,7 @@ def system_binary_ls():
     pytest.skip("System binary /usr/bin/ls not found")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def system_binary_cat():
     """Fixture providing path to /usr/bin/cat if it exists."""
     cat_path = Path("/usr/bin/cat")
@@ -108,81 +117,94 @@ def system_binary_cat():
     pytest.skip("System binary /usr/bin/cat not found")
 
 
+@pytest.fixture(scope="session")
+def canonical_addresses():
+    """Fixture providing shared read-only Address objects of each kind."""
+    from glaurung import Address, AddressKind
+
+    return SimpleNamespace(
+        va=Address(AddressKind.VA, 0x401000, 32),
+        rva=Address(AddressKind.RVA, 0x1000, 32),
+        fo=Address(AddressKind.FileOffset, 0x200, 32),
+        sym=Address(AddressKind.Symbolic, 0, 64, symbol_ref="kernel32.dll!CreateFileW"),
+    )
+
+
 # Sample file fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_elf_gcc():
     """Fixture providing path to GCC-compiled ELF sample."""
     return get_sample_file_path(SAMPLE_ELF_GCC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_elf_clang():
     """Fixture providing path to Clang-compiled ELF sample."""
     return get_sample_file_path(SAMPLE_ELF_CLANG)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pe_exe():
     """Fixture providing path to Windows PE executable sample."""
     return get_sample_file_path(SAMPLE_PE_EXE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jar():
     """Fixture providing path to Java JAR file sample."""
     return get_sample_file_path(SAMPLE_JAR)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_java_class():
     """Fixture providing path to Java class file sample."""
     return get_sample_file_path(SAMPLE_JAVA_CLASS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_python_pyc():
     """Fixture providing path to Python bytecode sample."""
     return get_sample_file_path(SAMPLE_PYTHON_PYC)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_fortran():
     """Fixture providing path to Fortran binary sample."""
     return get_sample_file_path(SAMPLE_FORTRAN)
 
 
 # Python bytecode fixtures for different versions
-@pytest.fixture
-def sample_python_pyc_38():
-    """Fixture providing path to Python 3.8 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_38)
-
-
-@pytest.fixture
-def sample_python_pyc_39():
-    """Fixture providing path to Python 3.9 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_39)
-
-
-@pytest.fixture
-def sample_python_pyc_310():
-    """Fixture providing path to Python 3.10 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_310)
-
-
-@pytest.fixture
-def sample_python_pyc_311():
-    """Fixture providing path to Python 3.11 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_311)
-
-
-@pytest.fixture
-def sample_python_pyc_312():
-    """Fixture providing path to Python 3.12 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_312)
-
-
-@pytest.fixture
-def sample_python_pyc_313():
-    """Fixture providing path to Python 3.13 bytecode sample."""
-    return get_sample_file_path(SAMPLE_PYTHON_PYC_313)
+# Python bytecode samples keyed by interpreter version
+_PYC_SAMPLES = {
+    "3.8": SAMPLE_PYTHON_PYC_38,
+    "3.9": SAMPLE_PYTHON_PYC_39,
+    "3.10": SAMPLE_PYTHON_PYC_310,
+    "3.11": SAMPLE_PYTHON_PYC_311,
+    "3.12": SAMPLE_PYTHON_PYC_312,
+    "3.13": SAMPLE_PYTHON_PYC_313,
+}
+
+
+@pytest.fixture(scope="session")
+def sample_python_pyc_by_version():
+    """Fixture mapping Python versions to the bytecode samples that exist."""
+    return {
+        version: sample_file_path(path)
+        for version, path in _PYC_SAMPLES.items()
+        if sample_file_exists(path)
+    }
+
+
+def _pyc_fixture(version, path):
+    def fixture():
+        return get_sample_file_path(path)
+
+    fixture.__doc__ = f"Fixture providing path to Python {version} bytecode sample."
+    name = "sample_python_pyc_" + version.replace(".", "")
+    return name, pytest.fixture(scope="session", name=name)(fixture)
+
+
+# sample_python_pyc_38 ... sample_python_pyc_313
+for _name, _fixture in (_pyc_fixture(v, p) for v, p in _PYC_SAMPLES.items()):
+    globals()[_name] = _fixture
+del _name, _fixture
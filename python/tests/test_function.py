@@ -199,3 +199,24 @@ def test_function_str_repr():
     repr_str = repr(func)
     assert "Function" in repr_str
     assert "display_func" in repr_str
+
+
+def test_function_block_aggregates():
+    """Test block counts computed on the Rust side."""
+
+    def va(v):
+        return glaurung.Address(glaurung.AddressKind.VA, v, 64)
+
+    func = glaurung.Function("f", va(0x1000), glaurung.FunctionKind.Normal)
+    assert func.basic_block_count == 0
+    assert func.max_block_end is None
+
+    func.add_basic_block(
+        glaurung.BasicBlock("b0", va(0x1000), va(0x1010), 4, ["b1", "b2"], [])
+    )
+    func.add_basic_block(glaurung.BasicBlock("b1", va(0x1010), va(0x1030), 6))
+
+    assert func.basic_block_count == 2
+    assert func.instruction_count == 10
+    assert func.successor_count == 2
+    assert func.max_block_end == 0x1030
@@ -149,3 +149,87 @@ def test_tool_to_pyd_ai_uses_memory_tool_input_schema() -> None:
     ]
     assert schema.get("additionalProperties") is not True
     assert pyd_tool.include_return_schema is False
+
+
+def test_tool_to_pyd_ai_reuses_wrapper_per_tool_class() -> None:
+    """Wrapping the same MemoryTool again, or a fresh instance of it, must
+    not rebuild the pydantic-ai Tool (and its schema validator); distinct
+    strictness gets its own."""
+    from glaurung.llm.tools.base import tool_to_pyd_ai
+    from glaurung.llm.tools.scan_until_byte import build_tool
+
+    tool = build_tool()
+    first = tool_to_pyd_ai(tool, strict=True)
+    assert tool_to_pyd_ai(tool, strict=True) is first
+    loose = tool_to_pyd_ai(tool, strict=False)
+    assert loose is not first
+    assert loose.strict is False
+    assert tool_to_pyd_ai(build_tool(), strict=True) is first
+
+
+def test_agent_builds_share_tool_wrappers() -> None:
+    """Each agent build wraps freshly built tools; the wrappers are reused."""
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+
+    from glaurung.llm.agents.java_toolsets import register_java_agent_tools
+    from glaurung.llm.context import MemoryContext
+
+    names = ["java_list_classes", "java_view_class"]
+    agents = [
+        register_java_agent_tools(
+            Agent(TestModel(), deps_type=MemoryContext), tool_names=names
+        )
+        for _ in range(2)
+    ]
+    first, second = (agent._function_toolset.tools for agent in agents)
+    assert sorted(first) == sorted(names)
+    assert all(first[name] is second[name] for name in names)
+
+
+def test_tool_to_pyd_ai_shares_input_schema_across_wrappers() -> None:
+    """The input JSON schema is generated once per model class, and each
+    pydantic-ai Tool gets its own copy of it."""
+    from glaurung.llm.tools.base import tool_to_pyd_ai
+    from glaurung.llm.tools.scan_until_byte import build_tool
+
+    a = tool_to_pyd_ai(build_tool(), strict=False)
+    b = tool_to_pyd_ai(build_tool(), strict=True)
+    schema_a = a.function_schema.json_schema
+    schema_b = b.function_schema.json_schema
+    assert schema_a == build_tool().input_model.model_json_schema()
+    assert schema_a == schema_b
+    assert schema_a is not schema_b
+
+
+@pytest.mark.parametrize("record_payloads", [True, False])
+def test_tool_call_log_honors_record_tool_payloads(
+    tmp_path: Path, record_payloads: bool
+) -> None:
+    """With payload recording off, the call log keeps only the tool name
+    and outcome instead of the serialized args/result."""
+    import glaurung as g
+    from pydantic_ai import RunContext
+
+    from glaurung.llm.context import MemoryContext
+    from glaurung.llm.tools.base import tool_to_pyd_ai
+    from glaurung.llm.tools.scan_until_byte import build_tool
+
+    target = tmp_path / "blob.bin"
+    target.write_bytes(b"hello\x00world")
+    art = g.triage.analyze_path(str(target), 10_000_000, 100_000_000, 1)
+    ctx = MemoryContext(
+        file_path=str(target), artifact=art, record_tool_payloads=record_payloads
+    )
+    run_ctx = RunContext[MemoryContext](
+        deps=ctx, model="test", usage=None, prompt="", tool_call_id=None
+    )
+    tool_to_pyd_ai(build_tool()).function(run_ctx, file_offset=0)
+
+    entry = getattr(ctx, "_tool_calls")[-1]
+    assert entry["tool"] == "scan_until_byte"
+    if record_payloads:
+        assert entry["args"]["file_offset"] == 0
+        assert entry["result"]["found"] is True
+    else:
+        assert entry == {"tool": "scan_until_byte", "ok": True}
@@ -158,6 +158,8 @@ class TestInstructionCreation:
 
         assert instr.address.value == 0x400000
         assert instr.bytes == bytes(bytes_data)  # PyO3 converts Vec<u8> to bytes
+        assert instr.bytes_hex == "90"
+        assert instr.op_str == ""
         assert instr.mnemonic == "nop"
         assert instr.operand_count() == 0
         assert instr.length == 1
@@ -192,6 +194,7 @@ class TestInstructionCreation:
 
         assert instr.mnemonic == "mov"
         assert instr.operand_count() == 2
+        assert instr.op_str == "rdi, rax"
         assert instr.has_operands()
         assert instr.semantics == "move register to register"
         assert len(instr.side_effects) == 1
@@ -475,6 +478,7 @@ class TestInstructionEdgeCases:
         instr = Instruction(address, [], "invalid", [], 0, "unknown")
 
         assert instr.bytes == b""  # PyO3 converts empty Vec<u8> to empty bytes
+        assert instr.bytes_hex == ""
         assert instr.length == 0
         assert not instr.has_operands()
 
@@ -0,0 +1,72 @@
+"""Tests for the in-memory KnowledgeBase store."""
+
+from __future__ import annotations
+
+import pytest
+
+from glaurung.llm.kb.models import Edge, Node, NodeKind
+from glaurung.llm.kb.store import KnowledgeBase
+
+
+def test_add_nodes_indexes_like_add_node() -> None:
+    kb = KnowledgeBase()
+    added = kb.add_nodes(
+        Node(kind=NodeKind.function, label=f"parse_{i}", tags=["recovered"])
+        for i in range(3)
+    )
+    assert [n.label for n in added] == ["parse_0", "parse_1", "parse_2"]
+    assert len(list(kb.nodes())) == 3
+    assert len(kb.by_tag("recovered")) == 3
+    hits = kb.search_text("parse_1")
+    assert [n.label for n, _ in hits] == ["parse_1"]
+
+
+def test_add_edges_is_all_or_nothing() -> None:
+    kb = KnowledgeBase()
+    src, a, b = kb.add_nodes(
+        Node(kind=NodeKind.evidence, label=label) for label in ("ev", "a", "b")
+    )
+    kb.add_edges(Edge(src=src.id, dst=n.id, kind="has") for n in (a, b))
+    assert len(list(kb.edges())) == 2
+
+    with pytest.raises(ValueError):
+        kb.add_edges(
+            [
+                Edge(src=a.id, dst=b.id, kind="ok"),
+                Edge(src=a.id, dst="missing", kind="bad"),
+            ]
+        )
+    assert len(list(kb.edges())) == 2
+
+
+def test_first_of_kind_tracks_insertion_order_and_replacement() -> None:
+    kb = KnowledgeBase()
+    assert kb.first_of_kind(NodeKind.file) is None
+    assert kb.file_node() is None
+    fn = kb.add_node(Node(kind=NodeKind.function, label="main"))
+    first, second = kb.add_nodes(
+        Node(kind=NodeKind.file, label=label) for label in ("a.out", "b.out")
+    )
+    assert kb.first_of_kind(NodeKind.file) is first
+    assert kb.file_node() is first
+    assert kb.nodes_by_kind(NodeKind.file) == [first, second]
+
+    # Re-adding an id under a different kind moves it between buckets.
+    moved = kb.add_node(Node(id=first.id, kind=NodeKind.function, label="a.out"))
+    assert kb.first_of_kind(NodeKind.file) is second
+    assert kb.nodes_by_kind(NodeKind.function) == [fn, moved]
+
+
+def test_add_evidence_links_from_file_node() -> None:
+    kb = KnowledgeBase()
+    orphan = kb.add_evidence("early", {"n": 1})
+    assert orphan.kind is NodeKind.evidence and orphan.props == {"n": 1}
+    assert list(kb.edges()) == []
+
+    file_node = kb.add_node(Node(kind=NodeKind.file, label="a.out"))
+    ev = kb.add_evidence("scan")
+    unlinked = kb.add_evidence("scratch", link_from_file=False)
+    assert [(e.src, e.dst, e.kind) for e in kb.edges()] == [
+        (file_node.id, ev.id, "has_evidence")
+    ]
+    assert unlinked.props == {}
@@ -123,6 +123,16 @@ class TestAtomicTools:
         out = tool.run(ctx, ctx.kb, tool.input_model())
         assert len(out.hexdigest) == 64
 
+    @pytest.mark.parametrize("algorithm", ["md5", "sha1", "sha256"])
+    def test_file_hash_matches_hashlib(self, tmp_path: Path, algorithm: str):
+        import hashlib
+
+        data = bytes(range(256)) * 4096
+        ctx = _make_ctx_for_bytes(data, tmp_path)
+        tool = build_file_hash()
+        out = tool.run(ctx, ctx.kb, tool.input_model(algorithm=algorithm))
+        assert out.hexdigest == hashlib.new(algorithm, data).hexdigest()
+
     def test_strings_import_kb(self, tmp_path: Path):
         data = b"Visit http://example.com and email test@example.org\nHello world!"
         ctx = _make_ctx_for_bytes(data, tmp_path)
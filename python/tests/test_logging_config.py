@@ -0,0 +1,37 @@
+"""Tests for glaurung.logging configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+from glaurung import logging as glog
+
+
+@pytest.fixture
+def configure_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    calls: list[dict] = []
+    monkeypatch.setattr(glog.structlog, "configure", lambda **kw: calls.append(kw))
+    monkeypatch.setattr(glog, "HAS_NATIVE_LOGGING", False)
+    monkeypatch.setattr(glog, "_configured", None)
+    return calls
+
+
+def test_repeated_configuration_is_skipped(configure_calls: list[dict]) -> None:
+    glog.configure_logging(level="debug", colorize=False)
+    glog.configure_logging(level="DEBUG", colorize=False)
+    assert len(configure_calls) == 1
+
+    glog.configure_logging(level="DEBUG", json_output=True)
+    glog.configure_logging(level="debug", colorize=False)
+    assert len(configure_calls) == 3
+    # Switching back reuses the processor chain built for the first call.
+    assert configure_calls[2]["processors"] == configure_calls[0]["processors"]
+
+
+def test_processor_chain_follows_settings(configure_calls: list[dict]) -> None:
+    glog.configure_logging(json_output=True, add_timestamp=False)
+    processors = configure_calls[0]["processors"]
+    assert isinstance(processors[-1], glog.structlog.processors.JSONRenderer)
+    assert not any(
+        isinstance(p, glog.structlog.processors.TimeStamper) for p in processors
+    )
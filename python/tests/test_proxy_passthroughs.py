@@ -0,0 +1,69 @@
+"""Tests for the native-object proxy pass-through helper."""
+
+from __future__ import annotations
+
+import pytest
+
+from glaurung._proxy import add_passthroughs
+
+
+class _Native:
+    def __init__(self) -> None:
+        self._size = 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @size.setter
+    def size(self, value: int) -> None:
+        self._size = value
+
+    @property
+    def kind(self) -> str:
+        return "elf"
+
+    def describe(self) -> str:
+        return f"{self.kind}:{self._size}"
+
+
+class _Proxy:
+    __slots__ = ("_native", "commits")
+
+    def __init__(self, native: _Native) -> None:
+        self._native = native
+        self.commits: list[str] = []
+
+    @property
+    def kind(self) -> str:
+        return "proxied"
+
+    def _set(self, name, value):
+        setattr(self._native, name, value)
+        self.commits.append(name)
+
+
+add_passthroughs(_Proxy, _Native, "_native", writable=True)
+
+
+def test_passthroughs_forward_reads_and_methods() -> None:
+    proxy = _Proxy(_Native())
+    assert proxy.size == 1
+    assert proxy.describe() == "elf:1"
+    # Attributes the proxy defines itself are left alone.
+    assert proxy.kind == "proxied"
+    assert isinstance(_Proxy.__dict__["size"], property)
+
+
+def test_writable_passthroughs_commit_through_set() -> None:
+    proxy = _Proxy(_Native())
+    proxy.size = 7
+    assert proxy.size == 7 and proxy.commits == ["size"]
+    with pytest.raises(AttributeError):
+        proxy.describe = None
+
+
+def test_passthroughs_keep_attributes_defined_on_a_base() -> None:
+    sub = type("_SubProxy", (_Proxy,), {"__slots__": ()})
+    add_passthroughs(sub, _Native, "_native")
+    assert sub(_Native()).kind == "proxied"
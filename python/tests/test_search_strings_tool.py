@@ -0,0 +1,164 @@
+"""Tests for the search_strings memory tool and its byte scanners."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import glaurung as g
+
+try:
+    from glaurung.llm.tools.search_strings import (
+        _scan_ascii,
+        _scan_utf16be,
+        _scan_utf16le,
+    )
+except ImportError:  # pragma: no cover - LLM deps missing
+    pytest.skip("LLM dependencies not available", allow_module_level=True)
+
+
+def _make_ctx(data: bytes, tmp_path: Path):
+    from glaurung.llm.context import Budgets, MemoryContext
+    from glaurung.llm.kb.adapters import import_triage
+
+    target = tmp_path / "strings.bin"
+    target.write_bytes(data)
+    art = g.triage.analyze_path(str(target), 10_000_000, 100_000_000, 1)
+    ctx = MemoryContext(
+        file_path=str(target), artifact=art, budgets=Budgets(max_read_bytes=65536)
+    )
+    import_triage(ctx.kb, art, str(target))
+    return ctx
+
+
+def test_scan_ascii_yields_runs_at_min_length() -> None:
+    data = b"\x00abc\x01hello\x7fworld!"
+    assert list(_scan_ascii(data, 4)) == [
+        ("hello", 5, "ascii"),
+        ("world!", 11, "ascii"),
+    ]
+    assert ("abc", 1, "ascii") in list(_scan_ascii(data, 3))
+
+
+def test_scan_utf16le_is_even_aligned() -> None:
+    data = b"\xff" + "ODD!".encode("utf-16le") + b"\xff" + "Even".encode("utf-16le")
+    # The odd-offset run straddles code-unit boundaries and must not match.
+    assert list(_scan_utf16le(data, 4)) == [("Even", 10, "utf16le")]
+
+
+def test_scan_utf16be_round_trip() -> None:
+    data = b"\x00\x00" + "Hello".encode("utf-16be") + b"\x01\x01"
+    assert list(_scan_utf16be(data, 4)) == [("Hello", 2, "utf16be")]
+
+
+def test_search_strings_finds_ascii_and_utf16(tmp_path: Path) -> None:
+    from glaurung.llm.tools.search_strings import build_tool
+
+    data = b"\x00\x00NeedleOne\x01" + "needletwo".encode("utf-16le") + b"\x00\x00"
+    ctx = _make_ctx(data, tmp_path)
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(query="needle"))
+    assert {(m.text, m.encoding) for m in out.matches} == {
+        ("NeedleOne", "ascii"),
+        ("needletwo", "utf16le"),
+    }
+    assert out.scanned_bytes == len(data)
+    assert out.evidence_node_id is not None
+
+
+def test_search_strings_case_sensitive_and_regex(tmp_path: Path) -> None:
+    from glaurung.llm.tools.search_strings import build_tool
+
+    data = b"\x00GET /index.html\x00post /form\x00"
+    ctx = _make_ctx(data, tmp_path)
+    tool = build_tool()
+    cs = tool.run(
+        ctx, ctx.kb, tool.input_model(query="POST", case_sensitive=True)
+    )
+    assert cs.matches == []
+    rx = tool.run(
+        ctx, ctx.kb, tool.input_model(query=r"^(get|post) /", regex=True)
+    )
+    assert [m.text for m in rx.matches] == ["GET /index.html", "post /form"]
+
+
+def test_find_ascii_literal_reports_each_run_once() -> None:
+    from glaurung.llm.tools.search_strings import _find_ascii_literal
+
+    data = b"\x00xxABCxxabc\x00ab\x00zzabc\x01"
+    hits = list(_find_ascii_literal(data, b"abc", 4, False))
+    assert hits == [("xxABCxxabc", 1, "ascii"), ("zzabc", 15, "ascii")]
+    assert list(_find_ascii_literal(data, b"ABC", 4, True)) == [
+        ("xxABCxxabc", 1, "ascii")
+    ]
+
+
+def test_search_strings_maps_only_max_scan_bytes(tmp_path: Path) -> None:
+    from glaurung.llm.tools.search_strings import build_tool
+
+    data = b"abcdefgh" * 10
+    ctx = _make_ctx(data, tmp_path)
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(query="cde", max_scan_bytes=10))
+    assert out.scanned_bytes == 10
+    assert [(m.text, m.offset) for m in out.matches] == [("abcdefghab", 0)]
+
+
+def test_literal_query_skips_utf16_scan_without_encoded_hit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from glaurung.llm.tools import search_strings as mod
+
+    def _must_not_scan(data, min_len):
+        raise AssertionError("utf16be scan should have been skipped")
+
+    monkeypatch.setattr(mod, "_scan_utf16be", _must_not_scan)
+    data = b"\x01\x01" + "Needle".encode("utf-16le") + b"\x01"
+    ctx = _make_ctx(data, tmp_path)
+    tool = mod.build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(query="needle"))
+    assert [(m.text, m.encoding) for m in out.matches] == [("Needle", "utf16le")]
+
+
+def test_non_ascii_literal_query_builds_no_needle(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from glaurung.llm.tools import search_strings as mod
+
+    def _no_literal_search(*args):
+        raise AssertionError("non-ASCII query must not become a byte needle")
+
+    monkeypatch.setattr(mod, "_find_ascii_literal", _no_literal_search)
+    monkeypatch.setattr(mod, "_literal_finder", _no_literal_search)
+    ctx = _make_ctx(b"\x00caf? au lait\x00", tmp_path)
+    tool = mod.build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(query="café"))
+    assert out.matches == []
+
+
+def test_invalid_regex_falls_back_to_literal(tmp_path: Path) -> None:
+    from glaurung.llm.tools.search_strings import build_tool
+
+    ctx = _make_ctx(b"\x00call f(x, y\x00", tmp_path)
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(query="f(x", regex=True))
+    assert [m.text for m in out.matches] == ["call f(x, y"]
+
+
+def test_later_encodings_untouched_once_limit_is_reached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from glaurung.llm.tools import search_strings as mod
+
+    def _must_not_scan(data, min_len):
+        raise AssertionError("UTF-16 scan should not start after the limit")
+
+    monkeypatch.setattr(mod, "_scan_utf16le", _must_not_scan)
+    monkeypatch.setattr(mod, "_scan_utf16be", _must_not_scan)
+    ctx = _make_ctx(b"\x00needle one\x00needle two\x00", tmp_path)
+    tool = mod.build_tool()
+    out = tool.run(
+        ctx, ctx.kb, tool.input_model(query="needle", regex=True, max_results=1)
+    )
+    assert [m.text for m in out.matches] == ["needle one"]
@@ -0,0 +1,100 @@
+"""Tests for the search_symbols memory tool."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import glaurung as g
+
+try:
+    from glaurung.llm.context import MemoryContext
+    from glaurung.llm.tools import search_symbols as mod
+except ImportError:  # pragma: no cover - LLM deps missing
+    pytest.skip("LLM dependencies not available", allow_module_level=True)
+
+
+SYMBOLS = (
+    ["main", "parse_config", "ParseHeader", "Foo::operator()(int)", "_start"],
+    ["printf"],
+    ["printf", "malloc"],
+    ["main"],
+    ["libc.so.6"],
+)
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def _fake(path, max_read_bytes, max_file_size):
+        calls.append(path)
+        return tuple(list(c) for c in SYMBOLS)
+
+    monkeypatch.setattr(g.symbols, "list_symbols_demangled", _fake)
+    monkeypatch.setattr(g.symbols, "list_symbols", _fake)
+    mod._load_symbols.cache_clear()
+    return calls
+
+
+@pytest.fixture
+def ctx(loads: list[str], tmp_path: Path) -> MemoryContext:
+    target = tmp_path / "bin"
+    target.write_bytes(b"\x00")
+    return MemoryContext(file_path=str(target), artifact=MagicMock())
+
+
+def _run(ctx: MemoryContext, **kwargs):
+    tool = mod.build_tool()
+    return tool.run(ctx, ctx.kb, tool.input_model(**kwargs))
+
+
+def test_substring_search_is_case_insensitive_by_default(ctx) -> None:
+    out = _run(ctx, query="parse")
+    assert [m.name for m in out.matches] == ["parse_config", "ParseHeader"]
+    cs = _run(ctx, query="Parse", case_sensitive=True)
+    assert [m.name for m in cs.matches] == ["ParseHeader"]
+
+
+def test_regex_search_reuses_compiled_pattern(ctx) -> None:
+    mod._compiled.cache_clear()
+    first = _run(ctx, query=r"^p", regex=True, where=["all"])
+    second = _run(ctx, query=r"^p", regex=True, where=["all"])
+    assert [m.name for m in first.matches] == ["parse_config", "ParseHeader"]
+    assert second.matches == first.matches
+    assert mod._compiled.cache_info().hits >= 1
+
+
+def test_invalid_regex_falls_back_to_substring(ctx) -> None:
+    assert mod._compiled("operator()(", re.IGNORECASE) is None
+    out = _run(ctx, query="operator()(", regex=True)
+    assert [m.name for m in out.matches] == ["Foo::operator()(int)"]
+
+
+def test_duplicate_targets_are_reported_once(ctx) -> None:
+    out = _run(ctx, query="printf", where=["dynamic", "imports", "dynamic"])
+    assert [(m.name, m.category) for m in out.matches] == [
+        ("printf", "dynamic"),
+        ("printf", "imports"),
+    ]
+    assert out.total_scanned == 3
+
+
+def test_scan_stops_once_max_results_is_reached(ctx) -> None:
+    out = _run(ctx, query="a", where=["all", "libs"], max_results=1)
+    assert [(m.name, m.category) for m in out.matches] == [("main", "all")]
+    assert out.total_scanned == 1
+
+
+def test_symbol_tables_are_reused_until_the_file_changes(ctx, loads) -> None:
+    _run(ctx, query="main")
+    _run(ctx, query="printf")
+    assert len(loads) == 1
+    st = os.stat(ctx.file_path)
+    os.utime(ctx.file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _run(ctx, query="main")
+    assert len(loads) == 2
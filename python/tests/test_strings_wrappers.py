@@ -20,6 +20,22 @@ def test_search_text_finds_iocs_and_symbols():
     assert "path_windows" in kinds or "path_unc" in kinds
 
 
+def test_count_ipv4_counts_only_valid_addresses():
+    text = "10.0.0.1 and 8.8.8.8 but not 999.1.2.3 or 1.2.3 " * 1000
+    assert gl.strings.count_ipv4(text) == 2000
+    assert gl.strings.count_ipv4("") == 0
+
+
+def test_count_ipv4_bytes_reads_mapped_files(tmp_path):
+    import mmap
+
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"\xff\x00 10.0.0.1 \xfe 8.8.8.8\x00 999.1.2.3")
+    assert gl.strings.count_ipv4_bytes(path.read_bytes()) == 2
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert gl.strings.count_ipv4_bytes(mm) == 2
+
+
 def test_similarity_helpers():
     s = gl.strings.similarity_score("prinf", "printf", algo="jaro_winkler")
     assert s > 0.85
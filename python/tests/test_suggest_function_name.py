@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from glaurung.llm.context import Budgets, MemoryContext
 from glaurung.llm.tools.suggest_function_name import (
     _has_strong_kernel_call_evidence,
@@ -356,3 +358,158 @@ def test_prompt_with_fake_pseudocode_strips_section_quotes():
     # And at least the first instance is preserved.
     assert '".text"' in prompt
     assert '".rdata"' in prompt
+
+
+# ---------------------------------------------------------------------------
+# _load_call_targets -- cached symbol/PLT call-target map
+# ---------------------------------------------------------------------------
+
+
+def test_call_targets_prefer_symbols_and_are_cached(monkeypatch, tmp_path):
+    import os
+
+    import glaurung as g
+    from glaurung.llm.tools import suggest_function_name as mod
+
+    loads = []
+
+    def _syms(path):
+        loads.append(path)
+        return [(0x1000, "main"), (0x2000, "helper")]
+
+    monkeypatch.setattr(g.symbols, "symbol_address_map", _syms)
+    monkeypatch.setattr(
+        g.analysis,
+        "elf_plt_map_path",
+        lambda path: [(0x2000, "x@plt"), (0x3000, "puts@plt")],
+    )
+    target = tmp_path / "fake"
+    target.write_bytes(b"\x00")
+    path = str(target)
+    mod._load_call_targets.cache_clear()
+    first = mod._load_call_targets(path)
+    assert first == {0x1000: "main", 0x2000: "helper", 0x3000: "puts@plt"}
+    assert mod._load_call_targets(path) is first
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    mod._load_call_targets(path)
+    assert loads == [path, path]
+
+
+def test_call_target_load_failures_are_not_cached(monkeypatch, tmp_path):
+    import glaurung as g
+    from glaurung.llm.tools import suggest_function_name as mod
+
+    plt = []
+
+    def _plt(path):
+        if not plt:
+            raise OSError("transient")
+        return plt
+
+    def _no_syms(path):
+        raise ValueError("not an ELF with symbols")
+
+    monkeypatch.setattr(g.symbols, "symbol_address_map", _no_syms)
+    monkeypatch.setattr(g.analysis, "elf_plt_map_path", _plt)
+    target = tmp_path / "fake"
+    target.write_bytes(b"\x00")
+    mod._load_call_targets.cache_clear()
+    with pytest.raises(ValueError):
+        mod._load_call_targets(str(target))
+    # One source failing still yields the other's names.
+    plt.append((0x3000, "puts@plt"))
+    assert mod._load_call_targets(str(target)) == {0x3000: "puts@plt"}
+
+
+def test_slugify_normalises_names():
+    from glaurung.llm.tools.suggest_function_name import _slugify
+
+    assert _slugify("std::vector<int>::push_back(int const&)") == (
+        "std_vectorint_push_back"
+    )
+    assert _slugify(" Print-Message now ") == "print_message_now"
+    assert _slugify("café ::") == "caf"
+    assert _slugify("<>()") == "func"
+
+
+def test_heuristics_match_keywords_case_insensitively():
+    from glaurung.llm.tools.suggest_function_name import build_tool
+
+    tool = build_tool()
+
+    def name_for(calls, strings=()):
+        out = tool._suggest_with_heuristics("sub_1", None, calls, list(strings), 1)
+        return out.name
+
+    assert name_for(["CreateFileW", "printf"]) == "print_message"
+    assert name_for(["WSAConnect"]) == "network_handler"
+    assert name_for(["HeapAlloc"]) == "memory_allocator"
+    assert name_for([], ["Fatal ERROR: %s"]) == "error_handler"
+    assert name_for(["exit"], ["HTTPS://example.com"]) == "web_handler"
+    assert name_for(["exit"], ["nothing"]) == "sub_1"
+
+
+def test_call_operands_resolve_through_call_targets(monkeypatch, tmp_path):
+    from types import SimpleNamespace as NS
+
+    import glaurung as g
+    from glaurung.llm.tools import suggest_function_name as mod
+
+    def insn(mnemonic, call, *imms):
+        ops = [NS(immediate=i) for i in imms]
+        return NS(mnemonic=mnemonic, operands=ops, is_call=lambda: call)
+
+    window = [
+        insn("call", True, 0x401000),
+        insn("mov", False, 0x402000),
+        insn("call", True, -0x800),
+    ]
+    monkeypatch.setattr(g.disasm, "disassemble_window_at", lambda *a, **k: window)
+    monkeypatch.setattr(mod, "insn_text", lambda ins: ins.mnemonic)
+    monkeypatch.setattr(
+        mod,
+        "_load_call_targets",
+        lambda path: {
+            0x401000: "puts",
+            0x402000: "never_called",
+            (1 << 64) - 0x800: "kernel_helper",
+        },
+    )
+    target = tmp_path / "bin"
+    target.write_bytes(b"\x00")
+    ctx = MemoryContext(file_path=str(target), artifact=MagicMock())
+    seen = {}
+
+    def _heuristics(self, original_name, demangled_name, calls, strings, va):
+        seen["calls"] = calls
+        return mod.SuggestedFunctionName(name="x", confidence=0.5)
+
+    monkeypatch.setattr(
+        mod.SuggestFunctionNameTool, "_suggest_with_heuristics", _heuristics
+    )
+    tool = mod.build_tool()
+    tool.run(ctx, ctx.kb, tool.input_model(va=0x401000, use_llm=False))
+    assert seen["calls"] == ["puts", "kernel_helper"]
+
+
+def test_demangle_results_are_cached(monkeypatch):
+    from glaurung.llm.tools import suggest_function_name as mod
+
+    calls = []
+
+    def _fake(name):
+        calls.append(name)
+        if name == "bad":
+            raise RuntimeError("recursion limit")
+        return ("foo(int)", "itanium") if name == "_Z3fooi" else None
+
+    monkeypatch.setattr(mod.g.strings, "demangle_text", _fake)
+    mod._demangle.cache_clear()
+    assert mod._demangle("_Z3fooi") == "foo(int)"
+    assert mod._demangle("_Z3fooi") == "foo(int)"
+    assert mod._demangle("plain") is None
+    assert mod._demangle("bad") is None
+    assert mod._demangle("bad") is None
+    assert calls == ["_Z3fooi", "plain", "bad"]
+    mod._demangle.cache_clear()
@@ -115,6 +115,67 @@ def test_customized_triage_config():
         pytest.skip("Python extension not built with python-ext feature")
 
 
+def test_triage_config_reuses_nested_proxies():
+    """Nested proxies are cached until the nested config is replaced."""
+    try:
+        import glaurung.triage as triage
+
+        config = triage.TriageConfig()
+        assert config.io is config.io
+        assert config.entropy is config.entropy
+        assert config.entropy.thresholds is config.entropy.thresholds
+        assert config.scoring is config.scoring
+
+        config.entropy.thresholds.text = 2.5
+        thresholds = config.entropy.thresholds
+        config.entropy.thresholds = triage.EntropyThresholds()
+        assert config.entropy.thresholds is not thresholds
+        assert config.entropy.thresholds.text == 3.0
+
+        io = config.io
+        io.max_sniff_size = 8192
+        replacement = triage.IOConfig()
+        config.io = replacement
+        assert config.io is not io
+        assert config.io.max_sniff_size == 4096
+
+    except ImportError:
+        pytest.skip("Python extension not built with python-ext feature")
+
+
+def test_triage_config_commits_packer_and_similarity_changes():
+    """Every sub-config write reaches the native config."""
+    try:
+        import glaurung.triage as triage
+
+        config = triage.TriageConfig()
+        config.similarity.window_size = 16
+        assert config._native.similarity.window_size == 16
+        assert config.similarity.window_size == 16
+
+        config.packers.scan_limit = 4096
+        assert config._native.packers.scan_limit == 4096
+
+    except ImportError:
+        pytest.skip("Python extension not built with python-ext feature")
+
+
+def test_per_format_types_resolve_on_first_access():
+    """Per-format types are looked up lazily and cached on the module."""
+    import glaurung._native as native
+    import glaurung.triage as triage
+
+    with pytest.raises(AttributeError):
+        triage.NotARealTriageType  # noqa: B018
+    for name, native_name in triage._LAZY.items():
+        if hasattr(native.triage, native_name):
+            assert getattr(triage, name) is getattr(native.triage, native_name)
+            assert name in vars(triage) and name in dir(triage)
+        else:
+            assert not hasattr(triage, name)
+            assert name not in dir(triage)
+
+
 if __name__ == "__main__":
     # Simple manual test
     test_triage_config_creation()
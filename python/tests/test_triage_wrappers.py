@@ -36,3 +36,21 @@ def test_analyze_path_nonexistent_raises_valueerror(tmp_path: Path):
     assert not bogus.exists()
     with pytest.raises(ValueError):
         g.triage.analyze_path(str(bogus))
+
+
+def test_analyze_path_reports_ipv4_count(tmp_path: Path):
+    target = tmp_path / "iocs.txt"
+    target.write_bytes(b"beacon to 10.1.2.3 and 8.8.8.8 via http://example.com\n")
+    art = g.triage.analyze_path(str(target))
+    assert art.strings is not None
+    assert (art.strings.ioc_counts or {}).get("ipv4", 0) >= 1
+
+
+def test_triage_module_analyze_path_returns_native_artifact(tmp_path: Path):
+    import glaurung.triage as triage_mod
+
+    target = tmp_path / "hello.txt"
+    target.write_bytes(b"hello world\n")
+    art = triage_mod.analyze_path(str(target))
+    assert isinstance(art, triage_mod.TriagedArtifact)
+    assert art.size_bytes == target.stat().st_size
@@ -0,0 +1,54 @@
+"""Tests for the view_entropy memory tool."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from glaurung.llm.context import MemoryContext
+    from glaurung.llm.tools.view_entropy import _shannon_entropy, build_tool
+except ImportError:  # pragma: no cover - LLM deps missing
+    pytest.skip("LLM dependencies not available", allow_module_level=True)
+
+
+def _reference(data: bytes) -> float:
+    n = len(data)
+    return -sum(c / n * math.log2(c / n) for c in Counter(data).values())
+
+
+@pytest.mark.parametrize(
+    "data", [b"\x00" * 64, b"ab" * 100, bytes(range(256)) * 3, b"hello world"]
+)
+def test_shannon_entropy_matches_reference(data: bytes) -> None:
+    assert _shannon_entropy(data) == pytest.approx(_reference(data))
+
+
+def test_empty_window_has_zero_entropy() -> None:
+    assert _shannon_entropy(b"") == 0.0
+
+
+def test_file_offset_window(tmp_path: Path) -> None:
+    target = tmp_path / "blob.bin"
+    target.write_bytes(b"\x00" * 16 + bytes(range(256)))
+    ctx = MemoryContext(file_path=str(target), artifact=MagicMock())
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(file_offset=16, length=256))
+    assert out.length == 256
+    assert out.entropy == pytest.approx(8.0)
+    assert out.evidence_node_id is not None
+
+
+def test_window_is_clipped_to_end_of_file(tmp_path: Path) -> None:
+    target = tmp_path / "short.bin"
+    target.write_bytes(b"ab" * 8)
+    ctx = MemoryContext(file_path=str(target), artifact=MagicMock())
+    tool = build_tool()
+    tail = tool.run(ctx, ctx.kb, tool.input_model(file_offset=12, length=4096))
+    assert (tail.length, tail.entropy) == (4, pytest.approx(1.0))
+    past = tool.run(ctx, ctx.kb, tool.input_model(file_offset=64, add_to_kb=False))
+    assert (past.length, past.entropy) == (0, 0.0)
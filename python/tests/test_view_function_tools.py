@@ -1,4 +1,8 @@
+import os
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 import glaurung as g
 
@@ -61,3 +65,256 @@ def test_trace_main_printf_hello():
     assert any("printf" in c or "puts" in c for c in calls) or any(
         "hello" in s for s in stexts
     )
+
+
+def test_c_string_readers_slice_a_shared_mapping(tmp_path: Path) -> None:
+    try:
+        from glaurung.llm.tools.view_function import (
+            _map_file,
+            _read_c_string_ascii,
+            _read_c_string_utf16le,
+        )
+    except ImportError:
+        pytest.skip("LLM dependencies not available")
+
+    data = b"\x01Hello, world\x00" + "Wide".encode("utf-16le") + b"\x00\x00ab\x00"
+    target = tmp_path / "strings.bin"
+    target.write_bytes(data)
+    mm = _map_file(str(target))
+    assert mm is not None
+    with mm:
+        assert _read_c_string_ascii(mm, 1, 256) == "Hello, world"
+        assert _read_c_string_ascii(mm, 0, 256) is None
+        assert _read_c_string_utf16le(mm, 14, 512) == "Wide"
+        # Too short, and reads that run past the end just see fewer bytes.
+        assert _read_c_string_ascii(mm, len(data) - 3, 256) is None
+        assert _read_c_string_ascii(mm, len(data) + 10, 256) is None
+
+    (tmp_path / "empty.bin").write_bytes(b"")
+    assert _map_file(str(tmp_path / "empty.bin")) is None
+    assert _map_file(str(tmp_path / "missing.bin")) is None
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"abcd", "abcd"),
+        (b"abc\x00defg", None),
+        (b"tab\there\x00", None),
+        (b"caf\xe9 au lait\x00", None),
+        (b"~ !{}\x00\xff", "~ !{}"),
+    ],
+)
+def test_read_c_string_ascii_rejects_non_printable_runs(data, expected) -> None:
+    try:
+        from glaurung.llm.tools.view_function import _read_c_string_ascii
+    except ImportError:
+        pytest.skip("LLM dependencies not available")
+
+    assert _read_c_string_ascii(data, 0, 256) == expected
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("Wide".encode("utf-16le"), "Wide"),
+        ("Wide".encode("utf-16le") + b"\x00\x00junk", "Wide"),
+        ("Wide".encode("utf-16le") + b"X", "Wide"),
+        ("Wid".encode("utf-16le") + b"\x00\x00", None),
+        ("WiĀde".encode("utf-16le"), None),
+        ("Wide".encode("utf-16le") + b"\x00\x01", None),
+        ("Wi\tde".encode("utf-16le"), None),
+    ],
+)
+def test_read_c_string_utf16le_checks_both_byte_lanes(data, expected) -> None:
+    try:
+        from glaurung.llm.tools.view_function import _read_c_string_utf16le
+    except ImportError:
+        pytest.skip("LLM dependencies not available")
+
+    assert _read_c_string_utf16le(data, 0, 512) == expected
+
+
+class _Op:
+    def __init__(self, text: str, kind: str = "Immediate", **fields) -> None:
+        self.text = text
+        self.kind = SimpleNamespace(name=kind)
+        self.base = fields.get("base")
+        self.index = fields.get("index")
+        self.displacement = fields.get("displacement")
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def _ins(va: int, size: int, mnemonic: str, *operands: _Op) -> SimpleNamespace:
+    return SimpleNamespace(
+        address=SimpleNamespace(value=va),
+        end_address=lambda: SimpleNamespace(value=va + size),
+        arch="x86_64",
+        mnemonic=mnemonic,
+        operands=list(operands),
+        op_str=", ".join(map(str, operands)),
+        bytes_hex="90" * size,
+    )
+
+
+@pytest.fixture
+def fake_binary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    try:
+        from glaurung.llm.context import MemoryContext
+        from glaurung.llm.tools import view_function as mod
+    except ImportError:
+        pytest.skip("LLM dependencies not available")
+
+    target = tmp_path / "fake.bin"
+    target.write_bytes(b"\x00" * 0x10 + b"greeting\x00" + b"\x00" * 7)
+    # lea rdi, [rip + 0x9]; call 0x2000; call 0x3000; ret
+    rip_ref = _Op("[rip+0x9]", "Memory", base="rip", displacement=0x9)
+    listing = [
+        _ins(0x1000, 7, "lea", _Op("rdi"), rip_ref),
+        _ins(0x1007, 5, "call", _Op("0x2000")),
+        _ins(0x100C, 5, "call", _Op("0x3000")),
+        _ins(0x1011, 1, "ret"),
+    ]
+    loads: list[str] = []
+
+    def _names(path, max_read_bytes, max_file_size):
+        loads.append("symbols")
+        return [(0x2000, "puts")]
+
+    offsets: list[list[int]] = []
+
+    def _va_to_offs(path, vas, max_read_bytes, max_file_size):
+        offsets.append(list(vas))
+        return [va - 0x1000 if 0x1000 <= va < 0x1020 else None for va in vas]
+
+    monkeypatch.setattr(g.analysis, "address_name_map_path", _names)
+    monkeypatch.setattr(g.analysis, "va_to_file_offsets_path", _va_to_offs)
+    monkeypatch.setattr(g.disasm, "disassemble_window_at", lambda *a, **kw: listing)
+    mod._build_addr_to_name.cache_clear()
+    ctx = MemoryContext(file_path=str(target), artifact=MagicMock())
+    return SimpleNamespace(
+        ctx=ctx, mod=mod, listing=listing, loads=loads, offsets=offsets
+    )
+
+
+def _view(fake, va: int = 0x1000):
+    tool = fake.mod.build_tool()
+    return tool.run(fake.ctx, fake.ctx.kb, tool.input_model(va=va))
+
+
+def test_view_function_resolves_calls_and_strings(fake_binary) -> None:
+    out = _view(fake_binary)
+    assert [i.text for i in out.instructions][:2] == [
+        "lea rdi, [rip+0x9]",
+        "call 0x2000",
+    ]
+    assert [(c.target_va, c.target_name) for c in out.calls] == [
+        (0x2000, "puts"),
+        (0x3000, "puts"),
+    ]
+    assert [(s.va, s.text, s.encoding) for s in out.strings] == [
+        (0x1010, "greeting", "ascii")
+    ]
+    dumped = out.model_dump()
+    assert dumped["calls"][0] == {
+        "ins_va": 0x1007,
+        "target_va": 0x2000,
+        "target_name": "puts",
+    }
+    assert dumped["instructions"][-1] == {
+        "va": 0x1011,
+        "bytes_hex": "90",
+        "text": "ret ",
+    }
+
+
+def test_address_names_are_built_once_per_file_version(fake_binary) -> None:
+    _view(fake_binary)
+    _view(fake_binary, 0x1007)
+    assert fake_binary.loads == ["symbols"]
+    path = fake_binary.ctx.file_path
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _view(fake_binary)
+    assert fake_binary.loads == ["symbols", "symbols"]
+
+
+def test_address_name_load_failures_are_retried(
+    fake_binary, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fail(*args):
+        fake_binary.loads.append("failed")
+        raise OSError("transient")
+
+    monkeypatch.setattr(g.analysis, "address_name_map_path", _fail)
+    assert [c.target_name for c in _view(fake_binary).calls] == [None, None]
+    monkeypatch.setattr(
+        g.analysis, "address_name_map_path", lambda *a: [(0x2000, "puts")]
+    )
+    assert _view(fake_binary).calls[0].target_name == "puts"
+    assert fake_binary.loads == ["failed"]
+
+
+def test_unresolved_strings_do_not_fall_back_to_a_file_scan(
+    fake_binary, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with open(fake_binary.ctx.file_path, "ab") as f:
+        f.write(b"hello world\x00")
+    monkeypatch.setattr(
+        g.analysis, "va_to_file_offsets_path", lambda path, vas, *a: [None] * len(vas)
+    )
+    assert _view(fake_binary).strings == []
+
+
+def test_view_function_evidence_hangs_off_the_file_node(fake_binary) -> None:
+    from glaurung.llm.kb.models import Node, NodeKind
+
+    kb = fake_binary.ctx.kb
+    file_node = kb.add_node(Node(kind=NodeKind.file, label="fake.bin"))
+    out = _view(fake_binary)
+    assert [(e.src, e.dst) for e in kb.edges() if e.kind == "has_evidence"] == [
+        (file_node.id, out.evidence_node_id)
+    ]
+
+
+def test_operand_vas_are_mapped_to_file_offsets_in_one_batch(fake_binary) -> None:
+    lea = fake_binary.listing[0]
+    far = _Op("[0x5000]", "Memory", displacement=0x5000)
+    fake_binary.listing[1:1] = [lea, _ins(0x1007, 8, "mov", _Op("rax"), far), lea]
+    out = _view(fake_binary)
+    assert fake_binary.offsets == [[0x1010, 0x5000]]
+    assert [s.text for s in out.strings] == ["greeting"]
+
+
+def test_negative_operand_va_does_not_drop_the_batch(
+    fake_binary, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _va_to_offs(path, vas, max_read_bytes, max_file_size):
+        # PyO3 rejects the whole list if any item does not fit a u64
+        if any(not 0 <= va < 1 << 64 for va in vas):
+            raise OverflowError("can't convert negative int to unsigned")
+        fake_binary.offsets.append(list(vas))
+        return [va - 0x1000 if 0x1000 <= va < 0x1020 else None for va in vas]
+
+    monkeypatch.setattr(g.analysis, "va_to_file_offsets_path", _va_to_offs)
+    neg = _Op("[-0x10]", "Memory", displacement=-0x10)
+    fake_binary.listing.insert(1, _ins(0x1007, 8, "mov", _Op("rax"), neg))
+    out = _view(fake_binary)
+    assert fake_binary.offsets == [[0x1010, (1 << 64) - 0x10]]
+    assert [s.text for s in out.strings] == ["greeting"]
+
+
+def test_stdio_guess_is_cached_with_the_name_map(fake_binary, monkeypatch) -> None:
+    names = [(0x10, "__IO_Puts"), (0x20, "vfprintf@plt")]
+    monkeypatch.setattr(g.analysis, "address_name_map_path", lambda *a: names)
+    build = fake_binary.mod._build_addr_to_name
+    build.cache_clear()
+    path = fake_binary.ctx.file_path
+    addr_to_name, guess = build(path, 1, 1)
+    assert addr_to_name == {0x10: "__IO_Puts", 0x20: "vfprintf@plt"}
+    assert guess == "printf"
+    names.pop()
+    assert build(path, 1, 1)[1] == "printf"
+    assert build(path, 1, 2)[1] == "puts"
@@ -0,0 +1,53 @@
+"""Tests for the view_hex memory tool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from glaurung.llm.context import MemoryContext
+    from glaurung.llm.tools.view_hex import _read_at, _to_ascii_preview, build_tool
+except ImportError:  # pragma: no cover - LLM deps missing
+    pytest.skip("LLM dependencies not available", allow_module_level=True)
+
+
+def test_preview_rows_pad_hex_and_dot_non_printables() -> None:
+    data = b"Hello, world!\x00\x7f\x80" + bytes(range(0x1E, 0x24))
+    assert _to_ascii_preview(data) == [
+        "48 65 6c 6c 6f 2c 20 77 6f 72 6c 64 21 00 7f 80   Hello, world!...",
+        "1e 1f 20 21 22 23" + " " * 31 + "  .. !\"#",
+    ]
+
+
+def test_preview_of_empty_buffer_has_no_rows() -> None:
+    assert _to_ascii_preview(b"") == []
+
+
+def test_preview_honours_width() -> None:
+    assert _to_ascii_preview(b"\tabc~", width=4) == [
+        "09 61 62 63   .abc",
+        "7e" + " " * 10 + "  ~",
+    ]
+
+
+def test_read_at_reads_a_window_and_clips_at_eof(tmp_path: Path) -> None:
+    target = tmp_path / "data.bin"
+    target.write_bytes(bytes(range(32)))
+    assert _read_at(str(target), 4, 3) == b"\x04\x05\x06"
+    assert _read_at(str(target), 30, 8) == b"\x1e\x1f"
+    assert _read_at(str(target), 64, 8) == b""
+    with pytest.raises(FileNotFoundError):
+        _read_at(str(tmp_path / "missing.bin"), 0, 1)
+
+
+def test_view_hex_reads_from_file_offset(tmp_path: Path) -> None:
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"\x00" * 8 + b"MZ\x90\x00")
+    ctx = MemoryContext(file_path=str(target), artifact=MagicMock())
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model(file_offset=8, length=16))
+    assert (out.start_offset, out.length, out.bytes_hex) == (8, 4, "4d5a9000")
+    assert out.ascii_preview == ["4d 5a 90 00" + " " * 37 + "  MZ.."]
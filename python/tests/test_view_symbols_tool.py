@@ -0,0 +1,50 @@
+"""Tests for the view_symbols memory tool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import glaurung as g
+
+try:
+    from glaurung.llm.context import MemoryContext
+    from glaurung.llm.kb.models import Node, NodeKind
+    from glaurung.llm.tools.view_symbols import build_tool
+except ImportError:  # pragma: no cover - LLM deps missing
+    pytest.skip("LLM dependencies not available", allow_module_level=True)
+
+
+def test_view_symbols_links_every_imported_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    imports = [f"imp{i}" for i in range(205)]
+    monkeypatch.setattr(
+        g.triage,
+        "list_symbols",
+        lambda *a: ([], [], imports, ["exp"], ["libc.so.6"]),
+    )
+    ctx = MemoryContext(file_path="/bin/true", artifact=MagicMock())
+    file_node = ctx.kb.add_node(Node(kind=NodeKind.file, label="true"))
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model())
+
+    assert out.imports == imports
+    edges = list(ctx.kb.edges())
+    assert (edges[0].src, edges[0].dst) == (file_node.id, out.evidence_node_id)
+    linked = [(e.kind, ctx.kb.get_node(e.dst).label) for e in edges[1:]]
+    assert [label for kind, label in linked if kind == "imports"] == imports[:200]
+    assert linked[-2:] == [("exports", "export:exp"), ("lib", "lib:libc.so.6")]
+    assert all(e.src == out.evidence_node_id for e in edges[1:])
+
+
+def test_view_symbols_without_symbols_adds_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(g.triage, "list_symbols", lambda *a: ([], [], [], [], []))
+    ctx = MemoryContext(file_path="/bin/true", artifact=MagicMock())
+    tool = build_tool()
+    out = tool.run(ctx, ctx.kb, tool.input_model())
+    assert out.evidence_node_id is None
+    assert list(ctx.kb.nodes()) == []
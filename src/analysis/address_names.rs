@@ -0,0 +1,77 @@
+//! Address-to-name maps for call and data target resolution.
+//!
+//! Combines defined symbols with the import-stub maps (ELF PLT/GOT, PE IAT)
+//! so callers that want "any name for this address" read the image once.
+
+use object::read::Object;
+use object::ObjectSymbol;
+use std::collections::BTreeMap;
+
+/// Defined static and dynamic symbols by address, sorted by address.
+/// When several symbols share an address the first one seen wins.
+pub fn symbol_address_map(data: &[u8]) -> Vec<(u64, String)> {
+    let mut out: Vec<(u64, String)> = Vec::new();
+    if let Ok(obj) = object::read::File::parse(data) {
+        for sym in obj.symbols().chain(obj.dynamic_symbols()) {
+            if sym.is_definition() {
+                if let Ok(name) = sym.name() {
+                    if !name.is_empty() {
+                        out.push((sym.address(), name.to_string()));
+                    }
+                }
+            }
+        }
+    }
+    // Dedup by address, keep first name
+    out.sort_by_key(|(a, _)| *a);
+    out.dedup_by_key(|(a, _)| *a);
+    out
+}
+
+/// Merge symbol, ELF PLT, PE IAT and ELF GOT names for one image.
+///
+/// Sources are applied in that order and a later source replaces an earlier
+/// name at the same address. The result is sorted by address.
+pub fn address_name_map(data: &[u8]) -> Vec<(u64, String)> {
+    let mut merged: BTreeMap<u64, String> = BTreeMap::new();
+    let sources = [
+        symbol_address_map(data),
+        crate::analysis::elf_plt::elf_plt_map(data),
+        crate::analysis::pe_iat::pe_iat_map(data),
+        crate::analysis::elf_got::elf_got_map(data),
+    ];
+    for source in sources {
+        merged.extend(source);
+    }
+    merged.into_iter().collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn non_object_input_yields_empty_maps() {
+        assert!(symbol_address_map(b"not an object file").is_empty());
+        assert!(address_name_map(b"not an object file").is_empty());
+    }
+
+    #[test]
+    fn merged_map_contains_every_symbol_address() {
+        let path = std::path::Path::new(
+            "samples/binaries/platforms/linux/amd64/export/native/gcc/O2/hello-gcc-O2",
+        );
+        if !path.exists() {
+            return; // sample corpus is optional for unit tests
+        }
+        let data = std::fs::read(path).unwrap();
+        let merged = address_name_map(&data);
+        assert!(merged.windows(2).all(|w| w[0].0 < w[1].0));
+        for (addr, _) in symbol_address_map(&data) {
+            assert!(merged.binary_search_by_key(&addr, |(a, _)| *a).is_ok());
+        }
+        for entry in crate::analysis::elf_plt::elf_plt_map(&data) {
+            assert!(merged.contains(&entry), "PLT name must override symbols");
+        }
+    }
+}
@@ -128,8 +128,23 @@ pub fn va_to_code_file_offset(data: &[u8], va: u64) -> Option<usize> {
 /// section shares address 0, and this resolver will return whichever section appears
 /// first — including a string or debug section.
 pub fn va_to_file_offset(data: &[u8], va: u64) -> Option<usize> {
-    use object::read::Object;
     let obj = object::read::File::parse(data).ok()?;
+    resolve_va(&obj, va)
+}
+
+/// Map many virtual addresses to file offsets with a single header parse.
+///
+/// The result lines up with `vas`; each entry follows the same rules as
+/// [`va_to_file_offset`]. Unparseable input yields `None` for every address.
+pub fn va_to_file_offsets(data: &[u8], vas: &[u64]) -> Vec<Option<usize>> {
+    match object::read::File::parse(data) {
+        Ok(obj) => vas.iter().map(|&va| resolve_va(&obj, va)).collect(),
+        Err(_) => vec![None; vas.len()],
+    }
+}
+
+fn resolve_va(obj: &object::read::File<'_>, va: u64) -> Option<usize> {
+    use object::read::Object;
     // Try program headers (segments) first
     for seg in obj.segments() {
         let addr = seg.address();
@@ -252,6 +267,20 @@ mod tests {
         assert_eq!(va_to_code_file_offset(&data, 4), Some(84));
     }
 
+    /// The batched resolver answers exactly like one call per address.
+    #[test]
+    fn the_batched_resolver_matches_single_lookups() {
+        let data = et_rel_with_strtab_first();
+        let vas = [0u64, 4, 15, 16, 0x1000];
+        let single: Vec<_> = vas.iter().map(|&va| va_to_file_offset(&data, va)).collect();
+        assert_eq!(va_to_file_offsets(&data, &vas), single);
+        assert_eq!(
+            va_to_file_offsets(b"not an object", &vas),
+            vec![None; vas.len()]
+        );
+        assert!(va_to_file_offsets(&data, &[]).is_empty());
+    }
+
     /// A linked image has real addresses and program headers; the code resolver must
     /// not change those answers.
     #[test]
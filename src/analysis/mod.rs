@@ -6,6 +6,7 @@
 //! by `core::address::Address` with simple VA↔RVA↔FileOffset translation.
 
 pub mod aarch64_literals;
+pub mod address_names;
 pub mod arm32_mode;
 pub(crate) mod call_semantics;
 pub mod cfg;
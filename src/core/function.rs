@@ -343,6 +343,33 @@ impl Function {
         false
     }
 
+    /// Number of basic blocks attached to this function.
+    pub fn basic_block_count(&self) -> usize {
+        self.basic_blocks.len()
+    }
+
+    /// Total instructions across all basic blocks.
+    pub fn instruction_count(&self) -> u64 {
+        self.basic_blocks
+            .iter()
+            .map(|b| u64::from(b.instruction_count))
+            .sum()
+    }
+
+    /// Sum of successor links over all basic blocks (intra-function CFG
+    /// out-edges as recorded on the blocks themselves).
+    pub fn successor_count(&self) -> usize {
+        self.basic_blocks
+            .iter()
+            .map(|b| b.successor_ids.len())
+            .sum()
+    }
+
+    /// Highest basic-block end address, or `None` when there are no blocks.
+    pub fn max_block_end(&self) -> Option<u64> {
+        self.basic_blocks.iter().map(|b| b.end_address.value).max()
+    }
+
     /// Calculate cyclomatic complexity
     pub fn cyclomatic_complexity(&self) -> u32 {
         // M = E - N + 2P
@@ -650,6 +677,28 @@ impl Function {
         self.basic_blocks.clone()
     }
 
+    // Block aggregates computed in Rust, so callers that only need counts
+    // don't clone every BasicBlock across the boundary.
+    #[getter(basic_block_count)]
+    fn basic_block_count_py(&self) -> usize {
+        self.basic_block_count()
+    }
+
+    #[getter(instruction_count)]
+    fn instruction_count_py(&self) -> u64 {
+        self.instruction_count()
+    }
+
+    #[getter(successor_count)]
+    fn successor_count_py(&self) -> usize {
+        self.successor_count()
+    }
+
+    #[getter(max_block_end)]
+    fn max_block_end_py(&self) -> Option<u64> {
+        self.max_block_end()
+    }
+
     #[getter]
     fn chunks(&self) -> Vec<AddressRange> {
         self.chunks.clone()
@@ -937,4 +986,34 @@ mod tests {
         assert_eq!(all[0].start.value, 0x1000);
         assert!(func.contains_va(0x1020));
     }
+
+    #[test]
+    fn test_block_aggregates() {
+        let va = |v: u64| Address::new(AddressKind::VA, v, 64, None, None).unwrap();
+        let mut func = Function::new("f".to_string(), va(0x1000), FunctionKind::Normal).unwrap();
+        assert_eq!(func.basic_block_count(), 0);
+        assert_eq!(func.max_block_end(), None);
+
+        func.add_basic_block(BasicBlock::new(
+            "b0".to_string(),
+            va(0x1000),
+            va(0x1010),
+            4,
+            Some(vec!["b1".to_string(), "b2".to_string()]),
+            None,
+        ));
+        func.add_basic_block(BasicBlock::new(
+            "b1".to_string(),
+            va(0x1010),
+            va(0x1030),
+            6,
+            None,
+            None,
+        ));
+
+        assert_eq!(func.basic_block_count(), 2);
+        assert_eq!(func.instruction_count(), 10);
+        assert_eq!(func.successor_count(), 2);
+        assert_eq!(func.max_block_end(), Some(0x1030));
+    }
 }
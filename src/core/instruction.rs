@@ -631,6 +631,12 @@ impl Instruction {
     fn bytes<'py>(&self, py: Python<'py>) -> Py<pyo3::types::PyBytes> {
         pyo3::types::PyBytes::new(py, &self.bytes).into()
     }
+    /// Lower-case hex of the instruction bytes, built without an
+    /// intermediate `bytes` object.
+    #[getter]
+    fn bytes_hex(&self) -> String {
+        hex::encode(&self.bytes)
+    }
     #[getter]
     fn mnemonic(&self) -> &str {
         &self.mnemonic
@@ -639,6 +645,13 @@ impl Instruction {
     fn operands(&self) -> Vec<Operand> {
         self.operands.clone()
     }
+    /// Operand texts joined with ", " (Capstone's `op_str`), built without
+    /// cloning the operands into Python objects.
+    #[getter]
+    fn op_str(&self) -> String {
+        let texts: Vec<&str> = self.operands.iter().map(|op| op.text.as_str()).collect();
+        texts.join(", ")
+    }
     #[getter]
     fn length(&self) -> u16 {
         self.length
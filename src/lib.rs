@@ -90,40 +90,18 @@ fn _native(py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
 #[pyo3(name = "symbol_address_map")]
 #[pyo3(signature = (path, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
 fn symbol_address_map_py(
+    py: Python<'_>,
     path: String,
     max_read_bytes: u64,
     max_file_size: u64,
 ) -> PyResult<Vec<(u64, String)>> {
-    use object::read::Object;
-    use object::ObjectSymbol;
     let limit = std::cmp::min(max_read_bytes, max_file_size);
-    let data = crate::triage::io::IOUtils::read_file_with_limit(&path, limit)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))?;
-    let mut out: Vec<(u64, String)> = Vec::new();
-    if let Ok(obj) = object::read::File::parse(&data[..]) {
-        for sym in obj.symbols() {
-            if sym.is_definition() {
-                if let (Ok(name), addr) = (sym.name(), sym.address()) {
-                    let s = name.to_string();
-                    if !s.is_empty() {
-                        out.push((addr, s));
-                    }
-                }
-            }
-        }
-        for sym in obj.dynamic_symbols() {
-            if sym.is_definition() {
-                if let (Ok(name), addr) = (sym.name(), sym.address()) {
-                    let s = name.to_string();
-                    if !s.is_empty() {
-                        out.push((addr, s));
-                    }
-                }
-            }
-        }
-    }
-    // Dedup by address, keep first name
-    out.sort_by_key(|(a, _)| *a);
-    out.dedup_by_key(|(a, _)| *a);
-    Ok(out)
+    py.detach(|| symbol_address_map_from_path(&path, limit))
+        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))
+}
+
+#[cfg(feature = "python-ext")]
+fn symbol_address_map_from_path(path: &str, limit: u64) -> std::io::Result<Vec<(u64, String)>> {
+    let data = crate::triage::io::IOUtils::read_file_with_limit(path, limit)?;
+    Ok(crate::analysis::address_names::symbol_address_map(&data))
 }
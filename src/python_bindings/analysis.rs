@@ -34,6 +34,10 @@ pub fn register_analysis_bindings(_py: Python<'_>, m: &Bound<'_, PyModule>) -> P
 
     // VA to file offset mapping
     analysis_mod.add_function(wrap_pyfunction!(va_to_file_offset_path_py, &analysis_mod)?)?;
+    analysis_mod.add_function(wrap_pyfunction!(va_to_file_offsets_path_py, &analysis_mod)?)?;
+
+    // Merged symbol/import-stub names
+    analysis_mod.add_function(wrap_pyfunction!(address_name_map_path_py, &analysis_mod)?)?;
 
     // ELF-specific helpers
     analysis_mod.add_function(wrap_pyfunction!(elf_plt_map_path_py, &analysis_mod)?)?;
@@ -628,6 +632,25 @@ fn data_xrefs_path_py(
         .collect())
 }
 
+/// Read up to `min(max_read_bytes, max_file_size)` bytes of `path` and run
+/// `parse` over them.
+///
+/// The buffer is owned by Rust, unlike the borrowed buffers of the `_bytes`
+/// entry points, so both the read and `parse` run with the GIL released.
+fn read_path_detached<T: Send>(
+    py: Python<'_>,
+    path: &str,
+    max_read_bytes: u64,
+    max_file_size: u64,
+    parse: impl FnOnce(&[u8]) -> T + Send,
+) -> PyResult<T> {
+    let limit = std::cmp::min(max_read_bytes, max_file_size);
+    py.detach(|| {
+        crate::triage::io::IOUtils::read_file_with_limit(path, limit).map(|data| parse(&data))
+    })
+    .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))
+}
+
 /// Map VA to file offset for a given file.
 #[pyfunction]
 #[pyo3(name = "va_to_file_offset_path")]
@@ -644,19 +667,52 @@ fn va_to_file_offset_path_py(
     Ok(crate::analysis::entry::va_to_file_offset(&data, va))
 }
 
+/// Map many VAs to file offsets for a given file, reading and parsing it once.
+#[pyfunction]
+#[pyo3(name = "va_to_file_offsets_path")]
+#[pyo3(signature = (path, vas, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
+fn va_to_file_offsets_path_py(
+    py: Python<'_>,
+    path: String,
+    vas: Vec<u64>,
+    max_read_bytes: u64,
+    max_file_size: u64,
+) -> PyResult<Vec<Option<usize>>> {
+    read_path_detached(py, &path, max_read_bytes, max_file_size, |data| {
+        crate::analysis::entry::va_to_file_offsets(data, &vas)
+    })
+}
+
+/// Merged symbol/PLT/IAT/GOT address-to-name map for a file, read once.
+///
+/// Later sources in that order replace earlier names at the same address.
+#[pyfunction]
+#[pyo3(name = "address_name_map_path")]
+#[pyo3(signature = (path, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
+fn address_name_map_path_py(
+    py: Python<'_>,
+    path: String,
+    max_read_bytes: u64,
+    max_file_size: u64,
+) -> PyResult<Vec<(u64, String)>> {
+    read_path_detached(py, &path, max_read_bytes, max_file_size, |data| {
+        crate::analysis::address_names::address_name_map(data)
+    })
+}
+
 /// Get ELF PLT map for a file.
 #[pyfunction]
 #[pyo3(name = "elf_plt_map_path")]
 #[pyo3(signature = (path, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
 fn elf_plt_map_path_py(
+    py: Python<'_>,
     path: String,
     max_read_bytes: u64,
     max_file_size: u64,
 ) -> PyResult<Vec<(u64, String)>> {
-    let limit = std::cmp::min(max_read_bytes, max_file_size);
-    let data = crate::triage::io::IOUtils::read_file_with_limit(&path, limit)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))?;
-    Ok(crate::analysis::elf_plt::elf_plt_map(&data))
+    read_path_detached(py, &path, max_read_bytes, max_file_size, |data| {
+        crate::analysis::elf_plt::elf_plt_map(data)
+    })
 }
 
 /// Get ELF GOT map for a file.
@@ -664,14 +720,14 @@ fn elf_plt_map_path_py(
 #[pyo3(name = "elf_got_map_path")]
 #[pyo3(signature = (path, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
 fn elf_got_map_path_py(
+    py: Python<'_>,
     path: String,
     max_read_bytes: u64,
     max_file_size: u64,
 ) -> PyResult<Vec<(u64, String)>> {
-    let limit = std::cmp::min(max_read_bytes, max_file_size);
-    let data = crate::triage::io::IOUtils::read_file_with_limit(&path, limit)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))?;
-    Ok(crate::analysis::elf_got::elf_got_map(&data))
+    read_path_detached(py, &path, max_read_bytes, max_file_size, |data| {
+        crate::analysis::elf_got::elf_got_map(data)
+    })
 }
 
 /// Get PE IAT map for a file.
@@ -679,14 +735,14 @@ fn elf_got_map_path_py(
 #[pyo3(name = "pe_iat_map_path")]
 #[pyo3(signature = (path, max_read_bytes=10_485_760u64, max_file_size=104_857_600u64))]
 fn pe_iat_map_path_py(
+    py: Python<'_>,
     path: String,
     max_read_bytes: u64,
     max_file_size: u64,
 ) -> PyResult<Vec<(u64, String)>> {
-    let limit = std::cmp::min(max_read_bytes, max_file_size);
-    let data = crate::triage::io::IOUtils::read_file_with_limit(&path, limit)
-        .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("{:?}", e)))?;
-    Ok(crate::analysis::pe_iat::pe_iat_map(&data))
+    read_path_detached(py, &path, max_read_bytes, max_file_size, |data| {
+        crate::analysis::pe_iat::pe_iat_map(data)
+    })
 }
 
 /// Parse a PE's TLS directory and walk its callback array.
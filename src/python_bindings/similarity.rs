@@ -20,6 +20,10 @@ pub fn register_similarity_bindings(_py: Python<'_>, m: &Bound<'_, PyModule>) ->
     )?)?;
     similarity_mod.add_function(wrap_pyfunction!(ctph_pairwise_matrix_py, &similarity_mod)?)?;
     similarity_mod.add_function(wrap_pyfunction!(ctph_top_k_py, &similarity_mod)?)?;
+    similarity_mod.add_function(wrap_pyfunction!(
+        ctph_cluster_single_linkage_py,
+        &similarity_mod
+    )?)?;
 
     // Add similarity submodule to main module
     m.add_submodule(&similarity_mod)?;
@@ -110,6 +114,20 @@ fn ctph_pairwise_matrix_py(digests: Vec<String>, max_pairs: usize) -> Vec<(usize
     out
 }
 
+/// Single-linkage clustering of CTPH digests; returns lists of input indices.
+#[pyfunction]
+#[pyo3(name = "ctph_cluster_single_linkage")]
+#[pyo3(signature = (digests, threshold=0.85, max_pairs=250_000))]
+fn ctph_cluster_single_linkage_py(
+    py: Python<'_>,
+    digests: Vec<String>,
+    threshold: f64,
+    max_pairs: usize,
+) -> Vec<Vec<usize>> {
+    // The digests are owned, so the O(n^2) comparison runs without the GIL.
+    py.detach(|| crate::similarity::ctph_cluster_single_linkage(&digests, threshold, max_pairs))
+}
+
 /// Find top-k most similar CTPH hashes from candidates.
 #[pyfunction]
 #[pyo3(name = "ctph_top_k")]
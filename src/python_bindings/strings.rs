@@ -3,6 +3,7 @@
 //! This module contains all Python bindings related to string extraction,
 //! normalization, similarity, and language detection.
 
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
 
 /// Python-visible match object for string searches.
@@ -33,6 +34,8 @@ pub fn register_strings_bindings(py: Python<'_>, m: &Bound<'_, PyModule>) -> PyR
     strings_mod.add_function(wrap_pyfunction!(defang_py, &strings_mod)?)?;
     strings_mod.add_function(wrap_pyfunction!(search_text_py, &strings_mod)?)?;
     strings_mod.add_function(wrap_pyfunction!(search_bytes_py, &strings_mod)?)?;
+    strings_mod.add_function(wrap_pyfunction!(count_ipv4_py, &strings_mod)?)?;
+    strings_mod.add_function(wrap_pyfunction!(count_ipv4_bytes_py, &strings_mod)?)?;
     strings_mod.add_function(wrap_pyfunction!(similarity_score_py, &strings_mod)?)?;
     strings_mod.add_function(wrap_pyfunction!(similarity_best_match_py, &strings_mod)?)?;
     strings_mod.add_function(wrap_pyfunction!(similarity_top_k_py, &strings_mod)?)?;
@@ -129,6 +132,29 @@ fn search_text_py(
         .collect()
 }
 
+/// Count valid IPv4 addresses in text, without a match budget.
+#[pyfunction]
+#[pyo3(name = "count_ipv4")]
+fn count_ipv4_py(py: Python<'_>, text: &str) -> usize {
+    py.detach(|| crate::strings::search::count_ipv4(text))
+}
+
+/// Count valid IPv4 addresses in a byte buffer without decoding it.
+///
+/// Accepts any byte buffer and reads contiguous ones (e.g. an `mmap` of the
+/// file) in place.
+#[pyfunction]
+#[pyo3(name = "count_ipv4_bytes")]
+fn count_ipv4_bytes_py(py: Python<'_>, data: PyBuffer<u8>) -> PyResult<usize> {
+    let Some(cells) = data.as_slice(py) else {
+        let owned = data.to_vec(py)?;
+        return Ok(crate::strings::search::count_ipv4_bytes(&owned));
+    };
+    // SAFETY: see `shannon_entropy_py`; the GIL is held while the slice lives.
+    let bytes = unsafe { std::slice::from_raw_parts(cells.as_ptr().cast::<u8>(), cells.len()) };
+    Ok(crate::strings::search::count_ipv4_bytes(bytes))
+}
+
 /// Search for patterns in binary data.
 #[pyfunction]
 #[pyo3(name = "search_bytes")]
@@ -304,11 +330,23 @@ fn demangle_list_py(names: Vec<String>, max: usize) -> Vec<(String, String, Stri
 // implementations.
 // ----------------------------------------------------------------------------
 
-/// Shannon entropy of a byte slice in bits/byte.
+/// Shannon entropy of a byte buffer in bits/byte.
+///
+/// Accepts any byte buffer (`bytes`, `bytearray`, `memoryview`, `mmap`)
+/// and reads contiguous ones in place, so a mapped file window is never
+/// copied.
 #[pyfunction]
 #[pyo3(name = "shannon_entropy")]
-fn shannon_entropy_py(data: &[u8]) -> f64 {
-    crate::strings::metrics::shannon_entropy(data)
+fn shannon_entropy_py(py: Python<'_>, data: PyBuffer<u8>) -> PyResult<f64> {
+    let Some(cells) = data.as_slice(py) else {
+        let owned = data.to_vec(py)?;
+        return Ok(crate::strings::metrics::shannon_entropy(&owned));
+    };
+    // SAFETY: `ReadOnlyCell<u8>` is `repr(transparent)` over `u8`, and the
+    // GIL is held for the whole call, so no Python code can mutate the
+    // exporter while the slice is alive.
+    let bytes = unsafe { std::slice::from_raw_parts(cells.as_ptr().cast::<u8>(), cells.len()) };
+    Ok(crate::strings::metrics::shannon_entropy(bytes))
 }
 
 /// Fraction of bytes that are printable ASCII or common whitespace.
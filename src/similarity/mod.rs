@@ -306,6 +306,66 @@ pub fn ctph_similarity(a: &str, b: &str) -> f64 {
     }
 }
 
+/// Single-linkage clustering of CTPH digests.
+///
+/// Visits pairs `(i, j)` with `i < j` in row-major order, at most `max_pairs`
+/// of them, and links those whose similarity is at least `threshold`.
+/// Connected components are returned as ascending index lists, ordered by
+/// their smallest member.
+pub fn ctph_cluster_single_linkage<S: AsRef<str>>(
+    digests: &[S],
+    threshold: f64,
+    max_pairs: usize,
+) -> Vec<Vec<usize>> {
+    let n = digests.len();
+    let mut parent: Vec<usize> = (0..n).collect();
+    let mut rank = vec![0u8; n];
+
+    fn find(parent: &mut [usize], mut x: usize) -> usize {
+        while parent[x] != x {
+            parent[x] = parent[parent[x]];
+            x = parent[x];
+        }
+        x
+    }
+
+    let mut budget = max_pairs;
+    'pairs: for i in 0..n {
+        for j in (i + 1)..n {
+            if budget == 0 {
+                break 'pairs;
+            }
+            budget -= 1;
+            // Pairs already in one component cannot change the result, so
+            // skip scoring them; they still count against the budget.
+            let (ri, rj) = (find(&mut parent, i), find(&mut parent, j));
+            if ri == rj || ctph_similarity(digests[i].as_ref(), digests[j].as_ref()) < threshold {
+                continue;
+            }
+            match rank[ri].cmp(&rank[rj]) {
+                std::cmp::Ordering::Less => parent[ri] = rj,
+                std::cmp::Ordering::Greater => parent[rj] = ri,
+                std::cmp::Ordering::Equal => {
+                    parent[rj] = ri;
+                    rank[ri] += 1;
+                }
+            }
+        }
+    }
+
+    let mut slot = vec![usize::MAX; n];
+    let mut clusters: Vec<Vec<usize>> = Vec::new();
+    for i in 0..n {
+        let r = find(&mut parent, i);
+        if slot[r] == usize::MAX {
+            slot[r] = clusters.len();
+            clusters.push(Vec::new());
+        }
+        clusters[slot[r]].push(i);
+    }
+    clusters
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -332,4 +392,59 @@ mod tests {
         assert!((s1 - s2).abs() < 1e-6);
         assert!(s1 >= 0.0 && s1 <= 1.0);
     }
+
+    #[test]
+    fn test_single_linkage_groups_similar_digests() {
+        let digests = [
+            "8:4:aa:bb:cc",
+            "8:4:11:22:33",
+            "8:4:aa:bb:cd",
+            "8:4:aa:bb:ce",
+        ];
+        assert_eq!(
+            ctph_cluster_single_linkage(&digests, 0.5, 100),
+            vec![vec![0, 2, 3], vec![1]]
+        );
+        // Chains link transitively even when the ends are dissimilar.
+        let chain = ["8:4:a:b:c", "8:4:b:c:d", "8:4:c:d:e"];
+        assert_eq!(
+            ctph_cluster_single_linkage(&chain, 0.5, 100),
+            vec![vec![0, 1, 2]]
+        );
+    }
+
+    #[test]
+    fn test_single_linkage_respects_pair_budget() {
+        let digests = ["8:4:aa:bb:cc", "8:4:11:22:33", "8:4:aa:bb:cc"];
+        // Only (0, 1) is examined, so nothing links.
+        assert_eq!(
+            ctph_cluster_single_linkage(&digests, 0.5, 1),
+            vec![vec![0], vec![1], vec![2]]
+        );
+        assert_eq!(
+            ctph_cluster_single_linkage(&digests, 0.5, 2),
+            vec![vec![0, 2], vec![1]]
+        );
+        assert!(ctph_cluster_single_linkage::<&str>(&[], 0.5, 10).is_empty());
+    }
+
+    #[test]
+    fn test_single_linkage_budget_counts_skipped_pairs() {
+        // (0, 1) and (0, 3) link, so (1, 3) is skipped without scoring.
+        // Stopping after (0, 2) leaves 3 on its own.
+        let digests = [
+            "8:4:aa:bb:cc",
+            "8:4:aa:bb:cc",
+            "8:4:11:22:33",
+            "8:4:aa:bb:cc",
+        ];
+        assert_eq!(
+            ctph_cluster_single_linkage(&digests, 0.5, 5),
+            vec![vec![0, 1, 3], vec![2]]
+        );
+        assert_eq!(
+            ctph_cluster_single_linkage(&digests, 0.5, 2),
+            vec![vec![0, 1], vec![2], vec![3]]
+        );
+    }
 }
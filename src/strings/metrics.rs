@@ -23,23 +23,7 @@ use std::collections::BTreeMap;
 /// Shannon entropy in bits/byte for a slice. 0.0 for empty input,
 /// up to 8.0 for a uniformly random byte sequence.
 pub fn shannon_entropy(data: &[u8]) -> f64 {
-    if data.is_empty() {
-        return 0.0;
-    }
-    let mut counts = [0u32; 256];
-    for &b in data {
-        counts[b as usize] += 1;
-    }
-    let n = data.len() as f64;
-    let mut h = 0.0;
-    for &c in counts.iter() {
-        if c == 0 {
-            continue;
-        }
-        let p = c as f64 / n;
-        h -= p * p.log2();
-    }
-    h
+    crate::entropy::shannon_entropy(data)
 }
 
 /// Fraction of bytes in printable ASCII range (`0x20..=0x7e`) plus
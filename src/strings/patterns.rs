@@ -28,6 +28,12 @@ pub static RE_HOSTNAME: Lazy<Regex> = Lazy::new(|| {
 // IPv4 candidates (validate with std::net::Ipv4Addr after match)
 pub static RE_IPV4_CANDIDATE: Lazy<Regex> =
     Lazy::new(|| Regex::new(r#"\b(?:\d{1,3}\.){3}\d{1,3}\b"#).expect("valid ipv4 candidate regex"));
+/// Byte-oriented IPv4 candidates for raw buffers; ASCII word boundaries, so
+/// non-UTF-8 bytes act as separators.
+pub static RE_IPV4_CANDIDATE_BYTES: Lazy<regex::bytes::Regex> = Lazy::new(|| {
+    regex::bytes::Regex::new(r#"(?-u)\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"#)
+        .expect("valid ipv4 candidate bytes regex")
+});
 
 // IPv6 candidates: supports compressed forms; prefer validation post-match
 pub static RE_IPV6_CANDIDATE: Lazy<Regex> = Lazy::new(|| {
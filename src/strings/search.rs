@@ -237,6 +237,30 @@ pub fn scan_bytes(data: &[u8], cfg: &StringsConfig, budget: &SearchBudget) -> Ve
     out
 }
 
+/// Count valid IPv4 addresses in `text`, with no match budget.
+///
+/// Uses the same candidate pattern and `Ipv4Addr` validation as
+/// [`scan_text`], without materializing the matches.
+pub fn count_ipv4(text: &str) -> usize {
+    patterns::RE_IPV4_CANDIDATE
+        .find_iter(text)
+        .filter(|m| m.as_str().parse::<std::net::Ipv4Addr>().is_ok())
+        .count()
+}
+
+/// [`count_ipv4`] over raw bytes, e.g. a mapped file, without decoding it.
+pub fn count_ipv4_bytes(data: &[u8]) -> usize {
+    patterns::RE_IPV4_CANDIDATE_BYTES
+        .find_iter(data)
+        .filter(|m| {
+            std::str::from_utf8(m.as_bytes())
+                .ok()
+                .and_then(|s| s.parse::<std::net::Ipv4Addr>().ok())
+                .is_some()
+        })
+        .count()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -258,4 +282,14 @@ mod tests {
             .any(|m| m.kind == MatchKind::PathWindows || m.kind == MatchKind::PathUNC);
         assert!(has_url && has_ipv4 && has_ipv6 && has_win);
     }
+
+    #[test]
+    fn count_ipv4_validates_octets() {
+        let text = "10.0.0.1, 192.168.1.254 and 8.8.8.8; not 999.1.2.3 or 1.2.3";
+        assert_eq!(count_ipv4(text), 3);
+        assert_eq!(count_ipv4(""), 0);
+        let mut bytes = text.as_bytes().to_vec();
+        bytes.extend_from_slice(b"\xff\x0010.1.2.3\xfe");
+        assert_eq!(count_ipv4_bytes(&bytes), 4);
+    }
 }
@@ -161,14 +161,44 @@ fn extract_strings(
         adj.min_length = adj.min_length.max(8);
     }
 
-    let s = crate::strings::extract_summary(heur_buf, &adj);
+    let mut s = crate::strings::extract_summary(heur_buf, &adj);
     if s.ascii_count == 0 && s.utf16le_count == 0 && s.utf16be_count == 0 {
         None
     } else {
+        augment_ipv4_count(&mut s, heur_buf, adj.max_scan_bytes);
         Some(s)
     }
 }
 
+/// Fills in the IPv4 IOC count when classification reported none.
+///
+/// Classification skips addresses that are unlikely network indicators and
+/// may be disabled altogether; this counts every valid dotted quad in the
+/// sampled strings, or in the first `max_scan_bytes` of `buf` when there are
+/// no samples, matching the window the string scanner itself reads.
+fn augment_ipv4_count(summary: &mut StringsSummary, buf: &[u8], max_scan_bytes: usize) {
+    use crate::strings::search::{count_ipv4, count_ipv4_bytes};
+
+    if summary
+        .ioc_counts
+        .as_ref()
+        .and_then(|c| c.get("ipv4"))
+        .is_some_and(|&n| n > 0)
+    {
+        return;
+    }
+    let n = match summary.strings.as_deref() {
+        Some(strings) if !strings.is_empty() => strings.iter().map(|s| count_ipv4(&s.text)).sum(),
+        _ => count_ipv4_bytes(&buf[..buf.len().min(max_scan_bytes)]),
+    };
+    if n > 0 {
+        summary
+            .ioc_counts
+            .get_or_insert_with(Default::default)
+            .insert("ipv4".to_string(), n as u32);
+    }
+}
+
 /// Discovers containers and packers within the binary.
 fn discover_containers_and_packers(
     heur_buf: &[u8],
@@ -856,6 +886,39 @@ mod tests_inner {
         assert!(!b.hit_byte_limit);
         assert_eq!(b.limit_bytes, Some(limits.max_read_bytes));
     }
+
+    #[test]
+    fn augment_ipv4_count_fills_missing_counts_only() {
+        use crate::core::triage::DetectedString;
+        let text = |t: &str| DetectedString::new(t.into(), "ascii".into(), None, None, None, None);
+        let mut summary = StringsSummary::new(
+            2,
+            0,
+            0,
+            Some(vec![
+                text("beacon 10.0.0.1"),
+                text("dns 8.8.8.8, 999.1.1.1"),
+            ]),
+            None,
+            None,
+        );
+        augment_ipv4_count(&mut summary, b"", 1024);
+        assert_eq!(summary.ioc_counts.as_ref().unwrap()["ipv4"], 2);
+
+        // Classification results are kept as reported.
+        summary.ioc_counts = Some([("ipv4".to_string(), 1)].into());
+        augment_ipv4_count(&mut summary, b"", 1024);
+        assert_eq!(summary.ioc_counts.as_ref().unwrap()["ipv4"], 1);
+
+        // Without sampled strings the scanned buffer is counted.
+        let mut bare = StringsSummary::new(1, 0, 0, None, None, None);
+        augment_ipv4_count(&mut bare, b"no addresses here", 1024);
+        assert!(bare.ioc_counts.is_none());
+        augment_ipv4_count(&mut bare, b"\x00192.168.1.1\x00", 4);
+        assert!(bare.ioc_counts.is_none());
+        augment_ipv4_count(&mut bare, b"\x00192.168.1.1\x00", 1024);
+        assert_eq!(bare.ioc_counts.as_ref().unwrap()["ipv4"], 1);
+    }
 }
 
 #[cfg(feature = "python-ext")]
@@ -876,6 +939,7 @@ mod tests_inner {
     _config=None
 ))]
 pub fn analyze_path_py(
+    py: Python<'_>,
     path: String,
     _max_read_bytes: u64,
     _max_file_size: u64,
@@ -945,21 +1009,26 @@ pub fn analyze_path_py(
         .as_ref()
         .map(|c| c.similarity.clone())
         .unwrap_or_else(SimilarityConfig::default);
-    Ok(build_artifact_from_buffers(
-        path,
-        reader.size() as usize,
-        &sniff,
-        &header,
-        &heur,
-        _max_recursion_depth,
-        bytes_read,
-        limits.max_read_bytes,
-        _max_recursion_depth,
-        hit_byte_limit,
-        &strings_cfg,
-        &packer_cfg,
-        &sim_cfg,
-    ))
+    // Artifact construction (parsing, strings, entropy, similarity) works on
+    // owned buffers only; release the GIL so other threads keep running.
+    let size_bytes = reader.size() as usize;
+    Ok(py.detach(|| {
+        build_artifact_from_buffers(
+            path,
+            size_bytes,
+            &sniff,
+            &header,
+            &heur,
+            _max_recursion_depth,
+            bytes_read,
+            limits.max_read_bytes,
+            _max_recursion_depth,
+            hit_byte_limit,
+            &strings_cfg,
+            &packer_cfg,
+            &sim_cfg,
+        )
+    }))
 }
 
 #[cfg(feature = "python-ext")]